@@ -32,6 +32,7 @@ setup(
             "chromadb>=0.4.22",
             "psycopg[binary]>=3.1",
         ],
+        "speedups": ["orjson>=3.8"],
     },
     entry_points={
         "console_scripts": [
@@ -49,6 +49,7 @@ class AgentKernel:
         self.scheduler = TaskScheduler(config.scheduler)
         self.memory = MemoryOrchestrator(config.memory)
         self.telemetry = TelemetryCollector()
+        self.telemetry.start()
         self.safety = SafetyGuard()
         self.planner = Planner()
 
@@ -61,14 +62,16 @@ class AgentKernel:
             if allow_network
             else TerminalNetworkPolicy.offline()
         )
-        self.tools.register(
-            TerminalTool(
-                sandbox_root=sandbox,
-                network_policy=terminal_policy,
+        self.tools.register_many(
+            (
+                TerminalTool(
+                    sandbox_root=sandbox,
+                    network_policy=terminal_policy,
+                ),
+                FileIOTool(sandbox_root=sandbox),
+                SystemMonitorTool(self.telemetry),
             )
         )
-        self.tools.register(FileIOTool(sandbox_root=sandbox))
-        self.tools.register(SystemMonitorTool(self.telemetry))
 
         browser_cfg = config.tools.browser
         if browser_cfg.enabled:
@@ -256,6 +259,20 @@ class AgentKernel:
 
         self._is_shutdown = True
         LOGGER.info("Shutting down agent kernel")
+        self.telemetry.close()
+        security_managers = {}
+        for tool in self.tools.list_tools().values():
+            close = getattr(tool, "close", None)
+            if close is not None:
+                close()
+            # Integration tools share one SecurityManager; close each once
+            manager = getattr(tool, "security_manager", None)
+            if manager is not None:
+                security_managers[id(manager)] = manager
+        for manager in security_managers.values():
+            close = getattr(manager, "close", None)
+            if close is not None:
+                close()
         self.learning_pipeline.flush()
         metrics = self.feedback.metrics
         LOGGER.info(
@@ -1,8 +1,12 @@
 """Audit logging for all actions taken by the autonomous system."""
 from __future__ import annotations
 
+import atexit
+import itertools
+import io
 import json
 import logging
+import threading
 import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
@@ -136,15 +140,51 @@ class InMemoryAuditLogStore(AuditLogStore):
 class FileBasedAuditLogStore(AuditLogStore):
     """File-based implementation of audit log store."""
     
-    def __init__(self, storage_path: Path) -> None:
+    def __init__(
+        self,
+        storage_path: Path,
+        buffer_size: int = io.DEFAULT_BUFFER_SIZE,
+        flush_interval: int = 64,
+    ) -> None:
         self._storage_path = storage_path
         self._storage_path.mkdir(parents=True, exist_ok=True)
         self._log_file = self._storage_path / "audit.log"
         self._events: List[AuditEvent] = []
         self._load_events()
+        # Keep one buffered handle open and flush every ``flush_interval``
+        # events instead of reopening the log file for each event.
+        self._flush_interval = max(1, flush_interval)
+        self._pending_writes = 0
+        self._write_lock = threading.Lock()
+        self._fh = self._log_file.open("ab", buffering=buffer_size)
+        atexit.register(self.close)
+    
+    def flush(self) -> None:
+        """Flush buffered events to disk."""
+        with self._write_lock:
+            self._flush_locked()
+    
+    def _flush_locked(self) -> None:
+        if self._fh.closed:
+            return
+        try:
+            self._fh.flush()
+        except Exception as e:
+            LOGGER.error("Failed to flush audit log: %s", e)
+        self._pending_writes = 0
+    
+    def close(self) -> None:
+        """Flush pending events and close the log file."""
+        with self._write_lock:
+            if self._fh.closed:
+                return
+            self._flush_locked()
+            self._fh.close()
+        atexit.unregister(self.close)
     
     def _load_events(self) -> None:
-        """Load audit events from file."""
+        """Load audit events from file, replacing the in-memory copy."""
+        self._events = []
         if self._log_file.exists():
             try:
                 with self._log_file.open("r", encoding="utf-8") as f:
@@ -166,28 +206,32 @@ class FileBasedAuditLogStore(AuditLogStore):
                                 )
                                 self._events.append(event)
                             except (json.JSONDecodeError, KeyError, ValueError) as e:
-                                LOGGER.warning(f"Failed to parse audit log entry: {e}")
+                                LOGGER.warning("Failed to parse audit log entry: %s", e)
             except Exception as e:
-                LOGGER.error(f"Failed to load audit log from file: {e}")
+                LOGGER.error("Failed to load audit log from file: %s", e)
     
     def _append_event(self, event: AuditEvent) -> None:
         """Append a single event to the log file."""
         try:
-            with self._log_file.open("a", encoding="utf-8") as f:
-                event_data = {
-                    'id': event.id,
-                    'timestamp': event.timestamp,
-                    'event_type': event.event_type.value,
-                    'actor': event.actor,
-                    'action': event.action,
-                    'resource': event.resource,
-                    'metadata': event.metadata,
-                    'success': event.success,
-                    'details': event.details
-                }
-                f.write(json.dumps(event_data) + "\n")
+            event_data = {
+                'id': event.id,
+                'timestamp': event.timestamp,
+                'event_type': event.event_type.value,
+                'actor': event.actor,
+                'action': event.action,
+                'resource': event.resource,
+                'metadata': event.metadata,
+                'success': event.success,
+                'details': event.details
+            }
+            line = (json.dumps(event_data) + "\n").encode("utf-8")
+            with self._write_lock:
+                self._fh.write(line)
+                self._pending_writes += 1
+                if self._pending_writes >= self._flush_interval:
+                    self._flush_locked()
         except Exception as e:
-            LOGGER.error(f"Failed to write audit log entry: {e}")
+            LOGGER.error("Failed to write audit log entry: %s", e)
     
     def log_event(self, event: AuditEvent) -> bool:
         """Log an audit event to file."""
@@ -205,7 +249,7 @@ class FileBasedAuditLogStore(AuditLogStore):
             
             return True
         except Exception as e:
-            LOGGER.error(f"Failed to log audit event: {e}")
+            LOGGER.error("Failed to log audit event: %s", e)
             return False
     
     def get_events(
@@ -218,6 +262,7 @@ class FileBasedAuditLogStore(AuditLogStore):
     ) -> List[AuditEvent]:
         """Retrieve audit events with optional filtering."""
         # Reload from file to ensure latest data
+        self.flush()
         self._load_events()
         
         events = self._events[:]
@@ -245,6 +290,7 @@ class FileBasedAuditLogStore(AuditLogStore):
     def search_events(self, query: str) -> List[AuditEvent]:
         """Search audit events by query string."""
         # Reload from file to ensure latest data
+        self.flush()
         self._load_events()
         
         query_lower = query.lower()
@@ -270,9 +316,22 @@ class FileBasedAuditLogStore(AuditLogStore):
 class AuditLogger:
     """Main audit logging system."""
     
-    def __init__(self, audit_store: AuditLogStore) -> None:
+    # Open sampling windows beyond this many keys are summarised oldest first
+    MAX_SAMPLED_KEYS = 1024
+    
+    def __init__(self, audit_store: AuditLogStore, sampling_window: Optional[float] = None) -> None:
         self._audit_store = audit_store
         self._logger = logging.getLogger(__name__ + ".audit")
+        # When a sampling window is set, repeated successful events with the same
+        # key are counted instead of stored and summarised once per window.
+        # Failures and security violations are always stored individually.
+        self._sampling_window = sampling_window
+        self._sampled: Dict[tuple, List[Any]] = {}  # key -> [window_start, count, last_event], oldest first
+        self._sampling_lock = threading.Lock()
+        self._next_sweep = 0.0
+        self._sequence = itertools.count()
+        if sampling_window is not None:
+            atexit.register(self.flush_sampled)
     
     def log_event(
         self,
@@ -285,12 +344,13 @@ class AuditLogger:
         details: Optional[str] = None
     ) -> str:
         """Log an audit event."""
-        import time
-        event_id = f"audit_{int(time.time() * 1000)}_{hash(action) % 1000}"
+        now = time.time()
+        # The sequence keeps ids unique for same-action events in one millisecond
+        event_id = f"audit_{int(now * 1000)}_{hash(action) % 1000}_{next(self._sequence)}"
         
         event = AuditEvent(
             id=event_id,
-            timestamp=time.time(),
+            timestamp=now,
             event_type=event_type,
             actor=actor,
             action=action,
@@ -300,12 +360,76 @@ class AuditLogger:
             details=details
         )
         
+        if self._sampling_window is not None and success:
+            key = (actor, event_type, resource, action, success)
+            with self._sampling_lock:
+                window = self._sampled.get(key)
+                if window is not None and now - window[0] < self._sampling_window:
+                    window[1] += 1
+                    window[2] = event
+                    self._sweep_expired(now)
+                    # The event is counted in the window summary under its own id
+                    return event_id
+                if window is not None:
+                    del self._sampled[key]
+                    self._store_summary(window)
+                self._sampled[key] = [now, 0, event]
+                self._sweep_expired(now)
+        
+        return self._store_event(event)
+    
+    def _sweep_expired(self, now: float) -> None:
+        """Summarise windows that expired or overflow the key cap.
+        
+        Runs at most once per sampling window, so suppressed counts reach the
+        store shortly after their window closes instead of only at exit.
+        """
+        if now >= self._next_sweep:
+            self._next_sweep = now + self._sampling_window
+            # Windows are kept in start order, so expired ones lead
+            while self._sampled:
+                key, window = next(iter(self._sampled.items()))
+                if now - window[0] < self._sampling_window:
+                    break
+                del self._sampled[key]
+                self._store_summary(window)
+        while len(self._sampled) > self.MAX_SAMPLED_KEYS:
+            key = next(iter(self._sampled))
+            self._store_summary(self._sampled.pop(key))
+    
+    def flush_sampled(self) -> None:
+        """Store summaries for all open sampling windows."""
+        with self._sampling_lock:
+            for window in self._sampled.values():
+                self._store_summary(window)
+            self._sampled.clear()
+    
+    def _store_summary(self, window: List[Any]) -> None:
+        """Store one record standing in for the events suppressed in a window."""
+        window_start, count, last_event = window
+        if not count:
+            return
+        summary = AuditEvent(
+            id=f"{last_event.id}_x{count}",
+            timestamp=last_event.timestamp,
+            event_type=last_event.event_type,
+            actor=last_event.actor,
+            action=last_event.action,
+            resource=last_event.resource,
+            metadata={**last_event.metadata, "occurrences": count, "window_start": window_start},
+            success=last_event.success,
+            details=last_event.details
+        )
+        self._store_event(summary)
+    
+    def _store_event(self, event: AuditEvent) -> str:
+        event_id, event_type, actor = event.id, event.event_type, event.actor
         success = self._audit_store.log_event(event)
         if success:
-            self._logger.info(f"Audit event logged: {event_id} - {event_type.value} by {actor}")
+            self._logger.info("Audit event logged: %s - %s by %s", event_id, event_type.value, actor)
             return event_id
         else:
-            self._logger.error(f"Failed to log audit event: {event_type.value} by {actor}")
+            self._logger.error("Failed to log audit event: %s by %s", event_type.value, actor)
             return ""
     
     def log_tool_execution(
@@ -75,6 +75,15 @@ class SecurityConfig(BaseModel):
         ge=1,
         description="Number of days to retain audit logs"
     )
+    audit_sampling_enabled: bool = Field(
+        False,
+        description="Whether repeated successful audit events are coalesced into periodic summaries"
+    )
+    audit_sampling_window_seconds: float = Field(
+        60.0,
+        gt=0,
+        description="Window over which repeated audit events are coalesced"
+    )
     
     # Risk assessment settings
     risk_assessment_enabled: bool = Field(
@@ -112,6 +121,8 @@ def load_security_config() -> SecurityConfig:
         audit_logging_enabled=os.getenv("SECURITY_AUDIT_LOGGING", "true").lower() == "true",
         audit_storage_path=Path(os.getenv("SECURITY_AUDIT_STORAGE", "storage/audit")),
         audit_retention_days=int(os.getenv("SECURITY_AUDIT_RETENTION", "90")),
+        audit_sampling_enabled=os.getenv("SECURITY_AUDIT_SAMPLING", "false").lower() == "true",
+        audit_sampling_window_seconds=float(os.getenv("SECURITY_AUDIT_SAMPLING_WINDOW", "60")),
         risk_assessment_enabled=os.getenv("SECURITY_RISK_ASSESSMENT", "true").lower() == "true",
         max_allowed_risk_level=os.getenv("SECURITY_MAX_RISK_LEVEL", "medium"),
         credential_encryption_key=credential_key
@@ -62,7 +62,7 @@ class PatternGuardrailEngine(GuardrailEngine):
             if isinstance(rule.pattern, Pattern):
                 if rule.pattern.search(content):
                     violations.append(rule)
-                    LOGGER.warning(f"Guardrail triggered: {rule.id} - {rule.description}")
+                    LOGGER.warning("Guardrail triggered: %s - %s", rule.id, rule.description)
         
         return violations
 
@@ -2,27 +2,42 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from .permissions import PermissionManager, SystemFunction
 from .consent import ConsentManager, ConsentType, InMemoryConsentStore
-from .policies import SecurityPolicyManager
+from .policies import PolicyType, SecurityPolicyManager
 from .guardrails import SafetyGuardrails
 from .credentials import CredentialManager, InMemoryCredentialStore
 from .audit import AuditLogger, AuditEventType, FileBasedAuditLogStore
-from .risk import RiskAssessmentManager, RuleBasedRiskEngine
+from .risk import RiskAssessmentManager, RiskLevel, RuleBasedRiskEngine
 from .config import SecurityConfig, load_security_config
 
 
 LOGGER = logging.getLogger(__name__)
 
+_RISK_LEVELS_BY_NAME = {level.label: level for level in RiskLevel}
+
+
+@dataclass
+class AuthorizationResult:
+    """Combined outcome of the pre-flight security checks for a tool call."""
+    allowed: bool
+    denied_by: Optional[str] = None  # Name of the first check that denied
+    violations: List[str] = field(default_factory=list)
+    risk_summary: str = ""
+    recommendations: List[str] = field(default_factory=list)
+
 
 class SecurityManager:
     """Main security manager that integrates all security components."""
     
     def __init__(self, config: SecurityConfig):
         self.config = config
+        self._audit_on = config.audit_logging_enabled
         
         # Initialize permission manager
         self.permission_manager = PermissionManager()
@@ -44,37 +59,74 @@ class SecurityManager:
         self.credential_manager = CredentialManager(credential_store)
         
         # Initialize audit logger
-        audit_store = FileBasedAuditLogStore(config.audit_storage_path)
-        self.audit_logger = AuditLogger(audit_store)
+        audit_store = FileBasedAuditLogStore(config.audit_storage_path, buffer_size=128 * 1024)
+        self._audit_store = audit_store
+        sampling_window = config.audit_sampling_window_seconds if config.audit_sampling_enabled else None
+        self.audit_logger = AuditLogger(audit_store, sampling_window=sampling_window)
         
         # Initialize risk assessment
         risk_engine = RuleBasedRiskEngine()
         self.risk_manager = RiskAssessmentManager(risk_engine)
         
-        LOGGER.info("Security manager initialized with all components")
+        # Worker pool for running independent pre-flight checks in authorize()
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="security-check")
+        
+        self._bind_disabled_checks()
+        
+        self._initialized = False
+        self._init_metadata = {
+            "permission_enabled": config.permission_enabled,
+            "consent_required": config.consent_required,
+            "guardrails_enabled": config.guardrails_enabled,
+            "audit_logging_enabled": config.audit_logging_enabled
+        }
+        
+        LOGGER.debug("Security manager initialized with all components")
+    
+    def _bind_disabled_checks(self) -> None:
+        """Replace checks for disabled features with constant-result stubs.
+        
+        The feature flags are read once here, so the enabled methods carry no
+        per-call flag branches. Changing ``config`` afterwards has no effect on
+        these checks; build a new SecurityManager instead.
+        """
+        config = self.config
+        if not config.permission_enabled:
+            self.check_permission = lambda function, actor="system": True
+        if not config.consent_required:
+            self.request_consent = lambda consent_type, description, actor="system": "auto_approved"
+        if not config.policy_enforcement_enabled:
+            self.evaluate_policy = lambda policy_type, context, actor="system": True
+            self.validate_path = lambda path: True
+            self.validate_command = lambda command: True
+        if not config.guardrails_enabled:
+            self.check_content_safety = lambda content, actor="system": (True, [])
+        if not config.risk_assessment_enabled:
+            self.assess_risk = lambda operation, context, actor="system": (
+                True, "Risk assessment disabled", []
+            )
+        if not config.audit_logging_enabled:
+            self.log_action = (
+                lambda event_type, actor, action, resource, metadata=None, success=True, details=None: ""
+            )
     
     def check_permission(self, function: SystemFunction, actor: str = "system") -> bool:
         """Check if the active profile has permission for a function."""
-        if not self.config.permission_enabled:
-            return True
-        
         has_perm = self.permission_manager.check_permission(function)
         
         # Log the permission check
-        self.audit_logger.log_permission_check(
-            actor=actor,
-            resource=function.value,
-            permission_level="read_write",  # This would be more specific in a real implementation
-            granted=has_perm
-        )
+        if self._audit_on:
+            self.audit_logger.log_permission_check(
+                actor=actor,
+                resource=function.value,
+                permission_level="read_write",  # This would be more specific in a real implementation
+                granted=has_perm
+            )
         
         return has_perm
     
     def request_consent(self, consent_type: ConsentType, description: str, actor: str = "system") -> str:
         """Request user consent for an operation."""
-        if not self.config.consent_required:
-            return "auto_approved"
-        
         request_id = self.consent_manager.request_consent(
             consent_type=consent_type,
             description=description,
@@ -82,14 +134,15 @@ class SecurityManager:
         )
         
         # Log the consent request
-        self.audit_logger.log_event(
-            event_type=AuditEventType.CONSENT_REQUEST,
-            actor=actor,
-            action=f"Requested consent: {consent_type.value}",
-            resource=request_id,
-            metadata={"consent_type": consent_type.value, "description": description},
-            success=True
-        )
+        if self._audit_on:
+            self.audit_logger.log_event(
+                event_type=AuditEventType.CONSENT_REQUEST,
+                actor=actor,
+                action=f"Requested consent: {consent_type.value}",
+                resource=request_id,
+                metadata={"consent_type": consent_type.value, "description": description},
+                success=True
+            )
         
         return request_id
     
@@ -102,44 +155,49 @@ class SecurityManager:
         decision = self.consent_manager.check_consent(request_id)
         return decision == ConsentDecision.GRANTED
     
-    def evaluate_policy(self, policy_type: str, context: Dict[str, Any], actor: str = "system") -> bool:
-        """Evaluate if an action should be allowed based on policies."""
-        if not self.config.policy_enforcement_enabled:
-            return True
+    def evaluate_policy(self, policy_type: PolicyType | str, context: Dict[str, Any], actor: str = "system") -> bool:
+        """Evaluate if an action should be allowed based on policies.
         
-        from .policies import PolicyType
+        Trusted callers should pass a ``PolicyType``; strings are accepted for
+        external callers and converted here.
+        """
         try:
-            policy_enum = PolicyType(policy_type)
-            is_allowed = self.policy_manager.evaluate_policy(policy_enum, context)
-            
-            # Log the policy evaluation
+            policy_enum = policy_type if isinstance(policy_type, PolicyType) else PolicyType(policy_type)
+        except ValueError:
+            LOGGER.warning("Invalid policy type: %s", policy_type)
+            return False
+        
+        is_allowed = self.policy_manager.evaluate_policy(policy_enum, context)
+        
+        # Log the policy evaluation
+        if self._audit_on:
             self.audit_logger.log_event(
                 event_type=AuditEventType.PERMISSION_CHECK,
                 actor=actor,
-                action=f"Policy evaluation for {policy_type}",
-                resource=policy_type,
+                action=f"Policy evaluation for {policy_enum.value}",
+                resource=policy_enum.value,
                 metadata={"context": context, "allowed": is_allowed},
                 success=is_allowed
             )
-            
-            return is_allowed
-        except ValueError:
-            LOGGER.warning(f"Invalid policy type: {policy_type}")
-            return False
+        
+        return is_allowed
     
     def check_content_safety(self, content: str, actor: str = "system") -> tuple[bool, List[str]]:
         """Check if content is safe to execute using guardrails."""
-        if not self.config.guardrails_enabled:
+        if not content:
             return True, []
         
         is_safe, violations = self.guardrails.is_content_safe(content)
         
-        if not is_safe:
+        if not is_safe and self._audit_on:
+            preview = content[:100]
+            if len(preview) < len(content):
+                preview += "..."
             # Log security violation
             self.audit_logger.log_security_violation(
                 actor=actor,
                 violation_type="content_filter",
-                attempted_action=content[:100] + "..." if len(content) > 100 else content,
+                attempted_action=preview,
                 details=f"Blocked due to violations: {', '.join(violations)}"
             )
         
@@ -147,50 +205,83 @@ class SecurityManager:
     
     def assess_risk(self, operation: str, context: Dict[str, Any], actor: str = "system") -> tuple[bool, str, List[str]]:
         """Assess the risk of an operation."""
-        if not self.config.risk_assessment_enabled:
-            return True, "Risk assessment disabled", []
-        
-        from .risk import RiskLevel
         risk_level, score = self.risk_manager.get_risk_score(operation, context)
         
         # Check if risk level is acceptable
-        max_level_map = {
-            "none": RiskLevel.NONE,
-            "low": RiskLevel.LOW,
-            "medium": RiskLevel.MEDIUM,
-            "high": RiskLevel.HIGH,
-            "critical": RiskLevel.CRITICAL
-        }
-        
-        max_allowed = max_level_map.get(self.config.max_allowed_risk_level, RiskLevel.MEDIUM)
-        is_allowed = risk_level.value <= max_allowed.value
+        max_allowed = _RISK_LEVELS_BY_NAME.get(self.config.max_allowed_risk_level, RiskLevel.MEDIUM)
+        is_allowed = risk_level <= max_allowed
         
         recommendations = self.risk_manager.get_recommendations(operation, context)
         
         # Log the risk assessment
-        self.audit_logger.log_event(
-            event_type=AuditEventType.PERMISSION_CHECK,
-            actor=actor,
-            action=f"Risk assessment for {operation}",
-            resource=operation,
-            metadata={
-                "risk_level": risk_level.value,
-                "risk_score": score,
-                "max_allowed": self.config.max_allowed_risk_level,
-                "allowed": is_allowed
-            },
-            success=is_allowed
-        )
+        if self._audit_on:
+            self.audit_logger.log_event(
+                event_type=AuditEventType.PERMISSION_CHECK,
+                actor=actor,
+                action=f"Risk assessment for {operation}",
+                resource=operation,
+                metadata={
+                    "risk_level": risk_level.label,
+                    "risk_score": score,
+                    "max_allowed": self.config.max_allowed_risk_level,
+                    "allowed": is_allowed
+                },
+                success=is_allowed
+            )
         
-        return is_allowed, f"Risk level: {risk_level.value} (score: {score:.2f})", recommendations
+        return is_allowed, f"Risk level: {risk_level.label} (score: {score:.2f})", recommendations
+    
+    def authorize(
+        self,
+        function: SystemFunction,
+        policy_type: PolicyType | str,
+        context: Dict[str, Any],
+        content: str = "",
+        operation: Optional[str] = None,
+        actor: str = "system",
+    ) -> AuthorizationResult:
+        """Run the permission, policy, risk and guardrail checks concurrently.
+        
+        Returns as soon as any check denies. The individual check methods remain
+        available for callers that only need one of them.
+        """
+        if operation is None:
+            operation = policy_type.value if isinstance(policy_type, PolicyType) else policy_type
+        
+        checks = {
+            self._executor.submit(self.check_permission, function, actor): "permission",
+            self._executor.submit(self.evaluate_policy, policy_type, context, actor): "policy",
+            self._executor.submit(self.assess_risk, operation, context, actor): "risk",
+            self._executor.submit(self.check_content_safety, content, actor): "guardrails",
+        }
+        
+        result = AuthorizationResult(allowed=True)
+        try:
+            for future in as_completed(checks):
+                check = checks[future]
+                outcome = future.result()
+                if check == "risk":
+                    allowed, result.risk_summary, result.recommendations = outcome
+                elif check == "guardrails":
+                    allowed, result.violations = outcome
+                else:
+                    allowed = outcome
+                
+                if not allowed:
+                    result.allowed = False
+                    result.denied_by = check
+                    break
+        finally:
+            # Drop checks that have not started yet once the outcome is known
+            for future in checks:
+                future.cancel()
+        
+        return result
     
     def log_action(self, event_type: AuditEventType, actor: str, action: str, resource: str, 
                    metadata: Optional[Dict[str, Any]] = None, success: bool = True, 
                    details: Optional[str] = None) -> str:
         """Log an action to the audit trail."""
-        if not self.config.audit_logging_enabled:
-            return ""
-        
         return self.audit_logger.log_event(
             event_type=event_type,
             actor=actor,
@@ -202,8 +293,14 @@ class SecurityManager:
         )
     
     def initialize_security_for_agent(self) -> None:
-        """Initialize security for an agent instance."""
-        LOGGER.info("Initializing security for agent")
+        """Initialize security for an agent instance.
+        
+        Only the first call has any effect; later calls return immediately.
+        """
+        if self._initialized:
+            return
+        self._initialized = True
+        LOGGER.debug("Initializing security for agent")
         
         # Set up default permission profile
         if self.config.default_permission_profile:
@@ -215,23 +312,28 @@ class SecurityManager:
             actor="agent",
             action="Security initialization",
             resource="security_manager",
-            metadata={
-                "permission_enabled": self.config.permission_enabled,
-                "consent_required": self.config.consent_required,
-                "guardrails_enabled": self.config.guardrails_enabled,
-                "audit_logging_enabled": self.config.audit_logging_enabled
-            },
+            metadata=self._init_metadata,
             success=True
         )
     
     def validate_path(self, path: str) -> bool:
         """Validate if a path is allowed based on security policies."""
-        # For now, we'll allow all paths since this is a test environment
-        # In a real implementation, this would check against security policies
-        return True
+        # Only the file I/O deny rules are applied here so paths outside the
+        # sandbox stay usable; the full policy is available via evaluate_policy
+        return not self.policy_manager.is_denied(PolicyType.FILE_IO, {"path": path})
     
     def validate_command(self, command: str) -> bool:
         """Validate if a command is allowed based on security policies."""
-        # For now, we'll allow all commands since this is a test environment
-        # In a real implementation, this would check against security policies
-        return True
\ No newline at end of file
+        # Policy rules match on the executable name, not the full command line
+        parts = command.split(maxsplit=1)
+        command_name = Path(parts[0]).name if parts else ""
+        return not self.policy_manager.is_denied(PolicyType.TERMINAL, {"command": command_name})
+    
+    def close(self) -> None:
+        """Stop the pre-flight worker pool and flush the audit trail.
+        
+        Safe to call more than once; ``authorize`` must not be used afterwards.
+        """
+        self._executor.shutdown(wait=True)
+        self.audit_logger.flush_sampled()
+        self._audit_store.close()
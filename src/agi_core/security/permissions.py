@@ -2,8 +2,9 @@
 from __future__ import annotations
 
 import logging
+import os
 from enum import Enum
-from typing import Dict, List, Optional, Set
+from typing import Dict, FrozenSet, Optional, Set, Tuple
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -20,6 +21,16 @@ class PermissionLevel(Enum):
     ADMIN = "admin"
 
 
+# Map permission levels to numeric values for comparison
+_LEVEL_VALUES = {
+    PermissionLevel.NONE: 0,
+    PermissionLevel.READ_ONLY: 1,
+    PermissionLevel.LIMITED_WRITE: 2,
+    PermissionLevel.FULL_ACCESS: 3,
+    PermissionLevel.ADMIN: 4
+}
+
+
 class SystemFunction(Enum):
     """System functions that require permission control."""
     FILE_SYSTEM = "file_system"
@@ -32,17 +43,32 @@ class SystemFunction(Enum):
     CREDENTIALS = "credentials"
 
 
-@dataclass
+@dataclass(slots=True)
 class Permission:
     """Represents a single permission for a system function."""
     function: SystemFunction
     level: PermissionLevel
-    allowed_paths: List[Path] = field(default_factory=list)
-    allowed_commands: List[str] = field(default_factory=list)
-    allowed_network_hosts: List[str] = field(default_factory=list)
+    allowed_paths: Tuple[Path, ...] = ()
+    allowed_commands: Tuple[str, ...] = ()
+    allowed_network_hosts: Tuple[str, ...] = ()
+    _command_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    _resolved_path_strs: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _resolved_path_prefixes: Tuple[str, ...] = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        # Accept any iterable from callers but store immutable tuples
+        self.allowed_paths = tuple(self.allowed_paths)
+        self.allowed_commands = tuple(self.allowed_commands)
+        self.allowed_network_hosts = tuple(self.allowed_network_hosts)
+        # Resolve once per permission rather than once per check.
+        self._command_set = frozenset(self.allowed_commands)
+        self._resolved_path_strs = tuple(str(path.resolve()) for path in self.allowed_paths)
+        self._resolved_path_prefixes = tuple(
+            path if path.endswith(os.sep) else path + os.sep for path in self._resolved_path_strs
+        )
 
-@dataclass
+
+@dataclass(slots=True)
 class PermissionProfile:
     """A collection of permissions for a user or role."""
     name: str
@@ -64,6 +90,8 @@ class PermissionManager:
     def __init__(self) -> None:
         self._profiles: Dict[str, PermissionProfile] = {}
         self._active_profile: Optional[PermissionProfile] = None
+        # Permission table of the active profile, kept to skip the attribute chain
+        self._active_perms: Dict[SystemFunction, Permission] = {}
         self._initialize_default_profiles()
     
     def _initialize_default_profiles(self) -> None:
@@ -75,7 +103,7 @@ class PermissionManager:
                 SystemFunction.FILE_SYSTEM: Permission(
                     function=SystemFunction.FILE_SYSTEM,
                     level=PermissionLevel.LIMITED_WRITE,
-                    allowed_paths=[Path("sandbox"), Path("tmp")]
+                    allowed_paths=(Path("sandbox"), Path("tmp"))
                 ),
                 SystemFunction.APPLICATIONS: Permission(
                     function=SystemFunction.APPLICATIONS,
@@ -84,17 +112,17 @@ class PermissionManager:
                 SystemFunction.NETWORK: Permission(
                     function=SystemFunction.NETWORK,
                     level=PermissionLevel.READ_ONLY,
-                    allowed_network_hosts=["127.0.0.1", "localhost"]
+                    allowed_network_hosts=("127.0.0.1", "localhost")
                 ),
                 SystemFunction.TERMINAL: Permission(
                     function=SystemFunction.TERMINAL,
                     level=PermissionLevel.LIMITED_WRITE,
-                    allowed_commands=["ls", "pwd", "echo", "cat", "grep", "find", "ps"]
+                    allowed_commands=("ls", "pwd", "echo", "cat", "grep", "find", "ps")
                 ),
                 SystemFunction.BROWSER: Permission(
                     function=SystemFunction.BROWSER,
                     level=PermissionLevel.READ_ONLY,
-                    allowed_network_hosts=["127.0.1", "localhost"]
+                    allowed_network_hosts=("127.0.1", "localhost")
                 ),
                 SystemFunction.SYSTEM_MONITOR: Permission(
                     function=SystemFunction.SYSTEM_MONITOR,
@@ -149,7 +177,7 @@ class PermissionManager:
                 SystemFunction.FILE_SYSTEM: Permission(
                     function=SystemFunction.FILE_SYSTEM,
                     level=PermissionLevel.READ_ONLY,
-                    allowed_paths=[Path("sandbox")]
+                    allowed_paths=(Path("sandbox"),)
                 ),
                 SystemFunction.NETWORK: Permission(
                     function=SystemFunction.NETWORK,
@@ -158,7 +186,7 @@ class PermissionManager:
                 SystemFunction.TERMINAL: Permission(
                     function=SystemFunction.TERMINAL,
                     level=PermissionLevel.READ_ONLY,
-                    allowed_commands=["ls", "pwd", "echo", "cat"]
+                    allowed_commands=("ls", "pwd", "echo", "cat")
                 ),
                 SystemFunction.BROWSER: Permission(
                     function=SystemFunction.BROWSER,
@@ -188,7 +216,8 @@ class PermissionManager:
         profile = self._profiles.get(profile_name)
         if profile:
             self._active_profile = profile
-            LOGGER.info(f"Set active permission profile to: {profile_name}")
+            self._active_perms = profile.permissions
+            LOGGER.info("Set active permission profile to: %s", profile_name)
             return True
         return False
     
@@ -202,67 +231,62 @@ class PermissionManager:
             LOGGER.warning("No active permission profile set")
             return False
             
-        current_level = self._active_profile.get_permission_level(function)
+        permission = self._active_perms.get(function)
+        current_level = permission.level if permission else PermissionLevel.NONE
         
-        # Map permission levels to numeric values for comparison
-        level_values = {
-            PermissionLevel.NONE: 0,
-            PermissionLevel.READ_ONLY: 1,
-            PermissionLevel.LIMITED_WRITE: 2,
-            PermissionLevel.FULL_ACCESS: 3,
-            PermissionLevel.ADMIN: 4
-        }
-        
-        return level_values[current_level] >= level_values[level]
+        return _LEVEL_VALUES[current_level] >= _LEVEL_VALUES[level]
     
-    def get_allowed_paths(self, function: SystemFunction) -> List[Path]:
+    def get_allowed_paths(self, function: SystemFunction) -> Tuple[Path, ...]:
         """Get allowed paths for a specific function."""
         if not self._active_profile:
-            return []
+            return ()
             
-        permission = self._active_profile.permissions.get(function)
-        return permission.allowed_paths if permission else []
+        permission = self._active_perms.get(function)
+        return permission.allowed_paths if permission else ()
+    
+    def _get_permission(self, function: SystemFunction) -> Optional[Permission]:
+        """Get the active profile's permission for a function, if any."""
+        return self._active_perms.get(function)
     
     def is_path_allowed(self, function: SystemFunction, path: Path) -> bool:
         """Check if a path is allowed for a specific function."""
-        allowed_paths = self.get_allowed_paths(function)
-        if not allowed_paths:
+        permission = self._get_permission(function)
+        if not permission or not permission._resolved_path_strs:
             return False
             
-        resolved_path = path.resolve()
-        for allowed_path in allowed_paths:
-            try:
-                resolved_path.relative_to(allowed_path.resolve())
-                return True
-            except ValueError:
-                continue
-        return False
+        # Directory prefix match on resolved strings, separator-aware
+        # Resolved on every check: the answer depends on the cwd and on
+        # symlinks that can change between calls
+        resolved_path = os.path.realpath(path)
+        return (
+            resolved_path in permission._resolved_path_strs
+            or resolved_path.startswith(permission._resolved_path_prefixes)
+        )
     
-    def get_allowed_commands(self, function: SystemFunction) -> List[str]:
+    def get_allowed_commands(self, function: SystemFunction) -> Tuple[str, ...]:
         """Get allowed commands for a specific function."""
         if not self._active_profile:
-            return []
+            return ()
             
-        permission = self._active_profile.permissions.get(function)
-        return permission.allowed_commands if permission else []
+        permission = self._active_perms.get(function)
+        return permission.allowed_commands if permission else ()
     
     def is_command_allowed(self, function: SystemFunction, command: str) -> bool:
         """Check if a command is allowed for a specific function."""
-        allowed_commands = self.get_allowed_commands(function)
-        if not allowed_commands:
+        permission = self._get_permission(function)
+        if not permission:
             return False
             
-        # Check if the command is in the allowed list (command name only)
-        command_name = Path(command).name
-        return command_name in allowed_commands
+        # Check if the command is in the allowed set (command name only)
+        return Path(command).name in permission._command_set
     
-    def get_allowed_network_hosts(self, function: SystemFunction) -> List[str]:
+    def get_allowed_network_hosts(self, function: SystemFunction) -> Tuple[str, ...]:
         """Get allowed network hosts for a specific function."""
         if not self._active_profile:
-            return []
+            return ()
             
-        permission = self._active_profile.permissions.get(function)
-        return permission.allowed_network_hosts if permission else []
+        permission = self._active_perms.get(function)
+        return permission.allowed_network_hosts if permission else ()
     
     def is_network_host_allowed(self, function: SystemFunction, host: str) -> bool:
         """Check if a network host is allowed for a specific function."""
@@ -2,15 +2,18 @@
 from __future__ import annotations
 
 import logging
+import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, List, Optional, Set
+from typing import Callable, Dict, List, Optional, Set
 from pathlib import Path
 
 
 LOGGER = logging.getLogger(__name__)
 
+_CONDITION_PATTERN = re.compile(r"(path_in|command_in|host_in)\((.*)\)")
+
 
 class PolicyType(Enum):
     """Types of security policies."""
@@ -47,56 +50,66 @@ class ToolPolicy:
     def __init__(self, policy_type: PolicyType, rules: List[PolicyRule]):
         self.policy_type = policy_type
         self.rules = sorted(rules, key=lambda r: r.priority)  # Lower priority number = higher priority
+        compiled = [(rule, self._compile_condition(rule.condition)) for rule in self.rules]
+        # Deny rules are checked first so a matching deny always wins; each
+        # group keeps its priority order.
+        self._deny_rules = tuple(item for item in compiled if item[0].action == "deny")
+        self._allow_rules = tuple(item for item in compiled if item[0].action == "allow")
+        self._other_rules = tuple(
+            item for item in compiled if item[0].action not in ("deny", "allow")
+        )
     
     def evaluate(self, context: Dict) -> str:
         """Evaluate the policy against the given context."""
-        for rule in self.rules:
-            if self._evaluate_condition(rule.condition, context):
-                LOGGER.debug(f"Policy rule '{rule.name}' matched with action '{rule.action}'")
-                return rule.action
+        for group in (self._deny_rules, self._allow_rules, self._other_rules):
+            for rule, predicate in group:
+                if self._matches(rule, predicate, context):
+                    LOGGER.debug("Policy rule '%s' matched with action '%s'", rule.name, rule.action)
+                    return rule.action
         return "deny" # Default action if no rules match
     
-    def _evaluate_condition(self, condition: str, context: Dict) -> bool:
-        """Evaluate a condition against the context."""
-        # This is a simplified condition evaluator
-        # In a real implementation, this would be more sophisticated
+    def is_denied(self, context: Dict) -> bool:
+        """Check the context against the deny rules only."""
+        return any(
+            self._matches(rule, predicate, context) for rule, predicate in self._deny_rules
+        )
+    
+    @staticmethod
+    def _matches(rule: PolicyRule, predicate: Callable[[Dict], bool], context: Dict) -> bool:
+        """Apply a compiled condition, treating evaluation errors as a non-match."""
         try:
-            # Basic condition evaluation - this is a placeholder for a more robust system
-            if condition == "always":
-                return True
-            elif condition == "never":
-                return False
-            elif condition.startswith("path_in("):
-                # Extract path from condition like "path_in('/sandbox', '/tmp')"
-                import re
-                path_match = re.search(r"path_in\((.*)\)", condition)
-                if path_match:
-                    paths_str = path_match.group(1).strip('\'"')
-                    allowed_paths = [p.strip().strip('\'"') for p in paths_str.split(',')]
-                    target_path = context.get('path', '')
-                    return any(str(target_path).startswith(path) for path in allowed_paths)
-            elif condition.startswith("command_in("):
-                # Extract commands from condition like "command_in('ls', 'pwd', 'echo')"
-                import re
-                cmd_match = re.search(r"command_in\((.*)\)", condition)
-                if cmd_match:
-                    cmds_str = cmd_match.group(1).strip('\'"')
-                    allowed_commands = [c.strip().strip('\'"') for c in cmds_str.split(',')]
-                    target_cmd = context.get('command', '')
-                    return target_cmd in allowed_commands
-            elif condition.startswith("host_in("):
-                # Extract hosts from condition like "host_in('localhost', '127.0.0.1')"
-                import re
-                host_match = re.search(r"host_in\((.*)\)", condition)
-                if host_match:
-                    hosts_str = host_match.group(1).strip('\'"')
-                    allowed_hosts = [h.strip().strip('\'"') for h in hosts_str.split(',')]
-                    target_host = context.get('host', '')
-                    return target_host in allowed_hosts
+            return predicate(context)
         except Exception as e:
-            LOGGER.error(f"Error evaluating condition '{condition}': {e}")
+            LOGGER.error("Error evaluating condition '%s': %s", rule.condition, e)
             return False
-        return False
+    
+    @staticmethod
+    def _compile_condition(condition: str) -> Callable[[Dict], bool]:
+        """Compile a condition expression into a predicate over the context."""
+        # This is a simplified condition compiler
+        # In a real implementation, this would be more sophisticated
+        if condition == "always":
+            return lambda context: True
+        
+        match = _CONDITION_PATTERN.match(condition)
+        if match:
+            name, args = match.groups()
+            values = [value.strip().strip('\'"') for value in args.strip('\'"').split(',')]
+            if name == "path_in":
+                # e.g. "path_in('/sandbox', '/tmp')"
+                prefixes = tuple(values)
+                return lambda context: str(context.get('path', '')).startswith(prefixes)
+            if name == "command_in":
+                # e.g. "command_in('ls', 'pwd', 'echo')"
+                commands = frozenset(values)
+                return lambda context: context.get('command', '') in commands
+            if name == "host_in":
+                # e.g. "host_in('localhost', '127.0.0.1')"
+                hosts = frozenset(values)
+                return lambda context: context.get('host', '') in hosts
+        
+        # "never" and unrecognised conditions never match
+        return lambda context: False
 
 
 class SecurityPolicyManager:
@@ -203,13 +216,18 @@ class SecurityPolicyManager:
         """Evaluate if an action should be allowed based on the policy."""
         policy = self._policies.get(policy_type)
         if not policy:
-            LOGGER.warning(f"No policy found for type: {policy_type}")
+            LOGGER.warning("No policy found for type: %s", policy_type)
             return False
         
         result = policy.evaluate(context)
-        LOGGER.debug(f"Policy evaluation for {policy_type.value}: {result}")
+        LOGGER.debug("Policy evaluation for %s: %s", policy_type.value, result)
         return result == "allow"
     
+    def is_denied(self, policy_type: PolicyType, context: Dict) -> bool:
+        """Check if any deny rule of the policy matches the context."""
+        policy = self._policies.get(policy_type)
+        return policy is not None and policy.is_denied(context)
+    
     def update_policy_rules(self, policy_type: PolicyType, rules: List[PolicyRule]) -> bool:
         """Update the rules for a specific policy."""
         if policy_type in self._policies:
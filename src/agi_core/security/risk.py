@@ -1,25 +1,47 @@
 """Risk assessment system that evaluates operations before execution."""
 from __future__ import annotations
 
+import bisect
+import dataclasses
 import logging
+import re
+import threading
 import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass
-from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from enum import Enum, IntEnum
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 from pathlib import Path
 
 
 LOGGER = logging.getLogger(__name__)
 
 
-class RiskLevel(Enum):
-    """Levels of risk for operations."""
-    NONE = "none"
-    LOW = "low"
-    MEDIUM = "medium"
-    HIGH = "high"
-    CRITICAL = "critical"
+class RiskLevel(IntEnum):
+    """Levels of risk for operations, ordered by severity."""
+    NONE = 0
+    LOW = 1
+    MEDIUM = 2
+    HIGH = 3
+    CRITICAL = 4
+    
+    @property
+    def label(self) -> str:
+        """Lower-case name used in configuration, logs and audit metadata."""
+        return self.name.lower()
+
+
+# Contribution of each severity level to the weighted risk score, indexed by level
+_SEVERITY_VALUES = (0.0, 0.2, 0.4, 0.7, 1.0)
+
+# Minimum normalized score for LOW, MEDIUM, HIGH and CRITICAL
+_THRESHOLDS = (0.1, 0.4, 0.6, 0.8)
+_LEVELS = tuple(RiskLevel)
+
+# Path prefixes of system directories and suffixes of configuration files
+_PATH_SYSTEM_PREFIXES = ("/etc", "/bin", "/sbin", "/usr", "/boot")
+_CONFIG_SUFFIXES = (".env", "config", "secrets", "passwords")
 
 
 class RiskCategory(Enum):
@@ -32,7 +54,7 @@ class RiskCategory(Enum):
     UNAUTHORIZED_ACCESS = "unauthorized_access"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RiskFactor:
     """A factor that contributes to the overall risk assessment."""
     category: RiskCategory
@@ -42,7 +64,7 @@ class RiskFactor:
     mitigation: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RiskAssessment:
     """Result of a risk assessment."""
     operation: str
@@ -54,6 +76,104 @@ class RiskAssessment:
     execution_allowed: bool
 
 
+def _rule_priority(factor: RiskFactor) -> int:
+    """Rank a rule by the score its factor contributes; higher runs first."""
+    return round(_SEVERITY_VALUES[factor.severity] * factor.weight * 100)
+
+
+def _recommendation(factor: RiskFactor) -> str:
+    """Render the recommendation reported when a factor matches."""
+    return f"{factor.mitigation} (Risk: {factor.severity.label})"
+
+
+# Recommendations appended to every HIGH or CRITICAL assessment
+_GENERAL_HIGH_RECS = (
+    "Consider running in a more restricted environment",
+    "Obtain additional authorization before proceeding"
+)
+
+
+def _rule_sort_key(rule: Dict) -> int:
+    return -rule["priority"]
+
+
+_CACHEABLE_TYPES = (str, int, float, bool, type(None))
+
+
+def _context_key(operation: str, context: Dict[str, Any]) -> Optional[tuple]:
+    """Build a hashable cache key, or None if the context holds other value types."""
+    items = []
+    for key, value in context.items():
+        if not isinstance(value, _CACHEABLE_TYPES):
+            return None
+        items.append((key, value))
+    items.sort()
+    return (operation, tuple(items))
+
+
+# Declarative rule conditions are nested tuples:
+#   ("contains", field, triggers, flags)  any trigger occurs in the field
+#   ("startswith", field, prefixes)       the field starts with a prefix
+#   ("endswith", field, suffixes)         the field ends with a suffix
+#   ("all", spec, ...) / ("any", spec, ...)
+# The engine compiles them into a single generated checker function.
+
+
+def _trigger_search(triggers: Iterable[str], flags: int) -> Callable[[str], Any]:
+    """Compile triggers into one regex alternation scanned once in C."""
+    return re.compile("|".join(map(re.escape, triggers)), flags).search
+
+
+def _spec_source(spec: tuple, fields: Dict[str, str], namespace: Dict[str, Any]) -> str:
+    """Render a declarative condition as a Python expression for the checker."""
+    kind = spec[0]
+    if kind in ("all", "any"):
+        joiner = " and " if kind == "all" else " or "
+        return "(" + joiner.join(_spec_source(part, fields, namespace) for part in spec[1:]) + ")"
+    field = spec[1]
+    var = fields.setdefault(field, f"_f{len(fields)}")
+    const = f"_k{len(namespace)}"
+    if kind == "contains":
+        namespace[const] = _trigger_search(spec[2], spec[3])
+        return f"{const}({var}) is not None"
+    if kind in ("startswith", "endswith"):
+        namespace[const] = spec[2]
+        return f"{var}.{kind}({const})"
+    raise ValueError(f"Unknown rule condition: {kind}")
+
+
+def _compile_checker(rules: List[Dict], thorough: bool) -> Callable[[Dict[str, Any]], List[Dict]]:
+    """Generate one function that evaluates every rule in order.
+    
+    Declarative conditions are inlined as straight-line checks on context
+    fields read once up front; custom callables are invoked from the
+    generated code. The function returns the matching rules in order
+    and stops after a full-weight CRITICAL match unless ``thorough`` is set.
+    """
+    namespace: Dict[str, Any] = {}
+    fields: Dict[str, str] = {}
+    body = []
+    for index, rule in enumerate(rules):
+        if "spec" in rule:
+            test = _spec_source(rule["spec"], fields, namespace)
+        else:
+            name = f"_c{index}"
+            namespace[name] = rule["condition"]
+            test = f"{name}(ctx)"
+        namespace[f"_r{index}"] = rule
+        body.append(f"    if {test}:")
+        body.append(f"        matched.append(_r{index})")
+        factor = rule["factor"]
+        if not thorough and factor.severity is RiskLevel.CRITICAL and factor.weight >= 1.0:
+            body.append("        return matched")
+    header = ["def _check(ctx):", "    _get = ctx.get"]
+    header.extend(f"    {var} = _get({field!r}, '')" for field, var in fields.items())
+    header.append("    matched = []")
+    source = "\n".join(header + body + ["    return matched", ""])
+    exec(compile(source, "<risk-rules>", "exec"), namespace)
+    return namespace["_check"]
+
+
 class RiskAssessmentEngine(ABC):
     """Abstract base class for risk assessment engines."""
     
@@ -64,17 +184,52 @@ class RiskAssessmentEngine(ABC):
 
 
 class RuleBasedRiskEngine(RiskAssessmentEngine):
-    """Risk assessment engine based on predefined rules."""
+    """Risk assessment engine based on predefined rules.
+    
+    By default evaluation stops at the first full-weight CRITICAL factor, since
+    the operation is denied regardless of the remaining rules. Pass
+    ``thorough=True`` to collect every matching factor, e.g. for a verbose
+    audit trail; the reported score then averages in the lesser factors too.
+    """
     
-    def __init__(self) -> None:
+    def __init__(self, thorough: bool = False, cache_size: int = 1024) -> None:
+        self._thorough = thorough
+        # LRU memo of assessments keyed by operation and context
+        self._cache: OrderedDict[tuple, RiskAssessment] = OrderedDict()
+        self._cache_size = cache_size
+        self._cache_lock = threading.Lock()
         self._risk_rules = self._initialize_risk_rules()
+        # Most severe rules first so the critical short-circuit fires early;
+        # the sort is stable, so equal priorities keep the cheaper rule first.
+        for rule in self._risk_rules:
+            rule.setdefault("priority", _rule_priority(rule["factor"]))
+            rule["recommendation"] = _recommendation(rule["factor"])
+        self._risk_rules.sort(key=_rule_sort_key)
+        self._check = _compile_checker(self._risk_rules, thorough)
+    
+    def add_rule(self, condition, factor: RiskFactor, priority: Optional[int] = None) -> None:
+        """Add a rule, keeping the rules ordered by priority."""
+        rule = {
+            "condition": condition,
+            "factor": factor,
+            "priority": _rule_priority(factor) if priority is None else priority,
+            "recommendation": _recommendation(factor)
+        }
+        bisect.insort(self._risk_rules, rule, key=_rule_sort_key)
+        self._check = _compile_checker(self._risk_rules, self._thorough)
+        self.clear_cache()
+    
+    def clear_cache(self) -> None:
+        """Drop all memoized assessments."""
+        with self._cache_lock:
+            self._cache.clear()
     
     def _initialize_risk_rules(self) -> List[Dict]:
         """Initialize risk assessment rules."""
         return [
             # System integrity risks
             {
-                "condition": lambda ctx: any(cmd in ctx.get("command", "") for cmd in ["rm -rf", "format", "dd if=", "mkfs"]),
+                "spec": ("contains", "command", ("rm -rf", "format", "dd if=", "mkfs"), 0),
                 "factor": RiskFactor(
                     category=RiskCategory.SYSTEM_INTEGRITY,
                     severity=RiskLevel.CRITICAL,
@@ -84,7 +239,7 @@ class RuleBasedRiskEngine(RiskAssessmentEngine):
                 )
             },
             {
-                "condition": lambda ctx: ctx.get("path", "").startswith(("/", "/etc", "/bin", "/sbin", "/usr", "/boot")),
+                "spec": ("startswith", "path", _PATH_SYSTEM_PREFIXES),
                 "factor": RiskFactor(
                     category=RiskCategory.SYSTEM_INTEGRITY,
                     severity=RiskLevel.HIGH,
@@ -95,7 +250,7 @@ class RuleBasedRiskEngine(RiskAssessmentEngine):
             },
             # Data privacy risks
             {
-                "condition": lambda ctx: any(keyword in ctx.get("content", "").lower() for keyword in ["password", "secret", "token", "key", "credential"]),
+                "spec": ("contains", "content", ("password", "secret", "token", "key", "credential"), re.IGNORECASE),
                 "factor": RiskFactor(
                     category=RiskCategory.DATA_PRIVACY,
                     severity=RiskLevel.HIGH,
@@ -105,7 +260,7 @@ class RuleBasedRiskEngine(RiskAssessmentEngine):
                 )
             },
             {
-                "condition": lambda ctx: ctx.get("path", "").endswith((".env", "config", "secrets", "passwords")),
+                "spec": ("endswith", "path", _CONFIG_SUFFIXES),
                 "factor": RiskFactor(
                     category=RiskCategory.DATA_PRIVACY,
                     severity=RiskLevel.MEDIUM,
@@ -116,8 +271,11 @@ class RuleBasedRiskEngine(RiskAssessmentEngine):
             },
             # Network security risks
             {
-                "condition": lambda ctx: any(tool in ctx.get("tool", "") for tool in ["terminal", "browser"]) and 
-                                          any(host in ctx.get("target", "") for host in ["192.168", "10.", "172.", "scan", "nmap"]),
+                "spec": (
+                    "all",
+                    ("contains", "tool", ("terminal", "browser"), 0),
+                    ("contains", "target", ("192.168", "10.", "172.", "scan", "nmap"), 0)
+                ),
                 "factor": RiskFactor(
                     category=RiskCategory.NETWORK_SECURITY,
                     severity=RiskLevel.HIGH,
@@ -128,8 +286,11 @@ class RuleBasedRiskEngine(RiskAssessmentEngine):
             },
             # Resource utilization risks
             {
-                "condition": lambda ctx: "infinite" in ctx.get("command", "") or 
-                                        any(loop in ctx.get("code", "") for loop in ["while True", "for _ in range(", "while :"]),
+                "spec": (
+                    "any",
+                    ("contains", "command", ("infinite",), 0),
+                    ("contains", "code", ("while True", "for _ in range(", "while :"), 0)
+                ),
                 "factor": RiskFactor(
                     category=RiskCategory.RESOURCE_UTILIZATION,
                     severity=RiskLevel.MEDIUM,
@@ -139,7 +300,7 @@ class RuleBasedRiskEngine(RiskAssessmentEngine):
                 )
             },
             {
-                "condition": lambda ctx: any(size in ctx.get("command", "") for size in ["100GB", "1TB", "large_file"]),
+                "spec": ("contains", "command", ("100GB", "1TB", "large_file"), 0),
                 "factor": RiskFactor(
                     category=RiskCategory.RESOURCE_UTILIZATION,
                     severity=RiskLevel.MEDIUM,
@@ -152,26 +313,49 @@ class RuleBasedRiskEngine(RiskAssessmentEngine):
     
     def assess_risk(self, operation: str, context: Dict[str, Any]) -> RiskAssessment:
         """Assess the risk of an operation in the given context."""
+        key = _context_key(operation, context) if self._cache_size > 0 else None
+        if key is None:
+            return self._evaluate(operation, context)
+        
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+        if cached is not None:
+            return dataclasses.replace(
+                cached,
+                factors=list(cached.factors),
+                recommendations=list(cached.recommendations),
+                timestamp=time.time()
+            )
+        
+        assessment = self._evaluate(operation, context)
+        with self._cache_lock:
+            self._cache[key] = dataclasses.replace(
+                assessment,
+                factors=list(assessment.factors),
+                recommendations=list(assessment.recommendations)
+            )
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return assessment
+    
+    def _evaluate(self, operation: str, context: Dict[str, Any]) -> RiskAssessment:
+        """Apply the rules to the context without consulting the cache."""
         factors = []
+        recommendations = []
         total_score = 0.0
         max_possible_score = 0.0
         
-        # Apply each rule to the context
-        for rule in self._risk_rules:
-            if rule["condition"](context):
-                factor = rule["factor"]
-                factors.append(factor)
-                # Calculate weighted contribution to total risk
-                severity_values = {
-                    RiskLevel.NONE: 0.0,
-                    RiskLevel.LOW: 0.2,
-                    RiskLevel.MEDIUM: 0.4,
-                    RiskLevel.HIGH: 0.7,
-                    RiskLevel.CRITICAL: 1.0
-                }
-                contribution = severity_values[factor.severity] * factor.weight
-                total_score += contribution
-                max_possible_score += 1.0 * factor.weight
+        # Apply the compiled rule checker, which also handles the critical short-circuit
+        for rule in self._check(context):
+            factor = rule["factor"]
+            factors.append(factor)
+            recommendations.append(rule["recommendation"])
+            # Calculate weighted contribution to total risk
+            contribution = _SEVERITY_VALUES[factor.severity] * factor.weight
+            total_score += contribution
+            max_possible_score += 1.0 * factor.weight
         
         # Calculate overall risk score (0.0 to 1.0)
         if max_possible_score > 0:
@@ -180,30 +364,14 @@ class RuleBasedRiskEngine(RiskAssessmentEngine):
             normalized_score = 0.0
         
         # Determine risk level based on score
-        if normalized_score >= 0.8:
-            risk_level = RiskLevel.CRITICAL
-        elif normalized_score >= 0.6:
-            risk_level = RiskLevel.HIGH
-        elif normalized_score >= 0.4:
-            risk_level = RiskLevel.MEDIUM
-        elif normalized_score >= 0.1:
-            risk_level = RiskLevel.LOW
-        else:
-            risk_level = RiskLevel.NONE
+        risk_level = _LEVELS[bisect.bisect_right(_THRESHOLDS, normalized_score)]
         
         # Determine if execution is allowed based on risk level
-        execution_allowed = risk_level in [RiskLevel.NONE, RiskLevel.LOW]
-        
-        # Generate recommendations based on risk factors
-        recommendations = []
-        if factors:
-            for factor in factors:
-                recommendations.append(f"{factor.mitigation} (Risk: {factor.severity.value})")
+        execution_allowed = risk_level <= RiskLevel.LOW
         
         # Add general recommendations for high-risk operations
-        if risk_level in [RiskLevel.HIGH, RiskLevel.CRITICAL]:
-            recommendations.append("Consider running in a more restricted environment")
-            recommendations.append("Obtain additional authorization before proceeding")
+        if risk_level >= RiskLevel.HIGH:
+            recommendations.extend(_GENERAL_HIGH_RECS)
         
         return RiskAssessment(
             operation=operation,
@@ -227,8 +395,8 @@ class RiskAssessmentManager:
         """Assess the risk of an operation in the given context."""
         assessment = self._engine.assess_risk(operation, context)
         self._logger.info(
-            f"Risk assessment for '{operation}': {assessment.risk_level.value} "
-            f"(score: {assessment.score:.2f}, allowed: {assessment.execution_allowed})"
+            "Risk assessment for '%s': %s (score: %.2f, allowed: %s)",
+            operation, assessment.risk_level.label, assessment.score, assessment.execution_allowed
         )
         return assessment
     
@@ -252,7 +420,4 @@ class RiskAssessmentManager:
         # This would be implemented differently based on the specific engine type
         # For the rule-based engine, we'd need to add the rule to its internal list
         if isinstance(self._engine, RuleBasedRiskEngine):
-            self._engine._risk_rules.append({
-                "condition": condition,
-                "factor": risk_factor
-            })
\ No newline at end of file
+            self._engine.add_rule(condition, risk_factor)
\ No newline at end of file
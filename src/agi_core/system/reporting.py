@@ -4,15 +4,42 @@ Provides comprehensive logging and reporting of all AGI actions with transparenc
 """
 import json
 import asyncio
+import atexit
+import threading
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
 from enum import Enum
 import logging
 from pathlib import Path
 import csv
+import sqlite3
 from dataclasses import dataclass, field
 import os
+import re
+import shutil
+from collections import deque
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - falls back to the stdlib encoder
+    orjson = None
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize an object to a JSON string"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(obj)
+
+
+def _dumps_line(obj: Any) -> bytes:
+    """Serialize an object to a newline-terminated JSON log line"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj) + '\n').encode('utf-8')
+
+
+_loads = orjson.loads if orjson is not None else json.loads
 
 
 class ActionType(Enum):
@@ -30,6 +57,10 @@ class ActionType(Enum):
     REASONING = "reasoning"
 
 
+# Direct lookup avoids the slower ActionType(value) enum call per row
+_ACTION_TYPES_BY_VALUE = {action_type.value: action_type for action_type in ActionType}
+
+
 class LogLevel(Enum):
     """Log levels for reporting"""
     DEBUG = "DEBUG"
@@ -39,7 +70,7 @@ class LogLevel(Enum):
     CRITICAL = "CRITICAL"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ActionLogEntry:
     """Represents a single action log entry"""
     timestamp: datetime
@@ -56,6 +87,47 @@ class ActionLogEntry:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+_ACTIONS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS actions (
+    timestamp REAL NOT NULL,
+    action_type TEXT NOT NULL,
+    action_id TEXT NOT NULL,
+    description TEXT,
+    details_json TEXT,
+    agent_id TEXT,
+    status TEXT,
+    duration_ms REAL,
+    user_consent INTEGER,
+    risk_level TEXT,
+    tags_json TEXT,
+    metadata_json TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_ts ON actions(timestamp);
+CREATE INDEX IF NOT EXISTS idx_type_ts ON actions(action_type, timestamp);
+CREATE INDEX IF NOT EXISTS idx_status_ts ON actions(status, timestamp);
+"""
+
+_ACTION_COLUMNS = (
+    "timestamp, action_type, action_id, description, details_json, agent_id, "
+    "status, duration_ms, user_consent, risk_level, tags_json, metadata_json"
+)
+
+# Column order of CSV exports; details must stay last
+_CSV_FIELDS = (
+    'timestamp', 'action_type', 'action_id', 'description',
+    'status', 'duration_ms', 'user_consent', 'risk_level',
+    'agent_id', 'details'
+)
+
+# Leading timestamp field of an action log line
+_TIMESTAMP_FIELD = re.compile(rb'"timestamp":\s*"([^"]+)"')
+
+# Window below which cleanup scans lines instead of bisecting further
+_CLEANUP_SCAN_BYTES = 1 << 16
+
+_INSERT_ACTION = f"INSERT INTO actions ({_ACTION_COLUMNS}) VALUES ({', '.join('?' * 12)})"
+
+
 class TransparentReportingSystem:
     """
     System for transparent reporting and action logging
@@ -70,23 +142,156 @@ class TransparentReportingSystem:
         
         # Initialize log files
         self.action_log_path = self.log_dir / "actions.log"
-        self.summary_log_path = self.log_dir / "summary.log"
+        self.index_path = self.log_dir / "actions.db"
         
         # Initialize action counter
         self.action_counter = 0
         
-        # Initialize the log files
+        # Initialize the log files and keep buffered append handles open
         self._init_log_files()
+        self._write_lock = threading.Lock()
+        self._open_handles()
+        self._open_index()
+        atexit.register(self.close)
+        
+        # Running dashboard statistics, updated as actions are logged
+        self._stats_lock = threading.Lock()
+        self._load_dashboard_stats()
         
-        # For async logging
-        self.log_queue = asyncio.Queue()
+        # For async logging; the queue and its drain task are bound to the
+        # event loop that first logs through them, see _queue_for()
+        self.log_queue: Optional[asyncio.Queue] = None
+        self._logging_loop: Optional[asyncio.AbstractEventLoop] = None
         self._logging_task = None
 
     def _init_log_files(self):
         """Initialize log files if they don't exist"""
-        for log_path in [self.action_log_path, self.summary_log_path]:
-            if not log_path.exists():
-                log_path.touch()
+        if not self.action_log_path.exists():
+            self.action_log_path.touch()
+
+    def _open_handles(self):
+        """Open the append handle used by the log writer"""
+        self._action_fh = open(self.action_log_path, 'ab', buffering=1 << 16)
+
+    def _open_index(self):
+        """Open the SQLite index used to answer history and report queries"""
+        self._db = sqlite3.connect(str(self.index_path), isolation_level=None, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_ACTIONS_SCHEMA)
+        
+        # Index entries written by older versions that only kept the JSON log
+        if self._db.execute("SELECT 1 FROM actions LIMIT 1").fetchone() is None:
+            self._backfill_index()
+
+    def _backfill_index(self):
+        """Populate the index from an existing JSON action log"""
+        rows = []
+        with open(self.action_log_path, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    try:
+                        data = _loads(line)
+                        data['timestamp'] = datetime.fromisoformat(data['timestamp'])
+                        data['action_type'] = _ACTION_TYPES_BY_VALUE[data['action_type']]
+                        rows.append(self._entry_to_row(ActionLogEntry(**data)))
+                    except Exception:
+                        continue  # Skip malformed entries
+        if rows:
+            with self._db:
+                self._db.executemany(_INSERT_ACTION, rows)
+
+    @staticmethod
+    def _entry_to_row(entry: ActionLogEntry) -> tuple:
+        """Convert a log entry to an index row"""
+        return (
+            entry.timestamp.timestamp(),
+            entry.action_type.value,
+            entry.action_id,
+            entry.description,
+            _dumps(entry.details),
+            entry.agent_id,
+            entry.status,
+            entry.duration_ms,
+            entry.user_consent,
+            entry.risk_level,
+            _dumps(entry.tags),
+            _dumps(entry.metadata),
+        )
+
+    @staticmethod
+    def _row_to_entry(row: tuple) -> ActionLogEntry:
+        """Convert an index row back to a log entry"""
+        user_consent = row[8]
+        return ActionLogEntry(
+            timestamp=datetime.fromtimestamp(row[0]),
+            action_type=_ACTION_TYPES_BY_VALUE[row[1]],
+            action_id=row[2],
+            description=row[3],
+            details=_loads(row[4]) if row[4] != '{}' else {},
+            agent_id=row[5],
+            status=row[6],
+            duration_ms=row[7],
+            user_consent=None if user_consent is None else bool(user_consent),
+            risk_level=row[9],
+            tags=_loads(row[10]) if row[10] != '[]' else [],
+            metadata=_loads(row[11]) if row[11] != '{}' else {},
+        )
+
+    def _load_dashboard_stats(self):
+        """Seed the incremental dashboard statistics from the index"""
+        window_start = (datetime.now() - timedelta(hours=24)).timestamp()
+        recent = self._query(
+            f"SELECT {_ACTION_COLUMNS} FROM actions ORDER BY timestamp DESC, rowid DESC LIMIT 10"
+        )
+        window = self._query(
+            "SELECT timestamp, action_type, COALESCE(risk_level, 'unknown') FROM actions "
+            "WHERE timestamp >= ? ORDER BY timestamp, rowid",
+            (window_start,)
+        )
+        with self._stats_lock:
+            self._total_actions = self._query("SELECT COUNT(*) FROM actions")[0][0]
+            self._recent_actions = deque(
+                (self._row_to_entry(row) for row in reversed(recent)), maxlen=10
+            )
+            self._window_24h = deque()
+            self._by_type_24h = {}
+            self._by_risk_24h = {}
+            for timestamp, action_type, risk_level in window:
+                self._count_in_window(datetime.fromtimestamp(timestamp), action_type, risk_level)
+
+    def _count_in_window(self, timestamp: datetime, action_type: str, risk_level: str):
+        """Add an action to the rolling 24 hour counters"""
+        self._window_24h.append((timestamp, action_type, risk_level))
+        self._by_type_24h[action_type] = self._by_type_24h.get(action_type, 0) + 1
+        self._by_risk_24h[risk_level] = self._by_risk_24h.get(risk_level, 0) + 1
+
+    def _record_stats(self, entry: ActionLogEntry):
+        """Update the dashboard statistics with a newly logged action"""
+        with self._stats_lock:
+            self._total_actions += 1
+            self._recent_actions.append(entry)
+            self._count_in_window(entry.timestamp, entry.action_type.value, entry.risk_level or "unknown")
+
+    def _evict_expired_stats(self, cutoff: datetime):
+        """Drop actions older than the cutoff from the rolling counters"""
+        window = self._window_24h
+        while window and window[0][0] < cutoff:
+            _, action_type, risk_level = window.popleft()
+            for counts, key in ((self._by_type_24h, action_type), (self._by_risk_24h, risk_level)):
+                counts[key] -= 1
+                if not counts[key]:
+                    del counts[key]
+
+    def _query(self, sql: str, params: tuple = ()) -> list:
+        """Run a read query against the index"""
+        with self._write_lock:
+            return self._db.execute(sql, params).fetchall()
+
+    def _close_handles(self):
+        """Flush and close the append handle"""
+        if not self._action_fh.closed:
+            self._action_fh.close()
 
     def log_action(
         self,
@@ -105,10 +310,12 @@ class TransparentReportingSystem:
         Log an action with full transparency
         """
         self.action_counter += 1
-        action_id = f"action_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{self.action_counter:04d}"
+        now = datetime.now()
+        iso_timestamp = now.isoformat()
+        action_id = f"action_{now.strftime('%Y%m%d_%H%M%S')}_{self.action_counter:04d}"
         
         log_entry = ActionLogEntry(
-            timestamp=datetime.now(),
+            timestamp=now,
             action_type=action_type,
             action_id=action_id,
             description=description,
@@ -122,45 +329,127 @@ class TransparentReportingSystem:
             metadata=metadata or {}
         )
         
-        # Write to action log
-        self._write_action_log(log_entry)
+        self._record_stats(log_entry)
         
-        # Write summary to summary log
-        self._write_summary_log(log_entry)
+        # Hand the entry to the background writer when running inside an event
+        # loop, otherwise append it to the buffered log files directly
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is not None:
+            self._queue_for(loop).put_nowait((log_entry, iso_timestamp))
+        else:
+            self._write_entry(log_entry, iso_timestamp)
         
         # Log to standard logger as well
         self.logger.info(f"Action {action_id}: {description} - Status: {status}")
         
         return action_id
 
-    def _write_action_log(self, entry: ActionLogEntry):
-        """Write action log entry to the action log file"""
-        try:
-            with open(self.action_log_path, 'a', encoding='utf-8') as f:
-                log_dict = asdict(entry)
-                # Convert datetime to ISO format string
-                log_dict['timestamp'] = entry.timestamp.isoformat()
-                f.write(json.dumps(log_dict) + '\n')
-        except Exception as e:
-            self.logger.error(f"Error writing action log: {e}")
+    def _queue_for(self, loop: asyncio.AbstractEventLoop) -> asyncio.Queue:
+        """Return the log queue for ``loop``, starting its drain task if needed"""
+        if loop is not self._logging_loop:
+            # Entries left behind by a previous loop are written before the
+            # queue is replaced, so ordering across loops is preserved
+            self._drain_pending()
+            self.log_queue = asyncio.Queue()
+            self._logging_loop = loop
+            self._logging_task = None
+        if self._logging_task is None or self._logging_task.done():
+            self._logging_task = loop.create_task(self._drain_queue(self.log_queue))
+        return self.log_queue
+
+    async def _drain_queue(self, queue: asyncio.Queue):
+        """Background task writing queued entries to the log files"""
+        while True:
+            entry, iso_timestamp = await queue.get()
+            try:
+                self._write_entry(entry, iso_timestamp)
+            finally:
+                queue.task_done()
+
+    def _drain_pending(self):
+        """Write any entries still waiting in the queue"""
+        queue = self.log_queue
+        if queue is None:
+            return
+        loop = self._logging_loop
+        task = self._logging_task
+        if task is not None and not task.done() and loop.is_running():
+            try:
+                current = asyncio.get_running_loop()
+            except RuntimeError:
+                current = None
+            if current is not loop:
+                # The drain task owns the queue while its loop runs in another
+                # thread; wait for it to catch up instead of racing it
+                asyncio.run_coroutine_threadsafe(queue.join(), loop).result()
+                return
+        while True:
+            try:
+                entry, iso_timestamp = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            self._write_entry(entry, iso_timestamp)
+            queue.task_done()
+
+    def _write_entry(self, entry: ActionLogEntry, iso_timestamp: str):
+        """Write an entry to the action log and the index"""
+        with self._write_lock:
+            self._write_action_log(entry, iso_timestamp)
+            self._write_index(entry)
+
+    def flush(self):
+        """Write queued entries and flush the buffered action log"""
+        self._drain_pending()
+        with self._write_lock:
+            if not self._action_fh.closed:
+                self._action_fh.flush()
 
-    def _write_summary_log(self, entry: ActionLogEntry):
-        """Write a summary of the action to the summary log file"""
+    def close(self):
+        """Flush pending entries and close the log files"""
+        if self._action_fh.closed:
+            return
+        self.flush()
+        if self._logging_task is not None and not self._logging_task.done():
+            try:
+                self._logging_loop.call_soon_threadsafe(self._logging_task.cancel)
+            except RuntimeError:
+                pass  # Event loop already closed
+        with self._write_lock:
+            self._close_handles()
+            self._db.close()
+        atexit.unregister(self.close)
+
+    def _write_action_log(self, entry: ActionLogEntry, iso_timestamp: str):
+        """Write action log entry to the action log file"""
         try:
-            summary = {
-                'timestamp': entry.timestamp.isoformat(),
-                'action_id': entry.action_id,
+            # Build the record directly; asdict() would deep-copy details and metadata
+            log_dict = {
+                'timestamp': iso_timestamp,
                 'action_type': entry.action_type.value,
+                'action_id': entry.action_id,
                 'description': entry.description,
+                'details': entry.details,
+                'agent_id': entry.agent_id,
                 'status': entry.status,
+                'duration_ms': entry.duration_ms,
+                'user_consent': entry.user_consent,
                 'risk_level': entry.risk_level,
-                'agent_id': entry.agent_id
+                'tags': entry.tags,
+                'metadata': entry.metadata
             }
-            
-            with open(self.summary_log_path, 'a', encoding='utf-8') as f:
-                f.write(json.dumps(summary) + '\n')
+            self._action_fh.write(_dumps_line(log_dict))
         except Exception as e:
-            self.logger.error(f"Error writing summary log: {e}")
+            self.logger.error(f"Error writing action log: {e}")
+
+    def _write_index(self, entry: ActionLogEntry):
+        """Insert the entry into the SQLite index"""
+        try:
+            self._db.execute(_INSERT_ACTION, self._entry_to_row(entry))
+        except Exception as e:
+            self.logger.error(f"Error indexing action: {e}")
 
     def get_action_history(
         self,
@@ -174,32 +463,29 @@ class TransparentReportingSystem:
         Retrieve action history with various filters
         """
         try:
-            entries = []
-            with open(self.action_log_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    if line.strip():
-                        try:
-                            data = json.loads(line)
-                            # Convert timestamp back to datetime
-                            data['timestamp'] = datetime.fromisoformat(data['timestamp'])
-                            entry = ActionLogEntry(**data)
-                            
-                            # Apply filters
-                            if action_types and entry.action_type not in action_types:
-                                continue
-                            if status_filter and entry.status != status_filter:
-                                continue
-                            if date_from and entry.timestamp < date_from:
-                                continue
-                            if date_to and entry.timestamp > date_to:
-                                continue
-                                
-                            entries.append(entry)
-                        except Exception as e:
-                            self.logger.error(f"Error parsing log entry: {e}")
+            self.flush()
+            clauses = []
+            params = []
+            if action_types:
+                clauses.append(f"action_type IN ({', '.join('?' * len(action_types))})")
+                params.extend(action_type.value for action_type in action_types)
+            if status_filter:
+                clauses.append("status = ?")
+                params.append(status_filter)
+            if date_from:
+                clauses.append("timestamp >= ?")
+                params.append(date_from.timestamp())
+            if date_to:
+                clauses.append("timestamp <= ?")
+                params.append(date_to.timestamp())
+            where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
             
             # Return most recent entries first, limited by the specified limit
-            return sorted(entries, key=lambda x: x.timestamp, reverse=True)[:limit]
+            rows = self._query(
+                f"SELECT {_ACTION_COLUMNS} FROM actions{where} ORDER BY timestamp DESC, rowid DESC LIMIT ?",
+                (*params, limit)
+            )
+            return [self._row_to_entry(row) for row in rows]
         except Exception as e:
             self.logger.error(f"Error retrieving action history: {e}")
             return []
@@ -213,45 +499,40 @@ class TransparentReportingSystem:
         """
         Generate various types of reports
         """
+        now = datetime.now()
         if report_type == "daily":
             if not date_from:
-                date_from = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+                date_from = now.replace(hour=0, minute=0, second=0, microsecond=0)
             if not date_to:
-                date_to = datetime.now()
+                date_to = now
         elif report_type == "weekly":
             if not date_from:
-                date_from = (datetime.now() - timedelta(days=7)).replace(hour=0, minute=0, second=0, microsecond=0)
+                date_from = (now - timedelta(days=7)).replace(hour=0, minute=0, second=0, microsecond=0)
             if not date_to:
-                date_to = datetime.now()
+                date_to = now
         elif report_type == "monthly":
             if not date_from:
-                date_from = (datetime.now() - timedelta(days=30)).replace(hour=0, minute=0, second=0, microsecond=0)
+                date_from = (now - timedelta(days=30)).replace(hour=0, minute=0, second=0, microsecond=0)
             if not date_to:
-                date_to = datetime.now()
+                date_to = now
+        
+        self.flush()
         
-        # Count actions by type
+        # Count actions by type and risk level
         action_counts = {}
         risk_counts = {'low': 0, 'medium': 0, 'high': 0, 'critical': 0}
         total_actions = 0
         
-        with open(self.action_log_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                if line.strip():
-                    try:
-                        data = json.loads(line)
-                        entry_timestamp = datetime.fromisoformat(data['timestamp'])
-                        
-                        if date_from <= entry_timestamp <= date_to:
-                            action_type = data['action_type']
-                            action_counts[action_type] = action_counts.get(action_type, 0) + 1
-                            
-                            risk_level = data.get('risk_level')
-                            if risk_level in risk_counts:
-                                risk_counts[risk_level] += 1
-                            
-                            total_actions += 1
-                    except Exception:
-                        continue  # Skip malformed entries
+        rows = self._query(
+            "SELECT action_type, risk_level, COUNT(*) FROM actions "
+            "WHERE timestamp BETWEEN ? AND ? GROUP BY action_type, risk_level",
+            (date_from.timestamp(), date_to.timestamp())
+        )
+        for action_type, risk_level, count in rows:
+            action_counts[action_type] = action_counts.get(action_type, 0) + count
+            if risk_level in risk_counts:
+                risk_counts[risk_level] += count
+            total_actions += count
         
         return {
             "report_type": report_type,
@@ -260,7 +541,7 @@ class TransparentReportingSystem:
             "total_actions": total_actions,
             "action_counts": action_counts,
             "risk_distribution": risk_counts,
-            "generated_at": datetime.now().isoformat()
+            "generated_at": now.isoformat()
         }
 
     def export_logs(self, export_format: str = "json", output_path: Path = None) -> Path:
@@ -272,36 +553,27 @@ class TransparentReportingSystem:
             filename = f"agi_logs_{timestamp}.{export_format}"
             output_path = self.log_dir / filename
         
+        self.flush()
         if export_format == "json":
             # Just copy the action log as is
-            import shutil
             shutil.copy2(self.action_log_path, output_path)
         elif export_format == "csv":
             # Convert JSON log to CSV
-            with open(self.action_log_path, 'r', encoding='utf-8') as input_file, \
-                 open(output_path, 'w', newline='', encoding='utf-8') as output_file:
-                
-                fieldnames = [
-                    'timestamp', 'action_type', 'action_id', 'description', 
-                    'status', 'duration_ms', 'user_consent', 'risk_level', 
-                    'agent_id', 'details'
-                ]
-                
-                writer = csv.DictWriter(output_file, fieldnames=fieldnames)
-                writer.writeheader()
-                
+            def rows(input_file):
                 for line in input_file:
                     if line.strip():
                         try:
-                            data = json.loads(line)
-                            # Convert nested details to string
-                            data['details'] = json.dumps(data.get('details', {}))
-                            # Convert timestamp to string if it's a datetime object
-                            if isinstance(data['timestamp'], datetime):
-                                data['timestamp'] = data['timestamp'].isoformat()
-                            writer.writerow(data)
+                            data = _loads(line)
                         except Exception:
                             continue  # Skip malformed entries
+                        # Nested details are written as a JSON string
+                        yield [data.get(name) for name in _CSV_FIELDS[:-1]] + [_dumps(data.get('details', {}))]
+            
+            with open(self.action_log_path, 'rb') as input_file, \
+                 open(output_path, 'w', newline='', encoding='utf-8') as output_file:
+                writer = csv.writer(output_file)
+                writer.writerow(_CSV_FIELDS)
+                writer.writerows(rows(input_file))
         else:
             raise ValueError(f"Unsupported export format: {export_format}")
         
@@ -311,26 +583,12 @@ class TransparentReportingSystem:
         """
         Get data for transparency dashboard
         """
-        # Get recent actions
-        recent_actions = self.get_action_history(limit=10)
-        
-        # Get summary statistics
-        total_actions = len(self.get_action_history(limit=10000))
-        recent_24h = self.get_action_history(
-            date_from=datetime.now() - timedelta(hours=24)
-        )
-        
-        # Count by action type
-        type_counts = {}
-        for action in recent_24h:
-            action_type = action.action_type.value
-            type_counts[action_type] = type_counts.get(action_type, 0) + 1
-        
-        # Count by risk level
-        risk_counts = {}
-        for action in recent_24h:
-            risk_level = action.risk_level or "unknown"
-            risk_counts[risk_level] = risk_counts.get(risk_level, 0) + 1
+        with self._stats_lock:
+            self._evict_expired_stats(datetime.now() - timedelta(hours=24))
+            total_actions = self._total_actions
+            recent_actions = list(reversed(self._recent_actions))
+            type_counts = dict(self._by_type_24h)
+            risk_counts = dict(self._by_risk_24h)
         
         return {
             "total_actions": total_actions,
@@ -346,7 +604,7 @@ class TransparentReportingSystem:
                 for action in recent_actions
             ],
             "last_24h_counts": {
-                "total": len(recent_24h),
+                "total": sum(type_counts.values()),
                 "by_type": type_counts,
                 "by_risk": risk_counts
             },
@@ -358,49 +616,79 @@ class TransparentReportingSystem:
         Clean up old logs based on retention policy
         """
         try:
-            import tempfile
-            from datetime import timedelta
-            
             cutoff_date = datetime.now() - timedelta(days=retention_days)
+            cutoff_iso = cutoff_date.isoformat()
             
-            # Create temporary files for filtered logs
+            # Create temporary file for the filtered log
             temp_action_log = self.log_dir / "temp_action.log"
-            temp_summary_log = self.log_dir / "temp_summary.log"
-            
-            # Filter action log
-            with open(self.action_log_path, 'r', encoding='utf-8') as input_file, \
-                 open(temp_action_log, 'w', encoding='utf-8') as output_file:
-                for line in input_file:
-                    if line.strip():
-                        try:
-                            data = json.loads(line)
-                            timestamp = datetime.fromisoformat(data['timestamp'])
-                            if timestamp >= cutoff_date:
-                                output_file.write(line)
-                        except Exception:
-                            continue  # Skip malformed entries
-            
-            # Filter summary log
-            with open(self.summary_log_path, 'r', encoding='utf-8') as input_file, \
-                 open(temp_summary_log, 'w', encoding='utf-8') as output_file:
-                for line in input_file:
-                    if line.strip():
-                        try:
-                            data = json.loads(line)
-                            timestamp = datetime.fromisoformat(data['timestamp'])
-                            if timestamp >= cutoff_date:
-                                output_file.write(line)
-                        except Exception:
-                            continue  # Skip malformed entries
             
-            # Replace original files with filtered ones
-            temp_action_log.replace(self.action_log_path)
-            temp_summary_log.replace(self.summary_log_path)
+            self.flush()
+            with self._write_lock:
+                # Copy the retained tail of the log and swap it in
+                self._action_fh.flush()
+                self._copy_retained_tail(self.action_log_path, temp_action_log, cutoff_iso)
+                self._close_handles()
+                try:
+                    temp_action_log.replace(self.action_log_path)
+                finally:
+                    self._open_handles()
+                self._db.execute("DELETE FROM actions WHERE timestamp < ?", (cutoff_date.timestamp(),))
+            self._load_dashboard_stats()
             
             self.logger.info(f"Log cleanup completed. Retained logs from {cutoff_date.date()} onwards")
         except Exception as e:
             self.logger.error(f"Error during log cleanup: {e}")
 
+    @staticmethod
+    def _find_cutoff_offset(path: Path, cutoff_iso: str) -> int:
+        """
+        Find the byte offset of the first line logged at or after the cutoff.
+        
+        The logs are append-only with monotonically increasing timestamps, so
+        the retained entries form a contiguous tail that can be located by
+        binary search over byte offsets instead of parsing every line.
+        """
+        cutoff = cutoff_iso.encode('utf-8')
+        
+        def next_timestamp(f) -> tuple:
+            """Return the start offset and timestamp of the next parseable line"""
+            while True:
+                start = f.tell()
+                line = f.readline()
+                if not line:
+                    return start, None
+                match = _TIMESTAMP_FIELD.search(line)
+                if match:
+                    return start, match.group(1)
+        
+        with open(path, 'rb') as f:
+            # Invariant: every line before `low` is older than the cutoff
+            low, high = 0, os.fstat(f.fileno()).st_size
+            while high - low > _CLEANUP_SCAN_BYTES:
+                mid = (low + high) // 2
+                f.seek(mid)
+                f.readline()  # Skip the partial line
+                start, timestamp = next_timestamp(f)
+                if timestamp is None or timestamp >= cutoff:
+                    high = mid
+                else:
+                    low = start
+            
+            # Scan forward over the remaining window
+            f.seek(low)
+            while True:
+                start, timestamp = next_timestamp(f)
+                if timestamp is None or timestamp >= cutoff:
+                    return start
+
+    @classmethod
+    def _copy_retained_tail(cls, source: Path, target: Path, cutoff_iso: str):
+        """Copy the lines logged at or after the cutoff from source to target"""
+        offset = cls._find_cutoff_offset(source, cutoff_iso)
+        with open(source, 'rb') as input_file, open(target, 'wb') as output_file:
+            input_file.seek(offset)
+            shutil.copyfileobj(input_file, output_file, length=1 << 20)
+
 
 class ReportingManager:
     """
@@ -465,4 +753,10 @@ class ReportingManager:
         """
         Clean up old logs
         """
-        self.reporting_system.cleanup_logs(retention_days=retention_days)
\ No newline at end of file
+        self.reporting_system.cleanup_logs(retention_days=retention_days)
+
+    def close(self):
+        """
+        Flush and close the reporting log files
+        """
+        self.reporting_system.close()
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+import re
 from typing import List
 
 LOGGER = logging.getLogger(__name__)
@@ -12,11 +13,13 @@ class SafetyGuard:
 
     def __init__(self, restricted_keywords: List[str] | None = None) -> None:
         self._restricted_keywords = set(restricted_keywords or ["rm -rf", "shutdown"])
+        # Longest keywords first so overlapping matches report the most specific one
+        ordered = sorted(self._restricted_keywords, key=len, reverse=True)
+        self._pattern = re.compile("|".join(map(re.escape, ordered)), re.IGNORECASE)
 
     def approve_goal(self, goal: str) -> bool:
-        lowered = goal.lower()
-        for keyword in self._restricted_keywords:
-            if keyword in lowered:
-                LOGGER.warning("Goal rejected due to restricted keyword: %s", keyword)
-                return False
+        match = self._pattern.search(goal)
+        if match is not None:
+            LOGGER.warning("Goal rejected due to restricted keyword: %s", match.group(0).lower())
+            return False
         return True
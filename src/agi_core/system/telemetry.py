@@ -3,21 +3,113 @@ from __future__ import annotations
 
 import logging
 import os
+import threading
+import time
+from collections import deque
 import psutil
-from typing import Dict
+from typing import Deque, Dict, List, Optional, Tuple
 
 LOGGER = logging.getLogger(__name__)
 
 
 class TelemetryCollector:
-    """Collects lightweight system metrics."""
+    """Collects lightweight system metrics.
+
+    Counting open files walks every descriptor of the process, so that
+    metric is cached for ``open_files_ttl`` seconds while memory is sampled
+    on every snapshot. After :meth:`start`, CPU usage is sampled by a
+    background thread every ``cpu_sample_interval`` seconds and snapshots
+    read the latest value; otherwise it is measured since the previous call.
+    The latest ``buffer_size`` snapshots are kept so consumers can ship them
+    in bulk with :meth:`drain`.
+    """
+
+    def __init__(
+        self,
+        open_files_ttl: float = 5.0,
+        cpu_sample_interval: float = 1.0,
+        buffer_size: int = 1024,
+    ) -> None:
+        self._process = psutil.Process(os.getpid())
+        self._open_files_ttl = open_files_ttl
+        self._of_cache: Optional[Tuple[float, int]] = None
+        self._cpu_sample_interval = cpu_sample_interval
+        self._cpu: Optional[float] = None
+        self._stop = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+        self._buffer: Deque[Dict[str, float]] = deque(maxlen=buffer_size)
+        self._buf_lock = threading.Lock()
+
+    def start(self) -> None:
+        """Start sampling CPU usage in a background thread."""
+        if self._sampler is not None and self._sampler.is_alive():
+            return
+        self._stop.clear()
+        self._sampler = threading.Thread(target=self._sample_loop, name="telemetry-cpu", daemon=True)
+        self._sampler.start()
+
+    def close(self) -> None:
+        """Stop the background CPU sampler."""
+        self._stop.set()
+        if self._sampler is not None:
+            self._sampler.join()
+            self._sampler = None
+        self._cpu = None
+
+    def _sample_loop(self) -> None:
+        psutil.cpu_percent(interval=None)
+        while not self._stop.wait(self._cpu_sample_interval):
+            self._cpu = psutil.cpu_percent(interval=None)
+
+    def _current_process(self) -> psutil.Process:
+        # Rebuild the handle after a fork so metrics describe this process
+        if self._process.pid != os.getpid():
+            self._process = psutil.Process(os.getpid())
+            self._of_cache = None
+        return self._process
+
+    def _process_metrics(self, now: float):
+        process = self._current_process()
+        cached = self._of_cache
+        # Read the per-process /proc files once for all metrics
+        with process.oneshot():
+            memory_info = process.memory_info()
+            if cached is not None and now - cached[0] < self._open_files_ttl:
+                return memory_info, cached[1]
+            open_files = len(process.open_files())
+        self._of_cache = (now, open_files)
+        return memory_info, open_files
+
+    def refresh_open_files(self) -> int:
+        """Recount open files now, bypassing the cache."""
+        self._of_cache = None
+        return self._process_metrics(time.monotonic())[1]
 
     def snapshot(self) -> Dict[str, float]:
-        process = psutil.Process(os.getpid())
+        now = time.monotonic()
+        try:
+            memory_info, open_files = self._process_metrics(now)
+        except psutil.NoSuchProcess:
+            self._process = psutil.Process(os.getpid())
+            self._of_cache = None
+            memory_info, open_files = self._process_metrics(now)
+        cpu = self._cpu
+        if cpu is None:
+            cpu = psutil.cpu_percent(interval=None)
         metrics = {
-            "cpu_percent": psutil.cpu_percent(interval=None),
-            "memory_mb": process.memory_info().rss / (1024 * 1024),
-            "open_files": len(process.open_files()),
+            "cpu_percent": cpu,
+            "memory_mb": memory_info.rss / (1024 * 1024),
+            "open_files": open_files,
         }
-        LOGGER.debug("Telemetry snapshot: %s", metrics)
+        with self._buf_lock:
+            self._buffer.append(metrics)
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("Telemetry snapshot: %s", metrics)
         return metrics
+
+    def drain(self) -> List[Dict[str, float]]:
+        """Return and clear the buffered snapshots, oldest first."""
+        with self._buf_lock:
+            items = list(self._buffer)
+            self._buffer.clear()
+        return items
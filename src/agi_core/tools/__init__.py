@@ -1,7 +1,7 @@
 """
 AGI Core Tools Package
 """
-from .base import BaseTool, ToolError
+from .base import BaseTool, Tool, ToolContext, ToolError, ToolRegistry, ToolResult
 from .terminal import TerminalTool
 from .file_io import FileIOTool as FileTool
 from .browser import BrowserAutomationTool as BrowserTool
@@ -18,7 +18,11 @@ from .system_integration import (
 )
 
 __all__ = [
+    "Tool",
     "BaseTool",
+    "ToolContext",
+    "ToolResult",
+    "ToolRegistry",
     "ToolError",
     "TerminalTool",
     "FileTool",
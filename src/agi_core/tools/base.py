@@ -2,8 +2,14 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
-from typing import Dict, Optional
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping, Optional
 
 LOGGER = logging.getLogger(__name__)
 
@@ -13,7 +19,7 @@ class ToolError(Exception):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolResult:
     """Result returned by a tool."""
 
@@ -22,49 +28,143 @@ class ToolResult:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ToolContext:
     """Execution context supplied to tools."""
 
     working_directory: str
 
 
-class BaseTool:
-    """Base class for executable tools."""
+class Tool(ABC):
+    """Interface shared by every tool the registry can dispatch to.
+
+    Tools whose results depend only on their arguments can set ``cacheable``
+    so the registry memoizes successful runs, keeping up to ``cache_size``
+    results for ``cache_ttl`` seconds (0 keeps them until evicted).
+    """
+
+    name: str
+    description: str
+    cacheable: bool = False
+    cache_ttl: float = 0.0
+    cache_size: int = 256
+
+    @abstractmethod
+    def run(self, context: ToolContext, *args, **kwargs) -> ToolResult:
+        """Execute the tool within ``context``."""
+
+
+class BaseTool(Tool):
+    """Convenience base that turns ``_run`` return values and errors into results."""
 
     def __init__(self, name: str, description: str):
         self.name = name
         self.description = description
 
-    def run(self, **kwargs) -> ToolResult:
+    def run(self, context: Optional[ToolContext] = None, *args, **kwargs) -> ToolResult:
         """Execute the tool with the given arguments."""
         try:
-            result = self._run(**kwargs)
+            result = self._run(*args, **kwargs)
             return ToolResult(success=True, output=str(result))
         except Exception as e:
             return ToolResult(success=False, output="", error=str(e))
 
-    def _run(self, **kwargs):
+    def _run(self, *args, **kwargs):
         """Internal run method to be implemented by subclasses."""
         raise NotImplementedError
 
 
+def _memoize_run(tool: Tool) -> None:
+    """Wrap ``tool.run`` with a bounded LRU cache of successful results.
+
+    Callers always receive their own copy, so mutating a result cannot leak
+    into later cache hits.
+    """
+    run = tool.run
+    ttl = tool.cache_ttl
+    size = tool.cache_size
+    cache: OrderedDict = OrderedDict()
+    lock = threading.Lock()
+
+    def cached_run(*args, **kwargs) -> ToolResult:
+        try:
+            key = (args, frozenset(kwargs.items()))
+            hash(key)
+        except TypeError:
+            return run(*args, **kwargs)
+        now = time.monotonic()
+        with lock:
+            entry = cache.get(key)
+            if entry is not None:
+                if not ttl or now - entry[0] < ttl:
+                    cache.move_to_end(key)
+                    return replace(entry[1])
+                del cache[key]
+        result = run(*args, **kwargs)
+        if result.success:
+            with lock:
+                cache[key] = (now, replace(result))
+                if len(cache) > size:
+                    cache.popitem(last=False)
+        return result
+
+    def cache_clear() -> None:
+        with lock:
+            cache.clear()
+
+    tool.run = cached_run
+    tool.cache_clear = cache_clear
+
+
 class ToolRegistry:
     """Registry for tool plugins."""
 
     def __init__(self) -> None:
-        self._tools: Dict[str, BaseTool] = {}
-
-    def register(self, tool: BaseTool) -> None:
-        if tool.name in self._tools:
-            raise ValueError(f"Tool already registered: {tool.name}")
-        self._tools[tool.name] = tool
-        LOGGER.info("Registered tool: %s", tool.name)
-
-    def get(self, name: str) -> BaseTool:
-        if name not in self._tools:
-            raise KeyError(f"Unknown tool: {name}")
-        return self._tools[name]
+        self._tools: Dict[str, Tool] = {}
+        self._tools_view: Mapping[str, Tool] = MappingProxyType(self._tools)
+
+    def register(self, tool: Tool) -> None:
+        self.register_many((tool,))
+
+    def register_many(self, tools: Iterable[Tool]) -> None:
+        """Register several tools at once; nothing is registered on a name clash."""
+        tools = list(tools)
+        # Interned names let dispatch lookups compare by identity
+        for tool in tools:
+            tool.name = sys.intern(tool.name)
+        names = [tool.name for tool in tools]
+        duplicates = self._tools.keys() & names
+        if not duplicates and len(set(names)) != len(names):
+            duplicates = {name for name in names if names.count(name) > 1}
+        if duplicates:
+            raise ValueError(f"Tool already registered: {', '.join(sorted(duplicates))}")
+        for tool in tools:
+            if tool.cacheable and not hasattr(tool, "cache_clear"):
+                _memoize_run(tool)
+        self._tools.update(zip(names, tools))
+        if len(names) == 1:
+            LOGGER.info("Registered tool: %s", names[0])
+        elif names:
+            LOGGER.info("Registered %d tools: %s", len(names), ", ".join(names))
+
+    def unregister(self, name: str) -> Tool:
+        """Remove a tool, dropping any cached results it holds."""
+        try:
+            tool = self._tools.pop(name)
+        except KeyError:
+            raise KeyError(f"Unknown tool: {name}") from None
+        cache_clear = getattr(tool, "cache_clear", None)
+        if cache_clear is not None:
+            cache_clear()
+        LOGGER.info("Unregistered tool: %s", name)
+        return tool
+
+    def get(self, name: str) -> Tool:
+        try:
+            return self._tools[name]
+        except KeyError:
+            raise KeyError(f"Unknown tool: {name}") from None
 
-    def list_tools(self) -> Dict[str, BaseTool]:
-        return dict(self._tools)
+    def list_tools(self) -> Mapping[str, Tool]:
+        """Return a live read-only view of the registered tools."""
+        return self._tools_view
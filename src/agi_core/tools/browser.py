@@ -1,17 +1,31 @@
 """Browser automation tool powered by Playwright or Selenium."""
 from __future__ import annotations
 
+import atexit
+import inspect
 import json
 import logging
+import os
+import queue
+import threading
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
 from .base import BaseTool, ToolContext, ToolResult, ToolError
 
 LOGGER = logging.getLogger(__name__)
 
+try:  # pragma: no cover - optional faster JSON decoder
+    import orjson
+except ImportError:  # pragma: no cover - falls back to the stdlib decoder
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one except clause covers both
+_loads = orjson.loads if orjson is not None else json.loads
+
 try:  # pragma: no cover - import is validated in runtime checks
     from playwright.sync_api import Error as PlaywrightError
     from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
@@ -36,8 +50,130 @@ except ImportError:  # pragma: no cover - handled gracefully when missing
     EC = None  # type: ignore[assignment]
     WebDriverWait = None  # type: ignore[assignment]
 
+try:  # pragma: no cover - only available in newer Selenium releases
+    from selenium.webdriver.remote.client_config import ClientConfig
+except ImportError:  # pragma: no cover - older Selenium or missing dependency
+    ClientConfig = None  # type: ignore[assignment]
+
+
+POOL_SIZE = 2
+MAX_USES_PER_INSTANCE = 50
+SELENIUM_POOL_MAXSIZE = 20
+
+
+class _BrowserPool:
+    """Pool of launched Chromium instances shared across tool runs.
+
+    Launching a browser dominates the cost of a short run, so instances are
+    kept warm and each run gets its own cheap context instead. Slots start
+    empty and are launched lazily; an instance is closed after
+    ``max_uses`` runs and replaced on the next acquire.
+
+    Playwright's sync API only works on the thread that started it, so a
+    pool belongs to the thread that created it and refuses to hand out
+    browsers anywhere else. The tool keeps one pool per thread.
+    """
+
+    def __init__(self, headless: bool, size: Optional[int] = None, max_uses: Optional[int] = None) -> None:
+        self._headless = headless
+        self._max_uses = max_uses or MAX_USES_PER_INSTANCE
+        self._slots: "queue.Queue[Optional[list]]" = queue.Queue()
+        for _ in range(size or POOL_SIZE):
+            self._slots.put(None)
+        self._lock = threading.Lock()
+        self._manager = None
+        self._playwright = None
+        self._closed = False
+        self._owner = threading.get_ident()
+        atexit.register(self.close)
+
+    def acquire(self) -> list:
+        """Return a ``[browser, use_count]`` slot, launching if needed."""
+        if threading.get_ident() != self._owner:
+            raise PlaywrightError("Browser pool used outside the thread that created it")
+        slot = self._slots.get()
+        if slot is not None:
+            return slot
+        try:
+            return [self._ensure_playwright().chromium.launch(headless=self._headless), 0]
+        except BaseException:
+            self._slots.put(None)
+            raise
+
+    def release(self, slot: list, discard: bool = False) -> None:
+        """Return a slot, recycling its browser when worn out or broken."""
+        slot[1] += 1
+        if discard or self._closed or slot[1] >= self._max_uses:
+            self._close_browser(slot[0])
+            slot = None
+        self._slots.put(slot)
+
+    def close(self) -> None:
+        """Close idle browsers and stop Playwright."""
+        with self._lock:
+            self._closed = True
+            while True:
+                try:
+                    slot = self._slots.get_nowait()
+                except queue.Empty:
+                    break
+                if slot is not None:
+                    self._close_browser(slot[0])
+            if self._manager is not None:
+                try:
+                    self._manager.__exit__(None, None, None)
+                except Exception as exc:  # pragma: no cover - best effort cleanup
+                    LOGGER.debug("Failed to stop Playwright: %s", exc)
+                self._manager = None
+                self._playwright = None
+        atexit.unregister(self.close)
+
+    def _ensure_playwright(self):
+        with self._lock:
+            if self._closed:
+                raise PlaywrightError("Browser pool is closed")
+            if self._playwright is None:
+                manager = sync_playwright()  # type: ignore[operator]
+                self._playwright = manager.__enter__()
+                self._manager = manager
+            return self._playwright
+
+    @staticmethod
+    def _close_browser(browser) -> None:
+        try:
+            browser.close()
+        except Exception as exc:  # pragma: no cover - best effort cleanup
+            LOGGER.debug("Failed to close pooled browser: %s", exc)
+
+
+@lru_cache(maxsize=256)
+def _check_url_policy(raw_url: str, allow_network: bool, allowed_origins: Tuple[str, ...]) -> Optional[str]:
+    """Validate ``raw_url`` against the network policy.
+
+    The policy is passed explicitly so cached results never outlive a
+    configuration change. Returns ``None`` for ``file`` URLs, whose sandbox
+    check depends on the filesystem and must be repeated on every call.
+    """
+    # Lower-case http(s) and file URLs are classified without urlparse
+    if raw_url.startswith("file://"):
+        return None
+    if not raw_url.startswith(("http://", "https://")):
+        scheme = urlparse(raw_url).scheme
+        if scheme == "file":
+            return None
+        if scheme not in {"http", "https"}:
+            raise ValueError(f"Unsupported URL scheme for browser automation: {scheme}")
+
+    if not allow_network:
+        raise ValueError("Network browsing is disabled by configuration")
+
+    if allowed_origins and not raw_url.startswith(allowed_origins):
+        raise ValueError("URL is not permitted by the allowed_origins list")
+
+    return raw_url
 
-@dataclass
+
+@dataclass(slots=True)
 class BrowserAction:
     """Representation of a minimal browser action."""
 
@@ -46,9 +182,25 @@ class BrowserAction:
     value: Optional[str] = None
 
 
+def _selenium_fill(element, action: BrowserAction) -> None:
+    element.clear()
+    element.send_keys(action.value or "")
+
+
 class BrowserAutomationTool(BaseTool):
     """Execute simple headless browser workflows via Playwright or Selenium."""
 
+    _PW_ACTIONS = {
+        "click": lambda page, action: page.click(action.selector),
+        "fill": lambda page, action: page.fill(action.selector, action.value or ""),
+        "press": lambda page, action: page.press(action.selector, action.value),
+    }
+    _SELENIUM_ACTIONS = {
+        "click": lambda element, action: element.click(),
+        "fill": _selenium_fill,
+        "press": lambda element, action: element.send_keys(action.value),
+    }
+
     def __init__(
         self,
         *,
@@ -65,11 +217,35 @@ class BrowserAutomationTool(BaseTool):
             " screenshots, and extract text."
         ))
         self._sandbox_root = Path(sandbox_root).resolve()
+        self._sandbox_str = os.fspath(self._sandbox_root)
+        self._sandbox_prefix = os.path.join(self._sandbox_str, "")
         self._allow_network = allow_network
-        self._allowed_origins: List[str] = list(allowed_origins)
+        self._allowed_origins: Tuple[str, ...] = tuple(allowed_origins)
         self._headless = headless
         self._timeout_ms = default_timeout_ms
         self._backend = backend.lower()
+        # Playwright pools keyed by the thread that owns them
+        self._pools: Dict[int, _BrowserPool] = {}
+        self._pool_lock = threading.Lock()
+        self._driver = None
+        self._driver_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Release pooled browsers and the Selenium driver held by the tool."""
+        with self._pool_lock:
+            pools, self._pools = list(self._pools.values()), {}
+        for pool in pools:
+            pool.close()
+        with self._driver_lock:
+            self._quit_driver()
+
+    def _browser_pool(self) -> _BrowserPool:
+        owner = threading.get_ident()
+        with self._pool_lock:
+            pool = self._pools.get(owner)
+            if pool is None:
+                pool = self._pools[owner] = _BrowserPool(self._headless)
+            return pool
 
     # ------------------------------------------------------------------
     def _run(self, *args: str, **kwargs: str) -> str:
@@ -77,7 +253,7 @@ class BrowserAutomationTool(BaseTool):
             raise ToolError("Browser instructions must be supplied as JSON")
 
         try:
-            payload = json.loads(args[0])
+            payload = _loads(args[0])
         except json.JSONDecodeError as exc:
             raise ToolError(f"Invalid browser instruction JSON: {exc}")
 
@@ -148,11 +324,19 @@ class BrowserAutomationTool(BaseTool):
             )
 
         extracted_text: Optional[str] = None
+        pool = self._browser_pool()
+
+        try:
+            slot = pool.acquire()
+        except PlaywrightError as exc:
+            return ToolResult(False, "", f"Playwright error: {exc}")
 
+        discard = True
         try:
-            with sync_playwright() as playwright:  # type: ignore[operator]
-                browser = playwright.chromium.launch(headless=self._headless)
-                page = browser.new_page()
+            # A fresh context per run keeps cookies and storage isolated
+            context = slot[0].new_context()
+            try:
+                page = context.new_page()
                 page.set_default_timeout(self._timeout_ms)
                 page.goto(url, wait_until="load", timeout=self._timeout_ms)
 
@@ -168,12 +352,16 @@ class BrowserAutomationTool(BaseTool):
                 if screenshot_target is not None:
                     screenshot_target.parent.mkdir(parents=True, exist_ok=True)
                     page.screenshot(path=str(screenshot_target), full_page=True)
-
-                browser.close()
+            finally:
+                context.close()
+            discard = False
         except PlaywrightTimeoutError as exc:
+            discard = False
             return ToolResult(False, "", f"Playwright timeout: {exc}")
         except PlaywrightError as exc:
             return ToolResult(False, "", f"Playwright error: {exc}")
+        finally:
+            pool.release(slot, discard=discard)
 
         fragments = [f"Navigated to {url}"]
         if extracted_text is not None:
@@ -205,44 +393,37 @@ class BrowserAutomationTool(BaseTool):
         extracted_text: Optional[str] = None
         timeout_sec = max(self._timeout_ms / 1000.0, 0.1)
 
-        options = None
-        if hasattr(webdriver, "ChromeOptions"):
-            options = webdriver.ChromeOptions()
-            if self._headless:
-                options.add_argument("--headless=new")
-        kwargs = {"options": options} if options is not None else {}
+        with self._driver_lock:
+            try:
+                browser = self._get_driver(timeout_sec)
+            except WebDriverException as exc:
+                return ToolResult(False, "", f"Failed to start Selenium driver: {exc}")
 
-        try:
-            browser = webdriver.Chrome(**kwargs)  # type: ignore[call-arg]
-        except WebDriverException as exc:
-            return ToolResult(False, "", f"Failed to start Selenium driver: {exc}")
+            try:
+                browser.get(url)
 
-        try:
-            if hasattr(browser, "set_page_load_timeout"):
-                browser.set_page_load_timeout(timeout_sec)
-            browser.get(url)
-
-            if wait_for:
-                WebDriverWait(browser, timeout_sec).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, wait_for))
-                )
-
-            for action in actions:
-                self._execute_selenium_action(browser, action)
-
-            if extract_selector:
-                element = browser.find_element(By.CSS_SELECTOR, extract_selector)
-                extracted_text = element.text.strip()
-
-            if screenshot_target is not None:
-                screenshot_target.parent.mkdir(parents=True, exist_ok=True)
-                browser.save_screenshot(str(screenshot_target))
-        except SeleniumTimeoutError as exc:
-            return ToolResult(False, "", f"Selenium timeout: {exc}")
-        except WebDriverException as exc:
-            return ToolResult(False, "", f"Selenium error: {exc}")
-        finally:
-            browser.quit()
+                if wait_for:
+                    WebDriverWait(browser, timeout_sec).until(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, wait_for))
+                    )
+
+                for action in actions:
+                    self._execute_selenium_action(browser, action)
+
+                if extract_selector:
+                    element = browser.find_element(By.CSS_SELECTOR, extract_selector)
+                    extracted_text = element.text.strip()
+
+                if screenshot_target is not None:
+                    screenshot_target.parent.mkdir(parents=True, exist_ok=True)
+                    browser.save_screenshot(str(screenshot_target))
+            except SeleniumTimeoutError as exc:
+                self._reset_driver(browser)
+                return ToolResult(False, "", f"Selenium timeout: {exc}")
+            except WebDriverException as exc:
+                self._quit_driver()
+                return ToolResult(False, "", f"Selenium error: {exc}")
+            self._reset_driver(browser)
 
         fragments = [f"Navigated to {url}"]
         if extracted_text is not None:
@@ -254,49 +435,109 @@ class BrowserAutomationTool(BaseTool):
 
         return ToolResult(True, "\n".join(fragments))
 
-    # ------------------------------------------------------------------
-    def _validate_url(self, raw_url: str) -> str:
-        parsed = urlparse(raw_url)
-        if parsed.scheme == "file":
-            candidate = Path(parsed.path or parsed.netloc).resolve()
-            if not candidate.is_file():
-                raise ValueError(f"Sandbox file not found: {candidate}")
-            if not candidate.is_relative_to(self._sandbox_root):
-                raise ValueError("Browser navigation outside sandbox is not permitted")
-            return candidate.as_uri()
+    def _get_driver(self, timeout_sec: float):
+        """Return the shared Chrome driver, starting it on first use.
+
+        Callers must hold ``_driver_lock``.
+        """
+        if self._driver is not None:
+            return self._driver
+
+        options = None
+        if hasattr(webdriver, "ChromeOptions"):
+            options = webdriver.ChromeOptions()
+            if self._headless:
+                options.add_argument("--headless=new")
+        kwargs = {"options": options} if options is not None else {}
+        client_config = self._selenium_client_config()
+        if client_config is not None:
+            kwargs["client_config"] = client_config
+
+        driver = webdriver.Chrome(**kwargs)  # type: ignore[call-arg]
+        if hasattr(driver, "set_page_load_timeout"):
+            driver.set_page_load_timeout(timeout_sec)
+        atexit.register(driver.quit)
+        self._driver = driver
+        return driver
+
+    def _reset_driver(self, driver) -> None:
+        """Clear session state so the next run starts from a blank page."""
+        try:
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+        except WebDriverException as exc:
+            LOGGER.debug("Discarding Selenium driver after failed reset: %s", exc)
+            self._quit_driver()
 
-        if parsed.scheme not in {"http", "https"}:
-            raise ValueError(f"Unsupported URL scheme for browser automation: {parsed.scheme}")
+    def _quit_driver(self) -> None:
+        driver, self._driver = self._driver, None
+        if driver is None:
+            return
+        atexit.unregister(driver.quit)
+        try:
+            driver.quit()
+        except WebDriverException as exc:  # pragma: no cover - best effort cleanup
+            LOGGER.debug("Failed to quit Selenium driver: %s", exc)
 
-        if not self._allow_network:
-            raise ValueError("Network browsing is disabled by configuration")
+    @staticmethod
+    def _selenium_client_config():
+        """Build a client config with a larger urllib3 pool, when supported.
+
+        The default pool holds a single connection, which serializes
+        concurrent WebDriver commands and logs "Connection pool is full".
+        """
+        if ClientConfig is None:
+            return None
+        try:
+            if "client_config" not in inspect.signature(webdriver.Chrome).parameters:
+                return None
+            return ClientConfig(
+                remote_server_addr=None,
+                init_args_for_pool_manager={"maxsize": SELENIUM_POOL_MAXSIZE},
+            )
+        except (TypeError, ValueError) as exc:
+            LOGGER.debug("Selenium client config unavailable: %s", exc)
+            return None
 
-        if self._allowed_origins:
-            if not any(raw_url.startswith(prefix) for prefix in self._allowed_origins):
-                raise ValueError("URL is not permitted by the allowed_origins list")
+    # ------------------------------------------------------------------
+    def _validate_url(self, raw_url: str) -> str:
+        normalized = _check_url_policy(raw_url, self._allow_network, self._allowed_origins)
+        if normalized is not None:
+            return normalized
 
-        return raw_url
+        if raw_url.startswith("file:///") and "?" not in raw_url and "#" not in raw_url:
+            local_path = raw_url[7:]
+        else:
+            parsed = urlparse(raw_url)
+            local_path = parsed.path or parsed.netloc
+        candidate = os.path.realpath(local_path)
+        if not os.path.isfile(candidate):
+            raise ValueError(f"Sandbox file not found: {candidate}")
+        if not self._within_sandbox(candidate):
+            raise ValueError("Browser navigation outside sandbox is not permitted")
+        return Path(candidate).as_uri()
 
     # ------------------------------------------------------------------
     def _resolve_path(self, candidate: Path) -> Path:
         resolved = (self._sandbox_root / candidate).resolve()
-        if not resolved.is_relative_to(self._sandbox_root):
+        if not self._within_sandbox(resolved):
             raise ValueError("Screenshot path must remain within sandbox")
         return resolved
 
+    def _within_sandbox(self, path: Union[str, Path]) -> bool:
+        path_str = os.fspath(path)
+        return path_str == self._sandbox_str or path_str.startswith(self._sandbox_prefix)
+
     # ------------------------------------------------------------------
     @staticmethod
     def _execute_action(page, action: BrowserAction) -> None:  # pragma: no cover - thin wrapper
         """Execute a constrained action against a Playwright page."""
 
-        if action.type == "click" and action.selector:
-            page.click(action.selector)
-        elif action.type == "fill" and action.selector is not None:
-            page.fill(action.selector, action.value or "")
-        elif action.type == "press" and action.selector and action.value:
-            page.press(action.selector, action.value)
-        else:
+        handler = BrowserAutomationTool._PW_ACTIONS.get(action.type)
+        if handler is None or not action.selector or (action.type == "press" and not action.value):
             LOGGER.warning("Skipping unsupported browser action: %s", action)
+            return
+        handler(page, action)
 
     # ------------------------------------------------------------------
     @staticmethod
@@ -308,18 +549,15 @@ class BrowserAutomationTool(BaseTool):
             LOGGER.warning("Skipping Selenium action missing selector: %s", action)
             return
 
+        handler = BrowserAutomationTool._SELENIUM_ACTIONS.get(action.type)
+        if handler is None or (action.type == "press" and not action.value):
+            LOGGER.warning("Skipping unsupported Selenium action: %s", action)
+            return
+
         try:
             element = browser.find_element(By.CSS_SELECTOR, action.selector)
         except WebDriverException as exc:  # pragma: no cover - runtime failure path
             LOGGER.warning("Selenium action failed (%s): %s", action.type, exc)
             return
 
-        if action.type == "click":
-            element.click()
-        elif action.type == "fill":
-            element.clear()
-            element.send_keys(action.value or "")
-        elif action.type == "press" and action.value:
-            element.send_keys(action.value)
-        else:
-            LOGGER.warning("Skipping unsupported Selenium action: %s", action)
+        handler(element, action)
@@ -1,7 +1,10 @@
 """File read/write tool."""
 from __future__ import annotations
 
+import codecs
+import io
 import logging
+import os
 from pathlib import Path
 
 from .base import BaseTool, ToolContext, ToolResult, ToolError
@@ -9,6 +12,39 @@ from .base import BaseTool, ToolContext, ToolResult, ToolError
 LOGGER = logging.getLogger(__name__)
 
 
+def _resolve_target(base: str, target: str) -> str:
+    """Resolve ``target`` relative to ``base``.
+
+    The full path is resolved on every call; a cached directory resolution
+    would keep approving a path after the directory is swapped for a symlink.
+    """
+    return os.path.realpath(os.path.join(base, target))
+
+
+_READ_CHUNK_SIZE = 1 << 16
+
+
+def _read_utf8(path: Path) -> str:
+    """Read a UTF-8 text file in fixed-size chunks.
+
+    Decoding incrementally avoids holding the whole raw byte string next to
+    the decoded text. Newlines are translated like ``Path.read_text``.
+    """
+    decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder("utf-8")(), translate=True)
+    parts = []
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        while True:
+            chunk = os.read(fd, _READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            parts.append(decoder.decode(chunk))
+    finally:
+        os.close(fd)
+    parts.append(decoder.decode(b"", final=True))
+    return "".join(parts)
+
+
 class FileIOTool(BaseTool):
     """Tool for interacting with files inside the sandbox."""
 
@@ -16,6 +52,9 @@ class FileIOTool(BaseTool):
         super().__init__("file.io", "Read or write files in the sandboxed workspace.")
         self._sandbox_root = sandbox_root.resolve()
         self._sandbox_root.mkdir(parents=True, exist_ok=True)
+        self._sandbox_str = os.fspath(self._sandbox_root)
+        # Trailing separator so "/sandbox-other" does not match "/sandbox"
+        self._sandbox_prefix = os.path.join(self._sandbox_str, "")
 
     def _run(self, *args: str, **kwargs: str) -> str:
         action = kwargs.get("action") or (args[0] if args else None)
@@ -26,22 +65,29 @@ class FileIOTool(BaseTool):
         if not target:
             raise ToolError("Missing path")
 
-        path = Path(target).resolve()
-        if not str(path).startswith(str(self._sandbox_root)):
+        path_str = _resolve_target(self._sandbox_str, str(target))
+        if path_str != self._sandbox_str and not path_str.startswith(self._sandbox_prefix):
             raise ToolError("Path outside sandbox")
+        path = Path(path_str)
 
         if action == "read":
             if not path.exists():
                 raise ToolError("File not found")
-            content = path.read_text(encoding="utf-8")
-            LOGGER.debug("Read file %s", path)
+            content = _read_utf8(path)
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug("Read file %s", path)
             return content
 
         # write
         data = kwargs.get("data") or (args[2] if len(args) > 2 else None)
         if data is None:
             raise ToolError("Missing data for write")
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(str(data), encoding="utf-8")
-        LOGGER.debug("Wrote file %s", path)
+        try:
+            path.write_text(str(data), encoding="utf-8")
+        except FileNotFoundError:
+            # Only create missing parents on demand to avoid a mkdir per write
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(str(data), encoding="utf-8")
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("Wrote file %s", path)
         return f"Wrote {len(str(data))} characters"
@@ -1,30 +1,151 @@
 """REST client tool for interacting with HTTP APIs."""
 from __future__ import annotations
 
+import codecs
+import http.cookiejar
 import json
 import logging
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Iterable, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 from urllib.parse import urlparse
 
-try:  # pragma: no cover - runtime dependency check
-    import requests
-except ImportError:  # pragma: no cover
-    requests = None  # type: ignore[assignment]
+from .base import BaseTool, ToolContext, ToolResult, ToolError
+
+try:  # pragma: no cover - optional faster JSON codec
+    import orjson
+except ImportError:  # pragma: no cover - falls back to the stdlib codec
+    orjson = None
+
+# requests pulls in urllib3, idna and certifi, so it is imported on first use
+requests = None  # type: ignore[assignment]
+_requests_missing = False
 
 
 class _RequestException(Exception):
     pass
 
 
-RequestException = (
-    requests.RequestException if requests is not None else _RequestException
-)
+RequestException = _RequestException
+
+
+def _get_requests():
+    """Import requests on first use; returns ``None`` when it is not installed."""
+    global requests, RequestException, _requests_missing
+    if requests is None and not _requests_missing:
+        try:
+            import requests as module
+        except ImportError:  # pragma: no cover - exercised when dependency missing
+            _requests_missing = True
+        else:
+            requests = module
+            RequestException = module.RequestException
+    return requests
 
-from .base import BaseTool, ToolContext, ToolResult, ToolError
 
 LOGGER = logging.getLogger(__name__)
 
+_ALLOWED_METHODS = frozenset({"GET", "POST", "PUT", "PATCH", "DELETE", "HEAD"})
+_ALLOWED_SCHEMES = frozenset({"http", "https"})
+_PREVIEW_CHARS = 4000
+# Enough bytes for the character preview even when every character is 4 bytes long
+_PREVIEW_BYTES = 4 * _PREVIEW_CHARS
+_STREAM_CHUNK_SIZE = 1 << 16
+_BATCH_WORKERS = 8
+_SAVE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+# Plain "scheme://host[:port]" prefixes; anything else (userinfo, IPv6, IDN) goes through urlparse
+_SIMPLE_HTTP_URL = re.compile(r"https?://([A-Za-z0-9.-]+)(?::\d*)?(?:[/?#]|$)")
+# Scheme plus authority: everything urlparse needs to find the host
+_URL_ORIGIN = re.compile(r"[^:/?#]*:(?://[^/?#]*)?")
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one except clause covers both
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _url_host(url: str) -> str:
+    """Return the lower-cased host of an http(s) URL."""
+    match = _SIMPLE_HTTP_URL.match(url)
+    if match is not None:
+        return match.group(1).lower()
+    origin = _URL_ORIGIN.match(url)
+    return _origin_host(origin.group(0) if origin is not None else url)
+
+
+@lru_cache(maxsize=1024)
+def _origin_host(origin: str) -> str:
+    """Parse the host from a URL's scheme and authority.
+
+    Keyed on the origin rather than the full URL, so calls that only vary the
+    path or query reuse one entry.
+    """
+    parsed = urlparse(origin)
+    if parsed.scheme not in _ALLOWED_SCHEMES:
+        raise ValueError("REST client only supports http/https URLs")
+    return (parsed.hostname or "").lower()
+
+
+def _open_for_save(path: str) -> int:
+    """Open ``path`` for writing, creating missing parent directories on demand."""
+    try:
+        return os.open(path, _SAVE_FLAGS, 0o666)
+    except FileNotFoundError:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        return os.open(path, _SAVE_FLAGS, 0o666)
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+_preview_buffers = threading.local()
+
+
+def _preview_buffer() -> memoryview:
+    """Return this thread's reusable preview buffer."""
+    view = getattr(_preview_buffers, "view", None)
+    if view is None:
+        view = _preview_buffers.view = memoryview(bytearray(_PREVIEW_BYTES))
+    return view
+
+
+def _decode_preview(data: bytes, encoding: Optional[str]) -> str:
+    """Decode the leading bytes of a body into the text preview."""
+    try:
+        decoder = codecs.getincrementaldecoder(encoding or "utf-8")(errors="replace")
+    except LookupError:
+        # Unknown charset declared by the server
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    # Not final: a character cut off at the preview boundary is dropped
+    return decoder.decode(data)[:_PREVIEW_CHARS]
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize the response summary as indented JSON."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(obj, indent=2)
+
+
+@dataclass(slots=True)
+class _PreparedRequest:
+    """A validated instruction ready to be sent."""
+
+    method: str
+    url: str
+    headers: Optional[Dict[str, str]]
+    kwargs: Dict[str, Any]
+    destination: Optional[str]
+    max_bytes: Optional[int]
+    graphql: bool
+
 
 class RestClientTool(BaseTool):
     """Perform HTTP requests with sandbox-aware restrictions."""
@@ -44,50 +165,124 @@ class RestClientTool(BaseTool):
             " and optional sandboxed persistence of responses."
         ))
         self._allow_network = allow_network
-        self._allowed_hosts = {host.lower() for host in allowed_hosts}
+        self._allowed_hosts = frozenset(host.lower() for host in allowed_hosts)
         self._default_headers = dict(default_headers or {})
+        self._default_header_keys = frozenset(key.lower() for key in self._default_headers)
         self._auth_token = auth_token
         self._timeout = default_timeout
         self._sandbox_root = Path(sandbox_root).resolve()
+        self._sandbox_root_str = os.fspath(self._sandbox_root)
+        self._sandbox_root_prefix = os.path.join(self._sandbox_root_str, "")
+        self._session = None
+        # Checking the network flag first avoids importing requests when it is unusable
+        if not allow_network:
+            self._unavailable = "Network access is disabled for REST client"
+        elif _get_requests() is None:
+            self._unavailable = "The requests package is not installed; install it to enable REST access."
+        else:
+            self._unavailable = None
+            self._session = self._build_session()
+        if self._unavailable is not None:
+            # The configuration is fixed, so every call would fail the same way
+            self._run = self._refuse
 
-    # ------------------------------------------------------------------
-    def _run(self, *args: str, **kwargs: str) -> str:
-        if requests is None:
-            raise ToolError(
-                "The requests package is not installed; install it to enable REST access."
-            )
+    def _build_session(self):
+        """Create a pooled session carrying the default headers.
+
+        Reusing one session keeps connections alive between calls instead of
+        paying a fresh TCP and TLS handshake per request.
+        """
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        # Calls are independent, as with one-off requests; a shared jar would
+        # replay one call's Set-Cookie on every later call to that host
+        session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+        session.headers.update(self._default_headers)
+        if self._auth_token and "authorization" not in self._default_header_keys:
+            session.headers["Authorization"] = self._auth_token
+        return session
 
-        if not self._allow_network:
-            raise ToolError("Network access is disabled for REST client")
+    def _refuse(self, *args: str, **kwargs: str) -> str:
+        raise ToolError(self._unavailable)
 
+    def close(self) -> None:
+        """Close pooled connections held by the tool."""
+        session, self._session = self._session, None
+        if session is not None:
+            session.close()
+
+    # ------------------------------------------------------------------
+    def _run(self, *args: str, **kwargs: str) -> str:
         if not args:
             raise ToolError("REST client expects a JSON instruction")
+        return self._send(self._prepare(args[0]))
+
+    def run_batch(self, context: Optional[ToolContext], instructions: Sequence[str]) -> List[ToolResult]:
+        """Send several independent instructions concurrently over the shared session.
+
+        Every instruction is parsed and validated before anything is sent;
+        invalid ones get a failed result while the rest are still dispatched.
+        Results are returned in instruction order.
+        """
+        if self._unavailable is not None:
+            return [ToolResult(False, "", self._unavailable) for _ in instructions]
+
+        results: List[Optional[ToolResult]] = [None] * len(instructions)
+        pending: List[Tuple[int, _PreparedRequest]] = []
+        for index, instruction in enumerate(instructions):
+            try:
+                pending.append((index, self._prepare(instruction)))
+            except ToolError as exc:
+                results[index] = ToolResult(False, "", str(exc))
+
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(_BATCH_WORKERS, len(pending))) as executor:
+                sent = executor.map(lambda item: self._send_result(item[1]), pending)
+                for (index, _), result in zip(pending, sent):
+                    results[index] = result
+        return results  # type: ignore[return-value]
+
+    def _send_result(self, prepared: "_PreparedRequest") -> ToolResult:
+        try:
+            return ToolResult(True, self._send(prepared))
+        except Exception as exc:
+            return ToolResult(False, "", str(exc))
 
+    def _prepare(self, instruction: str) -> "_PreparedRequest":
+        """Parse and validate one JSON instruction without touching the network."""
         try:
-            payload = json.loads(args[0])
+            payload = _loads(instruction)
         except json.JSONDecodeError as exc:
             raise ToolError(f"Invalid REST instruction JSON: {exc}")
+        if not isinstance(payload, dict):
+            raise ToolError("REST instruction must be a JSON object")
 
         url = payload.get("url")
         if not url:
             raise ToolError("Missing required 'url' field")
 
         graphql_payload = payload.get("graphql")
-        method = str(payload.get("method", "POST" if graphql_payload else "GET")).upper()
-        if method not in {"GET", "POST", "PUT", "PATCH", "DELETE", "HEAD"}:
-            raise ToolError(f"Unsupported HTTP method: {method}")
+        if graphql_payload is not None and not isinstance(graphql_payload, dict):
+            raise ToolError("'graphql' must be a JSON object")
+        method = payload.get("method", "POST" if graphql_payload else "GET")
+        # Methods usually arrive upper-cased already; normalize only on a miss
+        if type(method) is not str or method not in _ALLOWED_METHODS:
+            method = str(method).upper()
+            if method not in _ALLOWED_METHODS:
+                raise ToolError(f"Unsupported HTTP method: {method}")
 
         try:
             self._validate_url(url)
         except ValueError as exc:
             raise ToolError(str(exc))
 
-        headers = {**self._default_headers, **payload.get("headers", {})}
-        if graphql_payload:
-            headers.setdefault("Content-Type", "application/json")
-
-        if self._auth_token and not any(key.lower() == "authorization" for key in headers):
-            headers.setdefault("Authorization", self._auth_token)
+        # Defaults and the auth token live on the session; these override them.
+        # requests merges into a new dict, so the payload's mapping is passed as is
+        headers = payload.get("headers")
+        if graphql_payload and "content-type" not in self._default_header_keys:
+            headers = {"Content-Type": "application/json", **(headers or {})}
 
         request_kwargs = {
             "params": payload.get("params"),
@@ -111,47 +306,98 @@ class RestClientTool(BaseTool):
         save_path = payload.get("save_to")
         if save_path:
             try:
-                destination = self._resolve_path(Path(save_path))
+                destination = self._resolve_path(str(save_path))
             except ValueError as exc:
                 raise ToolError(str(exc))
         else:
             destination = None
 
+        max_bytes = payload.get("max_bytes")
+        if max_bytes is not None and (not isinstance(max_bytes, int) or max_bytes < 0):
+            raise ToolError("'max_bytes' must be a non-negative integer")
+
+        return _PreparedRequest(
+            method, url, headers, request_kwargs, destination, max_bytes, bool(graphql_payload)
+        )
+
+    def _send(self, prepared: "_PreparedRequest") -> str:
+        """Perform a prepared request and return the JSON summary."""
+        session = self._session
+        if session is None:
+            session = self._session = self._build_session()
+
+        destination = prepared.destination
+        # Stream when the body is written to disk or capped, so it is never held whole
+        stream = destination is not None or prepared.max_bytes is not None
         try:
-            response = requests.request(method, url, headers=headers, **request_kwargs)
+            response = session.request(
+                prepared.method, prepared.url, headers=prepared.headers, stream=stream, **prepared.kwargs
+            )
         except RequestException as exc:
             raise ToolError(f"Request failed: {exc}")
 
-        content_preview = response.text[:4000]
+        try:
+            if not stream:
+                # Decode only the preview rather than the whole body via response.text
+                content_preview = _decode_preview(memoryview(response.content)[:_PREVIEW_BYTES], response.encoding)
+            else:
+                content_preview = self._consume_stream(response, destination, prepared.max_bytes)
+        except RequestException as exc:
+            raise ToolError(f"Request failed: {exc}")
+        finally:
+            response.close()
 
-        if destination is not None:
-            destination.parent.mkdir(parents=True, exist_ok=True)
-            destination.write_text(response.text, encoding=response.encoding or "utf-8")
+        # _resolve_path guarantees the destination starts with the sandbox prefix
+        saved_rel = destination[len(self._sandbox_root_prefix):] if destination is not None else None
 
-        output = {
+        # Key order is fixed here, matching the order callers see in the summary
+        return _dumps({
             "status_code": response.status_code,
             "reason": response.reason,
-            "headers": dict(response.headers),
+            "headers": dict(response.headers.items()),
             "body_preview": content_preview,
-            "saved_to": str(destination.relative_to(self._sandbox_root)) if destination else None,
-            "graphql": bool(graphql_payload),
-        }
+            "saved_to": saved_rel,
+            "graphql": prepared.graphql,
+        })
 
-        return json.dumps(output, indent=2)
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _consume_stream(response, destination: Optional[str], max_bytes: Optional[int]) -> str:
+        """Copy a streamed body to ``destination`` and return its text preview.
+
+        Without a destination, at most ``max_bytes`` are downloaded.
+        """
+        preview = _preview_buffer()
+        filled = 0
+        received = 0
+        fd = _open_for_save(destination) if destination is not None else None
+        try:
+            for chunk in response.iter_content(_STREAM_CHUNK_SIZE):
+                if fd is not None:
+                    _write_all(fd, chunk)
+                elif max_bytes is not None and received + len(chunk) > max_bytes:
+                    chunk = chunk[: max_bytes - received]
+                received += len(chunk)
+                if filled < _PREVIEW_BYTES:
+                    take = min(len(chunk), _PREVIEW_BYTES - filled)
+                    preview[filled : filled + take] = memoryview(chunk)[:take]
+                    filled += take
+                if fd is None and max_bytes is not None and received >= max_bytes:
+                    break
+        finally:
+            if fd is not None:
+                os.close(fd)
+        return _decode_preview(preview[:filled], response.encoding)
 
     # ------------------------------------------------------------------
     def _validate_url(self, url: str) -> None:
-        parsed = urlparse(url)
-        if parsed.scheme not in {"http", "https"}:
-            raise ValueError("REST client only supports http/https URLs")
-
-        host = (parsed.hostname or "").lower()
+        host = _url_host(url)
         if host not in self._allowed_hosts:
             raise ValueError(f"Host '{host}' is not permitted for REST client usage")
 
     # ------------------------------------------------------------------
-    def _resolve_path(self, candidate: Path) -> Path:
-        resolved = (self._sandbox_root / candidate).resolve()
-        if not resolved.is_relative_to(self._sandbox_root):
+    def _resolve_path(self, candidate: str) -> str:
+        resolved = os.path.realpath(os.path.join(self._sandbox_root_str, candidate))
+        if resolved != self._sandbox_root_str and not resolved.startswith(self._sandbox_root_prefix):
             raise ValueError("Response save path must remain within sandbox")
         return resolved
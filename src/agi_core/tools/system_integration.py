@@ -2,22 +2,195 @@
 System Integration Tools for AGI Codex
 Provides integration with installed applications, system resources, and common services
 """
+import fnmatch
+import heapq
+import http.cookiejar
+import itertools
 import os
+import re
+import shlex
 import subprocess
 import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from html import unescape
 import platform
-from typing import Dict, List, Optional, Any
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Any, Union
 from pathlib import Path
+from types import MappingProxyType
 import json
 import shutil
-import psutil
-import requests
-from datetime import datetime
 
 from .base import BaseTool, ToolError
 from ..security.manager import SecurityManager
 from ..security.permissions import SystemFunction
 
+if TYPE_CHECKING:
+    import requests
+
+# psutil and requests (with urllib3, idna and certifi) are imported inside the
+# methods that use them so loading the tool set stays cheap
+
+# platform.system() goes through uname() on every call; the answer is fixed
+# for the life of the process
+_SYSTEM = platform.system()
+_IS_WINDOWS = _SYSTEM == "Windows"
+
+_TITLE_RE = re.compile(r'<title>(.*?)</title>', re.IGNORECASE | re.DOTALL)
+_SCRIPT_STYLE_RE = re.compile(r'<(script|style)[^>]*>.*?</\1>', re.DOTALL | re.IGNORECASE)
+_TAG_RE = re.compile(r'<[^>]+>')
+# The title sits in the document head, so the fast path only scans this prefix
+_TITLE_SCAN_CHARS = 64 * 1024
+# Anything the shell would interpret: pipes, redirects, globs, quoting,
+# expansions, env assignments, comments and command separators
+_SHELL_META_RE = re.compile(r'[|&;<>()$`\\"\'*?[\]#~=%\n]')
+
+
+def _scan_files(directory: str, match: Callable[[str], Any]) -> Iterator[os.DirEntry]:
+    """Yield files under ``directory`` whose names satisfy ``match``.
+
+    Directories are detected from the readdir file type, so only matching
+    entries are ever stat'ed. Like ``Path.rglob``, symlinked directories are
+    not descended and unreadable directories are skipped.
+    """
+    pending = [directory]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif match(entry.name) and entry.is_file():
+                        yield entry
+        except OSError:
+            continue
+
+
+@lru_cache(maxsize=1)
+def _system_info() -> MappingProxyType:
+    """Collect the host description once; platform.processor() may shell out."""
+    return MappingProxyType({
+        "platform": platform.platform(),
+        "system": _SYSTEM,
+        "node": platform.node(),
+        "release": platform.release(),
+        "version": platform.version(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "python_version": platform.python_version(),
+    })
+
+
+# Virtual and read-only image filesystems that the physical-only listing can
+# still report (snap squashfs loops, tmpfs on some platforms)
+_PSEUDO_FSTYPES = frozenset({
+    'squashfs', 'tmpfs', 'devtmpfs', 'devfs', 'ramfs', 'proc', 'sysfs',
+    'cgroup', 'cgroup2', 'autofs',
+})
+
+# macOS application folders -> (directory mtime, bundle names). The listing
+# only depends on entry names, which change exactly when the mtime does
+_apps_cache: Dict[str, tuple] = {}
+
+
+def _list_app_bundles(app_dir: str) -> List[str]:
+    """List the .app bundles in ``app_dir``, rescanning only after it changes."""
+    mtime = os.stat(app_dir).st_mtime_ns
+    cached = _apps_cache.get(app_dir)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    with os.scandir(app_dir) as entries:
+        bundles = [entry.name for entry in entries if entry.name.endswith('.app')]
+    _apps_cache[app_dir] = (mtime, bundles)
+    return bundles
+
+
+# Application --version/--help probes remembered per discovery tool
+_APP_INFO_CACHE_SIZE = 64
+
+# Page summaries are reused for repeat GETs of the same URL within the TTL
+_PAGE_CACHE_SIZE = 128
+_PAGE_CACHE_TTL = 300.0
+# Only the title and the first 1000 characters are reported, so there is no
+# need to download more than this much of a page
+_PAGE_MAX_BYTES = 256 * 1024
+
+
+def _pooled_session() -> "requests.Session":
+    """Build a session that keeps connections alive across calls."""
+    import requests
+    from urllib3.util.retry import Retry
+    
+    session = requests.Session()
+    # Only connections are pooled; cookies from one call must not be sent on
+    # later, unrelated calls
+    session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=3, backoff_factor=0.3),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_PREVIEWABLE_EXTS = frozenset({'.txt', '.py', '.js', '.html', '.css', '.json', '.yaml', '.md'})
+_PREVIEW_CHARS = 200
+# Enough bytes for the preview even if every character is 4-byte UTF-8
+_PREVIEW_READ_BYTES = 4 * _PREVIEW_CHARS
+
+
+def _iso_mtime(timestamp: float) -> str:
+    """Format a local timestamp as ISO 8601 without building a datetime."""
+    return time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(timestamp))
+
+
+# Directory reads release the GIL, so searches fan out over threads
+_SEARCH_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def _describe_match(entry: os.DirEntry) -> Dict[str, Any]:
+    """Summarise a matched file for the search_files result."""
+    stat = entry.stat()
+    return {
+        "path": entry.path,
+        "name": entry.name,
+        "size": stat.st_size,
+        "modified": _iso_mtime(stat.st_mtime)
+    }
+
+
+def _search_tree(directory: str, match: Callable[[str], Any]) -> List[Dict[str, Any]]:
+    """Describe every file under ``directory`` whose name satisfies ``match``.
+
+    Each top-level subdirectory is walked on its own worker thread; results
+    are gathered in directory order so the output stays deterministic.
+    """
+    matches = []
+    subdirs = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif match(entry.name) and entry.is_file():
+                matches.append(_describe_match(entry))
+
+    def collect(subdir: str) -> List[Dict[str, Any]]:
+        return [_describe_match(entry) for entry in _scan_files(subdir, match)]
+
+    if len(subdirs) > 1:
+        with ThreadPoolExecutor(max_workers=min(_SEARCH_WORKERS, len(subdirs))) as pool:
+            for found in pool.map(collect, subdirs):
+                matches.extend(found)
+    else:
+        for subdir in subdirs:
+            matches.extend(collect(subdir))
+    return matches
+
 
 class ApplicationDiscoveryTool(BaseTool):
     """
@@ -26,6 +199,10 @@ class ApplicationDiscoveryTool(BaseTool):
     def __init__(self, security_manager: SecurityManager):
         super().__init__(name="application_discovery", description="Discover and interact with installed applications")
         self.security_manager = security_manager
+        # LRU of (app_name, executable mtime) -> details; an upgraded binary
+        # gets a new key
+        self._app_info_cache: OrderedDict = OrderedDict()
+        self._app_info_cache_lock = threading.Lock()
 
     def _run(self, action: str, **kwargs) -> Dict[str, Any]:
         """
@@ -51,40 +228,47 @@ class ApplicationDiscoveryTool(BaseTool):
 
     def _list_installed_applications(self) -> Dict[str, Any]:
         """List all installed applications"""
-        apps = []
+        apps = set()  # Deduplicates across directories as we go
         
         # On Linux, check common application directories
-        if platform.system() == "Linux":
+        if _SYSTEM == "Linux":
             app_dirs = ["/usr/bin", "/usr/local/bin", "/snap/bin"]
             for app_dir in app_dirs:
-                if os.path.exists(app_dir):
-                    for app in os.listdir(app_dir):
-                        app_path = os.path.join(app_dir, app)
-                        if os.access(app_path, os.X_OK) and os.path.isfile(app_path):
-                            apps.append(app)
+                try:
+                    # DirEntry.is_file reuses the readdir file type, so only
+                    # symlinks still need a stat
+                    with os.scandir(app_dir) as entries:
+                        for entry in entries:
+                            if entry.is_file() and os.access(entry.path, os.X_OK):
+                                apps.add(entry.name)
+                except FileNotFoundError:
+                    continue
         
         # On macOS, check common application locations
-        elif platform.system() == "Darwin":
+        elif _SYSTEM == "Darwin":
             app_dirs = ["/Applications", "/Applications/Utilities"]
             for app_dir in app_dirs:
-                if os.path.exists(app_dir):
-                    for app in os.listdir(app_dir):
-                        if app.endswith('.app'):
-                            apps.append(app)
+                try:
+                    apps.update(_list_app_bundles(app_dir))
+                except FileNotFoundError:
+                    continue
         
         # On Windows, check common application locations
-        elif platform.system() == "Windows":
+        elif _IS_WINDOWS:
             # This is a simplified check; in practice, you'd want to check the registry
             program_files = os.environ.get("ProgramFiles", "C:\\Program Files")
-            if os.path.exists(program_files):
-                for app in os.listdir(program_files):
-                    apps.append(app)
+            try:
+                with os.scandir(program_files) as entries:
+                    for entry in entries:
+                        apps.add(entry.name)
+            except FileNotFoundError:
+                pass
         
-        return {"applications": list(set(apps))}  # Remove duplicates
+        return {"applications": list(apps)}
 
     def _check_application_installed(self, app_name: str) -> bool:
         """Check if a specific application is installed"""
-        if platform.system() == "Windows":
+        if _IS_WINDOWS:
             # On Windows, check if the executable exists in common paths
             common_paths = [
                 os.path.join(os.environ.get("ProgramFiles", "C:\\Program Files"), app_name),
@@ -92,25 +276,33 @@ class ApplicationDiscoveryTool(BaseTool):
                 "C:\\Windows\\System32"
             ]
             
+            exe_name = f"{app_name}.exe".lower()
             for path in common_paths:
-                if os.path.exists(path):
-                    # Check for .exe files
-                    exe_path = os.path.join(path, f"{app_name}.exe")
-                    if os.path.exists(exe_path):
-                        return True
-                    
-                    # Also check subdirectories
-                    for root, dirs, files in os.walk(path):
-                        for file in files:
-                            if file.lower() == f"{app_name}.exe":
+                if not os.path.isdir(path):
+                    continue
+                # Check for the executable in the directory itself and in its
+                # immediate subdirectories; walking the whole tree would stat
+                # every file under Program Files
+                try:
+                    with os.scandir(path) as entries:
+                        subdirs = []
+                        for entry in entries:
+                            if entry.name.lower() == exe_name:
                                 return True
+                            if entry.is_dir(follow_symlinks=False):
+                                subdirs.append(entry.path)
+                except OSError:
+                    continue
+                for subdir in subdirs:
+                    try:
+                        with os.scandir(subdir) as entries:
+                            if any(entry.name.lower() == exe_name for entry in entries):
+                                return True
+                    except OSError:
+                        continue
         else:
-            # On Unix-like systems, use 'which' command
-            try:
-                result = subprocess.run(["which", app_name], capture_output=True, text=True)
-                return result.returncode == 0
-            except Exception:
-                return False
+            # On Unix-like systems, search PATH in-process instead of spawning 'which'
+            return shutil.which(app_name) is not None
         
         return False
 
@@ -122,21 +314,52 @@ class ApplicationDiscoveryTool(BaseTool):
         
         info = {"app_name": app_name, "installed": True, "details": {}}
         
-        if platform.system() != "Windows":
+        if not _IS_WINDOWS:
+            info["details"] = dict(self._get_application_details(app_name))
+        
+        return info
+
+    def _get_application_details(self, app_name: str) -> Dict[str, str]:
+        """Query an application's --version and --help output"""
+        exe_path = shutil.which(app_name)
+        try:
+            key = (app_name, os.stat(exe_path).st_mtime) if exe_path else None
+        except OSError:
+            key = None
+        if key:
+            with self._app_info_cache_lock:
+                cached = self._app_info_cache.get(key)
+                if cached is not None:
+                    self._app_info_cache.move_to_end(key)
+                    return cached
+        
+        def query(flag: str) -> subprocess.CompletedProcess:
+            return subprocess.run([app_name, flag], capture_output=True, text=True, timeout=5)
+        
+        details = {}
+        # Both probes are dominated by process startup, so run them side by side
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            version = pool.submit(query, "--version")
+            help_text = pool.submit(query, "--help")
             try:
-                # Get version information using common commands
-                result = subprocess.run([app_name, "--version"], capture_output=True, text=True, timeout=5)
+                result = version.result()
                 if result.returncode == 0:
-                    info["details"]["version"] = result.stdout.strip()
-                
-                # Get help information
-                result = subprocess.run([app_name, "--help"], capture_output=True, text=True, timeout=5)
-                if result.returncode == 0:
-                    info["details"]["help"] = result.stdout[:500]  # First 500 chars
+                    details["version"] = result.stdout.strip()
             except Exception:
                 pass  # Silently ignore if these commands fail
+            try:
+                result = help_text.result()
+                if result.returncode == 0:
+                    details["help"] = result.stdout[:500]  # First 500 chars
+            except Exception:
+                pass
         
-        return info
+        if key:
+            with self._app_info_cache_lock:
+                self._app_info_cache[key] = details
+                if len(self._app_info_cache) > _APP_INFO_CACHE_SIZE:
+                    self._app_info_cache.popitem(last=False)
+        return details
 
 
 class FileSystemIntegrationTool(BaseTool):
@@ -163,10 +386,10 @@ class FileSystemIntegrationTool(BaseTool):
                 raise ToolError("file_path is required for file_info action")
             return self._get_file_info(file_path)
         elif action == "search_files":
-            pattern = kwargs.get("pattern")
+            pattern = kwargs.get("patterns") or kwargs.get("pattern")
             directory = kwargs.get("directory", ".")
             if not pattern:
-                raise ToolError("pattern is required for search_files action")
+                raise ToolError("pattern or patterns is required for search_files action")
             return self._search_files(pattern, directory)
         elif action == "file_operations":
             operation = kwargs.get("operation")
@@ -198,18 +421,20 @@ class FileSystemIntegrationTool(BaseTool):
                 "files": []
             }
             
-            for item in path_obj.iterdir():
-                item_info = {
-                    "name": item.name,
-                    "path": str(item),
-                    "size": item.stat().st_size,
-                    "modified": datetime.fromtimestamp(item.stat().st_mtime).isoformat()
-                }
-                
-                if item.is_dir():
-                    contents["directories"].append(item_info)
-                else:
-                    contents["files"].append(item_info)
+            with os.scandir(path_obj) as entries:
+                for entry in entries:
+                    stat = entry.stat()  # One stat serves both size and mtime
+                    item_info = {
+                        "name": entry.name,
+                        "path": entry.path,
+                        "size": stat.st_size,
+                        "modified": _iso_mtime(stat.st_mtime)
+                    }
+                    
+                    if entry.is_dir():
+                        contents["directories"].append(item_info)
+                    else:
+                        contents["files"].append(item_info)
             
             return contents
         except Exception as e:
@@ -232,8 +457,8 @@ class FileSystemIntegrationTool(BaseTool):
                 "path": str(path_obj),
                 "name": path_obj.name,
                 "size": stat.st_size,
-                "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                "created": datetime.fromtimestamp(stat.st_ctime).isoformat(),
+                "modified": _iso_mtime(stat.st_mtime),
+                "created": _iso_mtime(stat.st_ctime),
                 "permissions": oct(stat.st_mode)[-3:],
                 "is_file": path_obj.is_file(),
                 "is_directory": path_obj.is_dir(),
@@ -241,10 +466,16 @@ class FileSystemIntegrationTool(BaseTool):
             }
             
             # If it's a text file, try to read the first few lines
-            if path_obj.is_file() and path_obj.suffix.lower() in ['.txt', '.py', '.js', '.html', '.css', '.json', '.yaml', '.md']:
+            if path_obj.is_file() and path_obj.suffix.lower() in _PREVIEWABLE_EXTS:
                 try:
-                    with open(path_obj, 'r', encoding='utf-8', errors='ignore') as f:
-                        info["preview"] = f.read(200)  # First 200 characters
+                    # A raw read skips the buffered text-file setup for a tiny preview
+                    fd = os.open(path_obj, os.O_RDONLY)
+                    try:
+                        data = os.read(fd, _PREVIEW_READ_BYTES)
+                    finally:
+                        os.close(fd)
+                    text = data.decode('utf-8', 'ignore').replace('\r\n', '\n').replace('\r', '\n')
+                    info["preview"] = text[:_PREVIEW_CHARS]  # First 200 characters
                 except Exception:
                     pass  # Ignore if we can't read the file
             
@@ -252,8 +483,8 @@ class FileSystemIntegrationTool(BaseTool):
         except Exception as e:
             raise ToolError(f"Error getting file info: {str(e)}")
 
-    def _search_files(self, pattern: str, directory: str = ".") -> Dict[str, Any]:
-        """Search for files matching a pattern"""
+    def _search_files(self, pattern: Union[str, List[str]], directory: str = ".") -> Dict[str, Any]:
+        """Search for files matching a pattern, or any of a list of patterns"""
         try:
             dir_obj = Path(directory).resolve()
             
@@ -264,16 +495,30 @@ class FileSystemIntegrationTool(BaseTool):
             if not dir_obj.exists() or not dir_obj.is_dir():
                 raise ToolError(f"Directory does not exist or is not a directory: {directory}")
             
+            patterns = [pattern] if isinstance(pattern, str) else list(pattern)
+            name_patterns = [p for p in patterns if "/" not in p and os.sep not in p]
+            path_patterns = [p for p in patterns if p not in name_patterns]
+            
             matches = []
-            for file_path in dir_obj.rglob(pattern):
-                if file_path.is_file():
-                    stat = file_path.stat()
-                    matches.append({
-                        "path": str(file_path),
-                        "name": file_path.name,
-                        "size": stat.st_size,
-                        "modified": datetime.fromtimestamp(stat.st_mtime).isoformat()
-                    })
+            if name_patterns:
+                # One alternation tests every name pattern in a single tree walk
+                flags = re.IGNORECASE if _IS_WINDOWS else 0
+                match = re.compile("|".join(fnmatch.translate(p) for p in name_patterns), flags).match
+                matches = _search_tree(str(dir_obj), match)
+            
+            # Multi-segment patterns keep pathlib's matching rules
+            seen = {found["path"] for found in matches} if path_patterns else set()
+            for path_pattern in path_patterns:
+                for file_path in dir_obj.rglob(path_pattern):
+                    if file_path.is_file() and str(file_path) not in seen:
+                        seen.add(str(file_path))
+                        stat = file_path.stat()
+                        matches.append({
+                            "path": str(file_path),
+                            "name": file_path.name,
+                            "size": stat.st_size,
+                            "modified": _iso_mtime(stat.st_mtime)
+                        })
             
             return {"pattern": pattern, "directory": str(dir_obj), "matches": matches}
         except Exception as e:
@@ -361,14 +606,31 @@ class TerminalIntegrationTool(BaseTool):
         timeout = kwargs.get("timeout", 30)
         
         try:
-            # Execute the command
-            result = subprocess.run(
-                command,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=timeout
-            )
+            # Plain "program args" commands are exec'd directly, saving the
+            # /bin/sh fork; anything the shell would interpret still uses it
+            result = None
+            if not _IS_WINDOWS and not _SHELL_META_RE.search(command):
+                argv = shlex.split(command)
+                if argv:
+                    try:
+                        result = subprocess.run(
+                            argv,
+                            capture_output=True,
+                            text=True,
+                            timeout=timeout,
+                            bufsize=-1
+                        )
+                    except (FileNotFoundError, PermissionError):
+                        pass  # Shell builtins and missing programs keep the shell's behaviour
+            if result is None:
+                result = subprocess.run(
+                    command,
+                    shell=True,
+                    capture_output=True,
+                    text=True,
+                    timeout=timeout,
+                    bufsize=-1
+                )
             
             return {
                 "command": command,
@@ -407,7 +669,16 @@ class SystemResourceMonitor(BaseTool):
         elif action == "get_disk_usage":
             return self._get_disk_usage()
         elif action == "get_running_processes":
-            return self._get_running_processes()
+            return self._get_running_processes(
+                limit=kwargs.get("limit"),
+                sort_by=kwargs.get("sort_by"),
+                filter_name=kwargs.get("filter_name"),
+            )
+        elif action == "get_process_cpu_usage":
+            return self._get_process_cpu_usage(
+                limit=kwargs.get("limit", 10),
+                interval=kwargs.get("interval", 1.0),
+            )
         elif action == "get_network_info":
             return self._get_network_info()
         else:
@@ -415,28 +686,24 @@ class SystemResourceMonitor(BaseTool):
 
     def _get_system_info(self) -> Dict[str, Any]:
         """Get overall system information"""
-        return {
-            "platform": platform.platform(),
-            "system": platform.system(),
-            "node": platform.node(),
-            "release": platform.release(),
-            "version": platform.version(),
-            "machine": platform.machine(),
-            "processor": platform.processor(),
-            "python_version": platform.python_version(),
-        }
+        # Copy so callers can annotate the result without touching the cache
+        return dict(_system_info())
 
     def _get_cpu_usage(self) -> Dict[str, Any]:
         """Get CPU usage information"""
+        import psutil
+        
         return {
             "cpu_percent": psutil.cpu_percent(interval=1),
             "cpu_count": psutil.cpu_count(),
             "cpu_freq": psutil.cpu_freq()._asdict() if psutil.cpu_freq() else None,
-            "load_average": os.getloadavg() if platform.system() != "Windows" else None
+            "load_average": os.getloadavg() if not _IS_WINDOWS else None
         }
 
     def _get_memory_usage(self) -> Dict[str, Any]:
         """Get memory usage information"""
+        import psutil
+        
         memory = psutil.virtual_memory()
         swap = psutil.swap_memory()
         
@@ -458,38 +725,115 @@ class SystemResourceMonitor(BaseTool):
 
     def _get_disk_usage(self) -> Dict[str, Any]:
         """Get disk usage information"""
+        import psutil
+        
         disk_info = {}
+        mountpoints = [
+            partition.mountpoint
+            for partition in psutil.disk_partitions(all=False)
+            if partition.fstype not in _PSEUDO_FSTYPES
+        ]
         
-        for partition in psutil.disk_partitions():
+        def usage_of(mountpoint: str):
             try:
-                usage = psutil.disk_usage(partition.mountpoint)
-                disk_info[partition.mountpoint] = {
-                    "total": usage.total,
-                    "used": usage.used,
-                    "free": usage.free,
-                    "percent": (usage.used / usage.total) * 100
-                }
+                return psutil.disk_usage(mountpoint)
             except PermissionError:
                 # This can happen on some systems where we don't have permission to access certain partitions
+                return None
+        
+        if len(mountpoints) > 1:
+            # Each statvfs is independent, so a slow network mount no longer
+            # delays the others
+            with ThreadPoolExecutor(max_workers=min(8, len(mountpoints))) as pool:
+                usages = list(pool.map(usage_of, mountpoints))
+        else:
+            usages = [usage_of(mountpoint) for mountpoint in mountpoints]
+        
+        for mountpoint, usage in zip(mountpoints, usages):
+            if usage is None:
                 continue
+            disk_info[mountpoint] = {
+                "total": usage.total,
+                "used": usage.used,
+                "free": usage.free,
+                "percent": (usage.used / usage.total) * 100
+            }
         
         return disk_info
 
-    def _get_running_processes(self) -> Dict[str, Any]:
-        """Get information about running processes"""
-        processes = []
+    # Sortable process attributes and whether the largest values come first
+    _PROCESS_SORT_KEYS = {"memory_percent": True, "pid": False, "name": False, "username": False}
+
+    def _get_running_processes(
+        self,
+        limit: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        filter_name: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Get information about running processes
+
+        cpu_percent is not collected here: a single read is always 0.0, so
+        per-process CPU is sampled by the get_process_cpu_usage action.
+        """
+        import psutil
+        
+        if sort_by is not None and sort_by not in self._PROCESS_SORT_KEYS:
+            raise ToolError(f"Unsupported sort_by: {sort_by}")
+        
+        # process_iter skips processes that disappear mid-scan and fills
+        # attributes we may not read with ad_value
+        processes = (
+            proc.info
+            for proc in psutil.process_iter(['pid', 'name', 'username', 'status', 'memory_percent'], ad_value=None)
+        )
+        if filter_name:
+            needle = filter_name.lower()
+            processes = (info for info in processes if needle in (info["name"] or "").lower())
+        
+        if sort_by is not None:
+            missing = 0 if sort_by in ("pid", "memory_percent") else ""
+            key = lambda info: info[sort_by] if info[sort_by] is not None else missing
+            descending = self._PROCESS_SORT_KEYS[sort_by]
+            if limit is not None:
+                # Keep only the top entries instead of sorting the full list
+                select = heapq.nlargest if descending else heapq.nsmallest
+                result = select(int(limit), processes, key=key)
+            else:
+                result = sorted(processes, key=key, reverse=descending)
+        elif limit is not None:
+            result = list(itertools.islice(processes, int(limit)))
+        else:
+            result = list(processes)
+        
+        return {"processes": result, "count": len(result)}
+
+    def _get_process_cpu_usage(self, limit: int = 10, interval: float = 1.0) -> Dict[str, Any]:
+        """Get the processes using the most CPU over a sampling interval"""
+        import psutil
+        
+        procs = list(psutil.process_iter(['pid', 'name'], ad_value=None))
+        for proc in procs:
+            try:
+                proc.cpu_percent(None)  # First call only primes the counter
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        
+        time.sleep(interval)
         
-        for proc in psutil.process_iter(['pid', 'name', 'username', 'status', 'cpu_percent', 'memory_percent']):
+        samples = []
+        for proc in procs:
             try:
-                processes.append(proc.info)
+                samples.append({**proc.info, "cpu_percent": proc.cpu_percent(None)})
             except (psutil.NoSuchProcess, psutil.AccessDenied):
-                # Handle cases where process disappears or we don't have access
                 continue
         
-        return {"processes": processes, "count": len(processes)}
+        top = heapq.nlargest(int(limit), samples, key=lambda info: info["cpu_percent"])
+        return {"processes": top, "count": len(top), "interval": interval}
 
     def _get_network_info(self) -> Dict[str, Any]:
         """Get network information"""
+        import psutil
+        
         net_io = psutil.net_io_counters()
         net_addrs = psutil.net_if_addrs()
         net_stats = psutil.net_if_stats()
@@ -528,6 +872,14 @@ class WebIntegrationTool(BaseTool):
     def __init__(self, security_manager: SecurityManager):
         super().__init__(name="web_integration", description="Web browser automation and integration")
         self.security_manager = security_manager
+        self._session = None  # Created on the first page fetch
+        self._page_cache: OrderedDict = OrderedDict()
+        self._page_cache_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        if self._session is not None:
+            self._session.close()
 
     def _run(self, action: str, **kwargs) -> Dict[str, Any]:
         """
@@ -574,20 +926,53 @@ class WebIntegrationTool(BaseTool):
         if not self.security_manager.validate_url(url):
             raise ToolError(f"URL blocked by security policy: {url}")
         
+        now = time.monotonic()
+        with self._page_cache_lock:
+            entry = self._page_cache.get(url)
+            if entry is not None:
+                if now - entry[0] < _PAGE_CACHE_TTL:
+                    self._page_cache.move_to_end(url)
+                    return dict(entry[1])
+                del self._page_cache[url]
+        
         try:
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
+            if self._session is None:
+                self._session = _pooled_session()
+            with self._session.get(url, timeout=10, stream=True) as response:
+                response.raise_for_status()
+                body = bytearray()
+                for chunk in response.iter_content(chunk_size=8192):
+                    body += chunk
+                    if len(body) > _PAGE_MAX_BYTES:
+                        break
+                truncated = len(body) > _PAGE_MAX_BYTES
+                del body[_PAGE_MAX_BYTES:]
+                # apparent_encoding would sniff the whole body, so fall back to UTF-8
+                try:
+                    html_content = body.decode(response.encoding or "utf-8", errors="replace")
+                except LookupError:
+                    html_content = body.decode("utf-8", errors="replace")
+                declared_length = response.headers.get('content-length')
             
-            return {
+            page = {
                 "url": url,
                 "status_code": response.status_code,
                 "content_type": response.headers.get('content-type'),
-                "content_length": len(response.content),
-                "title": self._extract_title(response.text),
-                "text_content": self._extract_text_content(response.text)[:1000]  # First 1000 chars
+                "content_length": len(body),
+                # Wire size from the header; compressed bodies differ from content_length
+                "declared_length": int(declared_length) if declared_length and declared_length.isdigit() else None,
+                "truncated": truncated,
+                "title": self._extract_title(html_content),
+                "text_content": self._extract_text_content(html_content)[:1000]  # First 1000 chars
             }
         except Exception as e:
             raise ToolError(f"Error getting page content: {str(e)}")
+        
+        with self._page_cache_lock:
+            self._page_cache[url] = (now, page)
+            if len(self._page_cache) > _PAGE_CACHE_SIZE:
+                self._page_cache.popitem(last=False)
+        return dict(page)
 
     def _screenshot_page(self, url: str) -> Dict[str, Any]:
         """Take a screenshot of a web page (placeholder implementation)"""
@@ -597,19 +982,25 @@ class WebIntegrationTool(BaseTool):
 
     def _extract_title(self, html_content: str) -> str:
         """Extract title from HTML content"""
-        import re
-        title_match = re.search(r'<title>(.*?)</title>', html_content, re.IGNORECASE)
+        head = html_content[:_TITLE_SCAN_CHARS]
+        lowered = head.lower()
+        # str.find beats the regex engine; lower() can change the length of a
+        # few non-ASCII strings, in which case offsets would not line up
+        if len(lowered) == len(head):
+            start = lowered.find('<title>')
+            if start != -1:
+                end = lowered.find('</title>', start + 7)
+                if end != -1:
+                    return html_content[start + 7:end]
+        title_match = _TITLE_RE.search(html_content)
         return title_match.group(1) if title_match else "No title found"
 
     def _extract_text_content(self, html_content: str) -> str:
         """Extract text content from HTML"""
-        from html import unescape
-        import re
-        
         # Remove script and style elements
-        clean_html = re.sub(r'<(script|style)[^>]*>.*?</\1>', '', html_content, flags=re.DOTALL | re.IGNORECASE)
+        clean_html = _SCRIPT_STYLE_RE.sub('', html_content)
         # Remove HTML tags
-        text = re.sub(r'<[^>]+>', ' ', clean_html)
+        text = _TAG_RE.sub(' ', clean_html)
         # Unescape HTML entities
         text = unescape(text)
         # Clean up whitespace
@@ -625,6 +1016,12 @@ class APIIntegrationTool(BaseTool):
     def __init__(self, security_manager: SecurityManager):
         super().__init__(name="api_integration", description="API integration with common services")
         self.security_manager = security_manager
+        self._session = None  # Created on the first API call
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        if self._session is not None:
+            self._session.close()
 
     def _run(self, action: str, **kwargs) -> Dict[str, Any]:
         """
@@ -698,7 +1095,9 @@ class APIIntegrationTool(BaseTool):
             raise ToolError(f"URL blocked by security policy: {url}")
         
         try:
-            response = requests.request(method, url, headers=headers, json=data, timeout=30)
+            if self._session is None:
+                self._session = _pooled_session()
+            response = self._session.request(method, url, headers=headers, json=data, timeout=30)
             response.raise_for_status()
             
             return {
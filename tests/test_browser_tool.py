@@ -1,19 +1,22 @@
 """Smoke tests for the Playwright-backed browser tool."""
 from __future__ import annotations
 
+import gc
 import json
 import tempfile
 from pathlib import Path
 import sys
+import threading
 from typing import Dict
 import types
+import weakref
 from unittest import TestCase
 from unittest.mock import patch
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 
 from agi_core.tools.base import ToolContext
-from agi_core.tools.browser import BrowserAutomationTool
+from agi_core.tools.browser import BrowserAutomationTool, _BrowserPool
 
 
 class DummyPage:
@@ -51,24 +54,43 @@ class DummyPage:
         self._screenshot_path = target
 
 
-class DummyBrowser:
+class DummyContext:
     def __init__(self, page: DummyPage) -> None:
         self._page = page
+        self.closed = False
 
     def new_page(self) -> DummyPage:
         return self._page
 
-    def close(self) -> None:  # pragma: no cover - noop
-        pass
+    def close(self) -> None:
+        self.closed = True
+
+
+class DummyBrowser:
+    def __init__(self, page: DummyPage) -> None:
+        self._page = page
+        self.contexts: list[DummyContext] = []
+        self.closed = False
+
+    def new_context(self) -> DummyContext:
+        context = DummyContext(self._page)
+        self.contexts.append(context)
+        return context
+
+    def close(self) -> None:
+        self.closed = True
 
 
 class DummyPlaywright:
     def __init__(self, page: DummyPage) -> None:
         self._page = page
         self.chromium = self
+        self.browsers: list[DummyBrowser] = []
 
     def launch(self, headless: bool = True) -> DummyBrowser:  # pragma: no cover - called indirectly
-        return DummyBrowser(self._page)
+        browser = DummyBrowser(self._page)
+        self.browsers.append(browser)
+        return browser
 
     def __enter__(self) -> "DummyPlaywright":
         return self
@@ -114,6 +136,123 @@ class BrowserAutomationToolTests(TestCase):
         screenshot_path = self.sandbox / "captures" / "page.png"
         self.assertTrue(screenshot_path.exists())
         self.assertGreater(screenshot_path.stat().st_size, 0)
+        tool.close()
+
+    def test_playwright_browsers_are_pooled_and_recycled(self) -> None:
+        tool = BrowserAutomationTool(
+            sandbox_root=self.sandbox,
+            allow_network=False,
+            allowed_origins=[],
+        )
+        self.addCleanup(tool.close)
+        playwright = DummyPlaywright(DummyPage())
+        payload = json.dumps({"url": self.html_path.as_uri()})
+
+        with patch("agi_core.tools.browser.sync_playwright", lambda: playwright), patch(
+            "agi_core.tools.browser.MAX_USES_PER_INSTANCE", 2
+        ):
+            for _ in range(3):
+                self.assertTrue(tool.run(self.context, payload).success)
+
+        first, second = playwright.browsers
+        self.assertEqual(len(first.contexts), 2)
+        self.assertTrue(all(context.closed for context in first.contexts))
+        self.assertTrue(first.closed)
+        self.assertFalse(second.closed)
+
+        tool.close()
+        self.assertTrue(second.closed)
+
+    def test_each_thread_gets_its_own_browser_pool(self) -> None:
+        tool = BrowserAutomationTool(
+            sandbox_root=self.sandbox,
+            allow_network=False,
+            allowed_origins=[],
+        )
+        self.addCleanup(tool.close)
+        playwright = DummyPlaywright(DummyPage())
+        payload = json.dumps({"url": self.html_path.as_uri()})
+        results = []
+
+        with patch("agi_core.tools.browser.sync_playwright", lambda: playwright):
+            results.append(tool.run(self.context, payload))
+            worker = threading.Thread(target=lambda: results.append(tool.run(self.context, payload)))
+            worker.start()
+            worker.join()
+            with self.assertRaisesRegex(RuntimeError, "outside the thread"):
+                next(pool for owner, pool in tool._pools.items() if owner != threading.get_ident()).acquire()
+
+        self.assertTrue(all(result.success for result in results))
+        self.assertEqual(len(tool._pools), 2)
+        self.assertEqual(len(playwright.browsers), 2)
+
+    def test_closed_pool_is_not_kept_alive_by_the_exit_hook(self) -> None:
+        pool = _BrowserPool(headless=True)
+        ref = weakref.ref(pool)
+
+        pool.close()
+        del pool
+        gc.collect()
+
+        self.assertIsNone(ref())
+
+    def test_url_validation_follows_each_tool_policy(self) -> None:
+        url = "https://example.com/docs"
+        permitted = BrowserAutomationTool(
+            sandbox_root=self.sandbox,
+            allow_network=True,
+            allowed_origins=["https://example.com"],
+        )
+        restricted = BrowserAutomationTool(
+            sandbox_root=self.sandbox,
+            allow_network=True,
+            allowed_origins=["https://other.org"],
+        )
+        offline = BrowserAutomationTool(
+            sandbox_root=self.sandbox,
+            allow_network=False,
+            allowed_origins=[],
+        )
+
+        self.assertEqual(permitted._validate_url(url), url)
+        self.assertEqual(permitted._validate_url(url), url)
+        with self.assertRaisesRegex(ValueError, "allowed_origins"):
+            restricted._validate_url(url)
+        with self.assertRaisesRegex(ValueError, "disabled"):
+            offline._validate_url(url)
+
+        self.assertEqual(offline._validate_url(self.html_path.as_uri()), self.html_path.resolve().as_uri())
+        self.html_path.unlink()
+        with self.assertRaisesRegex(ValueError, "not found"):
+            offline._validate_url(self.html_path.as_uri())
+
+    def test_rejects_malformed_instruction_json(self) -> None:
+        tool = BrowserAutomationTool(
+            sandbox_root=self.sandbox,
+            allow_network=False,
+            allowed_origins=[],
+        )
+
+        result = tool.run(self.context, "{not json")
+
+        self.assertFalse(result.success)
+        self.assertIn("Invalid browser instruction JSON", result.error)
+
+    def test_common_urls_are_validated_without_urlparse(self) -> None:
+        tool = BrowserAutomationTool(
+            sandbox_root=self.sandbox,
+            allow_network=True,
+            allowed_origins=[],
+        )
+        expected = self.html_path.resolve().as_uri()
+
+        with patch("agi_core.tools.browser.urlparse", side_effect=AssertionError("urlparse called")):
+            self.assertEqual(tool._validate_url("https://example.org/fast"), "https://example.org/fast")
+            self.assertEqual(tool._validate_url(self.html_path.as_uri()), expected)
+
+        self.assertEqual(tool._validate_url(self.html_path.as_uri() + "#top"), expected)
+        with self.assertRaisesRegex(ValueError, "Unsupported URL scheme"):
+            tool._validate_url("ftp://example.org/file")
 
     def test_selenium_backend_extracts_text(self) -> None:
         tool = BrowserAutomationTool(
@@ -168,11 +307,20 @@ class BrowserAutomationToolTests(TestCase):
             def save_screenshot(self, path: str) -> None:
                 Path(path).write_bytes(b"selenium-image")
 
-            def quit(self) -> None:  # pragma: no cover - noop
-                pass
+            def delete_all_cookies(self) -> None:
+                self.cookies_cleared = True
+
+            def quit(self) -> None:
+                self.quit_called = True
+
+        drivers: list[FakeBrowser] = []
+
+        def fake_chrome(**_kwargs) -> FakeBrowser:
+            drivers.append(FakeBrowser())
+            return drivers[-1]
 
         fake_webdriver = types.SimpleNamespace(
-            Chrome=lambda **_: FakeBrowser(),
+            Chrome=fake_chrome,
             ChromeOptions=FakeChromeOptions,
         )
 
@@ -199,10 +347,18 @@ class BrowserAutomationToolTests(TestCase):
             WebDriverException=RuntimeError,
         ):
             result = tool.run(self.context, json.dumps(payload))
+            second = tool.run(self.context, json.dumps(payload))
 
         self.assertTrue(result.success, result.error)
+        self.assertTrue(second.success, second.error)
         self.assertIn("Extracted text", result.output)
 
         screenshot_path = self.sandbox / "captures" / "selenium.png"
         self.assertTrue(screenshot_path.exists())
         self.assertGreater(screenshot_path.stat().st_size, 0)
+
+        (driver,) = drivers
+        self.assertEqual(driver._last_url, "about:blank")
+        self.assertTrue(driver.cookies_cleared)
+        tool.close()
+        self.assertTrue(driver.quit_called)
@@ -0,0 +1,77 @@
+"""Tests for the sandboxed file tool."""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT / "src") not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from agi_core.tools.file_io import FileIOTool
+
+
+def test_write_then_read_relative_to_sandbox(tmp_path: Path) -> None:
+    tool = FileIOTool(tmp_path / "sandbox")
+
+    written = tool.run(action="write", path="notes/today.txt", data="hello")
+    read = tool.run(action="read", path="notes/today.txt")
+
+    assert written.success
+    assert read.output == "hello"
+    assert (tmp_path / "sandbox" / "notes" / "today.txt").read_text(encoding="utf-8") == "hello"
+
+
+def test_paths_outside_sandbox_are_rejected(tmp_path: Path) -> None:
+    tool = FileIOTool(tmp_path / "sandbox")
+    (tmp_path / "secret.txt").write_text("secret", encoding="utf-8")
+
+    assert tool.run(action="read", path="../secret.txt").error == "Path outside sandbox"
+    assert tool.run(action="read", path=str(tmp_path / "secret.txt")).error == "Path outside sandbox"
+
+
+def test_symlinked_file_is_resolved_on_every_call(tmp_path: Path) -> None:
+    sandbox = tmp_path / "sandbox"
+    tool = FileIOTool(sandbox)
+    (tmp_path / "secret.txt").write_text("secret", encoding="utf-8")
+    tool.run(action="write", path="link.txt", data="inside")
+    assert tool.run(action="read", path="link.txt").output == "inside"
+
+    (sandbox / "link.txt").unlink()
+    (sandbox / "link.txt").symlink_to(tmp_path / "secret.txt")
+
+    assert tool.run(action="read", path="link.txt").error == "Path outside sandbox"
+
+
+def test_sibling_directory_sharing_the_prefix_is_rejected(tmp_path: Path) -> None:
+    tool = FileIOTool(tmp_path / "sandbox")
+    (tmp_path / "sandbox-other").mkdir()
+    (tmp_path / "sandbox-other" / "data.txt").write_text("other", encoding="utf-8")
+
+    result = tool.run(action="read", path=str(tmp_path / "sandbox-other" / "data.txt"))
+
+    assert result.error == "Path outside sandbox"
+
+
+def test_large_reads_decode_across_chunk_boundaries(tmp_path: Path) -> None:
+    sandbox = tmp_path / "sandbox"
+    tool = FileIOTool(sandbox)
+    text = "é" * 70_000 + "\r\nend"
+    (sandbox / "big.txt").write_bytes(text.encode("utf-8"))
+
+    assert tool.run(action="read", path="big.txt").output == "é" * 70_000 + "\nend"
+
+
+def test_directory_swapped_for_symlink_is_rejected(tmp_path: Path) -> None:
+    sandbox = tmp_path / "sandbox"
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    tool = FileIOTool(sandbox)
+    assert tool.run(action="write", path="sub/a.txt", data="inside").success
+
+    (sandbox / "sub" / "a.txt").unlink()
+    (sandbox / "sub").rmdir()
+    (sandbox / "sub").symlink_to(outside, target_is_directory=True)
+
+    assert tool.run(action="write", path="sub/pwned.txt", data="x").error == "Path outside sandbox"
+    assert not (outside / "pwned.txt").exists()
@@ -0,0 +1,223 @@
+"""Tests for the transparent reporting system."""
+from __future__ import annotations
+
+import asyncio
+import csv
+import dataclasses
+import json
+import sys
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT / "src") not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from agi_core.system.reporting import ActionType, TransparentReportingSystem
+
+
+@pytest.fixture()
+def reporting(tmp_path: Path) -> Iterator[TransparentReportingSystem]:
+    system = TransparentReportingSystem(tmp_path / "reporting")
+    yield system
+    system.close()
+
+
+def _log_lines(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines() if line]
+
+
+def test_writes_are_buffered_until_flush(reporting: TransparentReportingSystem) -> None:
+    action_id = reporting.log_action(ActionType.FILE_OPERATION, "write notes", {"path": "notes.txt"}, "agent")
+    assert _log_lines(reporting.action_log_path) == []
+
+    reporting.flush()
+
+    assert [entry["action_id"] for entry in _log_lines(reporting.action_log_path)] == [action_id]
+    assert _log_lines(reporting.action_log_path)[0]["action_type"] == "file_operation"
+
+
+def test_history_round_trips_entries(reporting: TransparentReportingSystem) -> None:
+    reporting.log_action(ActionType.TERMINAL_COMMAND, "list files", {"command": "ls"}, "agent", risk_level="low")
+    reporting.log_action(ActionType.WEB_ACCESS, "fetch page", {}, "agent", status="failed")
+
+    history = reporting.get_action_history()
+    failed = reporting.get_action_history(status_filter="failed")
+    terminal = reporting.get_action_history(action_types=[ActionType.TERMINAL_COMMAND])
+
+    assert len(history) == 2
+    assert [entry.description for entry in failed] == ["fetch page"]
+    assert terminal[0].action_type is ActionType.TERMINAL_COMMAND
+    assert terminal[0].details == {"command": "ls"}
+
+
+def test_event_loop_logging_goes_through_queue(reporting: TransparentReportingSystem) -> None:
+    async def log_actions() -> None:
+        for index in range(3):
+            reporting.log_action(ActionType.PLANNING, f"step {index}", {}, "agent")
+        assert reporting.log_queue.qsize() == 3
+        await reporting.log_queue.join()
+
+    asyncio.run(log_actions())
+
+    assert reporting.log_queue.empty()
+    assert len(reporting.get_action_history()) == 3
+
+
+def test_each_event_loop_gets_its_own_queue(reporting: TransparentReportingSystem) -> None:
+    async def log_action(description: str) -> None:
+        reporting.log_action(ActionType.PLANNING, description, {}, "agent")
+        await asyncio.sleep(0)
+
+    asyncio.run(log_action("first"))
+    first_queue = reporting.log_queue
+    asyncio.run(log_action("second"))
+    reporting.flush()
+
+    assert reporting.log_queue is not first_queue
+    assert [entry["description"] for entry in _log_lines(reporting.action_log_path)] == ["first", "second"]
+
+
+def test_flush_from_another_thread_waits_for_drain_task(reporting: TransparentReportingSystem) -> None:
+    loop = asyncio.new_event_loop()
+    worker = threading.Thread(target=loop.run_forever)
+    worker.start()
+    try:
+        async def log_actions() -> None:
+            for index in range(5):
+                reporting.log_action(ActionType.PLANNING, f"step {index}", {}, "agent")
+
+        asyncio.run_coroutine_threadsafe(log_actions(), loop).result()
+        reporting.flush()
+
+        assert len(_log_lines(reporting.action_log_path)) == 5
+        assert reporting.log_queue.empty()
+    finally:
+        reporting.close()
+        loop.call_soon_threadsafe(loop.stop)
+        worker.join()
+        loop.close()
+
+
+def test_close_flushes_and_is_idempotent(tmp_path: Path) -> None:
+    system = TransparentReportingSystem(tmp_path)
+    system.log_action(ActionType.REASONING, "think", {}, "agent")
+
+    system.close()
+    system.close()
+
+    assert len(_log_lines(system.action_log_path)) == 1
+
+
+def test_report_aggregates_indexed_actions(reporting: TransparentReportingSystem) -> None:
+    reporting.log_action(ActionType.API_CALL, "call", {}, "agent", risk_level="high")
+    reporting.log_action(ActionType.API_CALL, "call again", {}, "agent", risk_level="low")
+    reporting.log_action(ActionType.PLANNING, "plan", {}, "agent")
+
+    report = reporting.generate_report()
+    dashboard = reporting.get_transparency_dashboard_data()
+
+    assert report["total_actions"] == 3
+    assert report["action_counts"] == {"api_call": 2, "planning": 1}
+    assert report["risk_distribution"] == {"low": 1, "medium": 0, "high": 1, "critical": 0}
+    assert dashboard["total_actions"] == 3
+    assert dashboard["last_24h_counts"]["by_risk"] == {"high": 1, "low": 1, "unknown": 1}
+    assert dashboard["recent_actions"][0]["description"] == "plan"
+
+
+def test_index_is_backfilled_from_existing_log(tmp_path: Path) -> None:
+    system = TransparentReportingSystem(tmp_path)
+    system.log_action(ActionType.MEMORY_OPERATION, "remember", {"key": "value"}, "agent")
+    system.close()
+    (tmp_path / "actions.db").unlink()
+
+    reopened = TransparentReportingSystem(tmp_path)
+    history = reopened.get_action_history()
+    reopened.close()
+
+    assert [entry.details for entry in history] == [{"key": "value"}]
+
+
+def test_dashboard_counters_survive_restart_and_expire(tmp_path: Path) -> None:
+    system = TransparentReportingSystem(tmp_path)
+    for index in range(12):
+        system.log_action(ActionType.TOOL_EXECUTION, f"tool {index}", {}, "agent", risk_level="medium")
+    system.close()
+
+    reopened = TransparentReportingSystem(tmp_path)
+    dashboard = reopened.get_transparency_dashboard_data()
+    assert dashboard["total_actions"] == 12
+    assert len(dashboard["recent_actions"]) == 10
+    assert dashboard["recent_actions"][0]["description"] == "tool 11"
+    assert dashboard["last_24h_counts"]["by_type"] == {"tool_execution": 12}
+
+    reopened._evict_expired_stats(datetime.now() + timedelta(hours=1))
+    dashboard = reopened.get_transparency_dashboard_data()
+    reopened.close()
+
+    assert dashboard["total_actions"] == 12
+    assert dashboard["last_24h_counts"] == {"total": 0, "by_type": {}, "by_risk": {}}
+
+
+def test_cleanup_keeps_recent_entries(reporting: TransparentReportingSystem) -> None:
+    reporting.log_action(ActionType.SYSTEM_OPERATION, "restart", {1: "numeric key"}, "agent")
+
+    reporting.cleanup_logs(retention_days=1)
+    reporting.log_action(ActionType.SYSTEM_OPERATION, "after cleanup", {}, "agent")
+    reporting.flush()
+
+    assert [entry["description"] for entry in _log_lines(reporting.action_log_path)] == ["restart", "after cleanup"]
+    assert not (reporting.log_dir / "summary.log").exists()
+    assert reporting.get_action_history()[-1].details == {"1": "numeric key"}
+
+
+def test_cleanup_drops_the_expired_prefix_of_large_logs(tmp_path: Path) -> None:
+    start = datetime.now() - timedelta(days=10)
+    lines = [
+        json.dumps({"timestamp": (start + timedelta(minutes=5 * index)).isoformat(), "action_id": f"a{index}"}) + "\n"
+        for index in range(2000)
+    ]
+    log_path = tmp_path / "actions.log"
+    log_path.write_text("".join(lines), encoding="utf-8")
+
+    cutoff = (start + timedelta(minutes=5 * 1234 - 1)).isoformat()
+    offset = TransparentReportingSystem._find_cutoff_offset(log_path, cutoff)
+    assert offset == sum(len(line) for line in lines[:1234])
+    assert TransparentReportingSystem._find_cutoff_offset(log_path, start.isoformat()) == 0
+    assert TransparentReportingSystem._find_cutoff_offset(log_path, datetime.now().isoformat()) == log_path.stat().st_size
+
+    system = TransparentReportingSystem(tmp_path)
+    system.cleanup_logs(retention_days=5)
+    system.close()
+
+    retained = _log_lines(log_path)
+    assert len(retained) < len(lines)
+    assert all(entry["timestamp"] >= (datetime.now() - timedelta(days=5, minutes=1)).isoformat() for entry in retained)
+    assert retained[-1]["action_id"] == "a1999"
+
+
+def test_csv_export_writes_one_row_per_action(reporting: TransparentReportingSystem, tmp_path: Path) -> None:
+    reporting.log_action(ActionType.API_CALL, "call", {"url": "https://example.com"}, "agent", tags=["net"])
+    reporting.log_action(ActionType.PLANNING, "plan", {}, "agent", duration_ms=1.5)
+
+    output = reporting.export_logs("csv", tmp_path / "export.csv")
+
+    with open(output, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["description"] for row in rows] == ["call", "plan"]
+    assert json.loads(rows[0]["details"]) == {"url": "https://example.com"}
+    assert rows[1]["duration_ms"] == "1.5"
+    assert rows[1]["risk_level"] == ""
+
+
+def test_history_entries_are_immutable(reporting: TransparentReportingSystem) -> None:
+    reporting.log_action(ActionType.REASONING, "think", {}, "agent")
+    entry = reporting.get_action_history()[0]
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        entry.status = "failed"  # type: ignore[misc]
+    assert not hasattr(entry, "__dict__")
@@ -1,6 +1,7 @@
 """Smoke tests for the REST client tool."""
 from __future__ import annotations
 
+import http.cookiejar
 import json
 import tempfile
 import threading
@@ -23,6 +24,20 @@ class _FakeResponse:
         self.headers = headers
         self.text = text
         self.encoding = "utf-8"
+        self.chunks_read = 0
+
+    @property
+    def content(self) -> bytes:
+        return self.text.encode(self.encoding)
+
+    def iter_content(self, chunk_size: int = 1):
+        content = self.text.encode(self.encoding)
+        for start in range(0, len(content), chunk_size):
+            self.chunks_read += 1
+            yield content[start : start + chunk_size]
+
+    def close(self) -> None:
+        pass
 
 
 class _FakeRequestException(Exception):
@@ -63,9 +78,33 @@ def _request(
         raise _FakeRequestException(str(exc)) from exc
 
 
+class _FakeSession:
+    def __init__(self) -> None:
+        self.headers: dict[str, str] = {}
+        self.cookies = http.cookiejar.CookieJar()
+        self.mounted: dict[str, object] = {}
+        self.closed = False
+        self.calls = 0
+
+    def mount(self, prefix: str, adapter: object) -> None:
+        self.mounted[prefix] = adapter
+
+    def request(
+        self, method: str, url: str, headers: dict[str, str] | None = None, stream: bool = False, **kwargs
+    ):
+        self.calls += 1
+        self.last_stream = stream
+        return _request(method, url, headers={**self.headers, **(headers or {})}, **kwargs)
+
+    def close(self) -> None:
+        self.closed = True
+
+
 fake_requests.RequestException = _FakeRequestException
 json_module = json
 fake_requests.request = _request
+fake_requests.Session = _FakeSession
+fake_requests.adapters = types.SimpleNamespace(HTTPAdapter=lambda **kwargs: kwargs)
 
 sys.modules.setdefault("requests", fake_requests)
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
@@ -158,6 +197,145 @@ class RestClientToolTests(TestCase):
         self.assertTrue(saved_file.exists())
         saved_payload = json.loads(saved_file.read_text(encoding="utf-8"))
         self.assertEqual(saved_payload["message"], "hello")
+        self.assertTrue(tool._session.last_stream)
+
+    def test_max_bytes_caps_the_streamed_preview(self) -> None:
+        server, thread = _start_server()
+        self.addCleanup(server.shutdown)
+        self.addCleanup(server.server_close)
+        self.addCleanup(lambda: thread.join(timeout=1))
+
+        host, port = server.server_address
+        tool = RestClientTool(allow_network=True, allowed_hosts=["127.0.0.1"], sandbox_root=self.sandbox)
+
+        payload = {"url": f"http://{host}:{port}/capped", "max_bytes": 12}
+        summary = json.loads(tool.run(self.context, json.dumps(payload)).output)
+
+        self.assertEqual(summary["body_preview"], '{"message": ')
+        self.assertTrue(tool._session.last_stream)
+        self.assertFalse(tool.run(self.context, json.dumps({**payload, "max_bytes": -1})).success)
+
+    def test_requests_share_one_session(self) -> None:
+        server, thread = _start_server()
+        self.addCleanup(server.shutdown)
+        self.addCleanup(server.server_close)
+        self.addCleanup(lambda: thread.join(timeout=1))
+
+        host, port = server.server_address
+        tool = RestClientTool(
+            allow_network=True,
+            allowed_hosts=["127.0.0.1"],
+            default_headers={"User-Agent": "agi-core-tests"},
+            auth_token="Bearer token",
+            sandbox_root=self.sandbox,
+        )
+        session = tool._session
+
+        for index in range(2):
+            payload = {"url": f"http://{host}:{port}/item/{index}"}
+            self.assertTrue(tool.run(self.context, json.dumps(payload)).success)
+
+        self.assertEqual(session.calls, 2)
+        self.assertEqual(set(session.mounted), {"http://", "https://"})
+        self.assertEqual(session.headers["Authorization"], "Bearer token")
+        self.assertEqual(session.cookies._policy.allowed_domains(), ())
+
+        tool.close()
+        self.assertTrue(session.closed)
+
+    def test_save_path_must_stay_in_sandbox(self) -> None:
+        tool = RestClientTool(allow_network=True, allowed_hosts=[], sandbox_root=self.sandbox)
+        outside = Path(tempfile.mkdtemp())
+        self.addCleanup(lambda: outside.rmdir())
+        (self.sandbox / "escape").symlink_to(outside, target_is_directory=True)
+
+        self.assertEqual(tool._resolve_path("out/a.json"), str(self.sandbox.resolve() / "out" / "a.json"))
+        for candidate in ("../a.json", "escape/a.json", str(outside / "a.json")):
+            with self.assertRaises(ValueError):
+                tool._resolve_path(candidate)
+
+        tool._resolve_path("sub/a.json")
+        (self.sandbox / "sub").symlink_to(outside, target_is_directory=True)
+        with self.assertRaises(ValueError):
+            tool._resolve_path("sub/pwned.json")
+
+    def test_url_hosts_are_checked_against_the_allowlist(self) -> None:
+        tool = RestClientTool(allow_network=True, allowed_hosts=["API.example.com"], sandbox_root=self.sandbox)
+
+        for url in ("https://api.example.com/v1", "http://API.EXAMPLE.COM:8080?q=1", "HTTPS://api.example.com#x"):
+            tool._validate_url(url)
+        for url in ("https://user@evil.com/", "http://api.example.com.evil.com/", "ftp://api.example.com/"):
+            with self.assertRaises(ValueError):
+                tool._validate_url(url)
+
+    def test_unknown_charset_falls_back_to_utf8(self) -> None:
+        self.assertEqual(rest_client_module._decode_preview("h\u00e9".encode("utf-8"), "x-bogus"), "h\u00e9")
+
+    def test_default_authorization_header_suppresses_token(self) -> None:
+        tool = RestClientTool(
+            allow_network=True,
+            allowed_hosts=[],
+            default_headers={"authorization": "Basic abc"},
+            auth_token="Bearer token",
+            sandbox_root=self.sandbox,
+        )
+
+        self.assertEqual(tool._session.headers, {"authorization": "Basic abc"})
+
+    def test_disabled_network_fails_without_a_session(self) -> None:
+        tool = RestClientTool(allow_network=False, allowed_hosts=["127.0.0.1"], sandbox_root=self.sandbox)
+
+        result = tool.run(self.context, json.dumps({"url": "http://127.0.0.1/"}))
+
+        self.assertFalse(result.success)
+        self.assertEqual(result.error, "Network access is disabled for REST client")
+        self.assertIsNone(tool._session)
+
+    def test_run_batch_reports_each_instruction_in_order(self) -> None:
+        server, thread = _start_server()
+        self.addCleanup(server.shutdown)
+        self.addCleanup(server.server_close)
+        self.addCleanup(lambda: thread.join(timeout=1))
+
+        host, port = server.server_address
+        tool = RestClientTool(allow_network=True, allowed_hosts=["127.0.0.1"], sandbox_root=self.sandbox)
+        instructions = [
+            json.dumps({"url": f"http://{host}:{port}/first"}),
+            json.dumps({"url": "http://evil.example/"}),
+            "{broken",
+            json.dumps({"url": f"http://{host}:{port}/second"}),
+        ]
+
+        results = tool.run_batch(self.context, instructions)
+
+        self.assertEqual([result.success for result in results], [True, False, False, True])
+        self.assertIn("/first", json.loads(results[0].output)["body_preview"])
+        self.assertIn("not permitted", results[1].error)
+        self.assertIn("Invalid REST instruction JSON", results[2].error)
+        self.assertIn("/second", json.loads(results[3].output)["body_preview"])
+        self.assertEqual(tool._session.calls, 2)
+
+    def test_run_batch_rejects_non_object_payloads_per_item(self) -> None:
+        server, thread = _start_server()
+        self.addCleanup(server.shutdown)
+        self.addCleanup(server.server_close)
+        self.addCleanup(lambda: thread.join(timeout=1))
+
+        host, port = server.server_address
+        tool = RestClientTool(allow_network=True, allowed_hosts=["127.0.0.1"], sandbox_root=self.sandbox)
+        instructions = [
+            "[1]",
+            json.dumps({"url": f"http://{host}:{port}/ok"}),
+            json.dumps({"url": f"http://{host}:{port}/gql", "graphql": "q"}),
+        ]
+
+        results = tool.run_batch(self.context, instructions)
+
+        self.assertEqual([result.success for result in results], [False, True, False])
+        self.assertIn("must be a JSON object", results[0].error)
+        self.assertIn("/ok", json.loads(results[1].output)["body_preview"])
+        self.assertIn("'graphql' must be a JSON object", results[2].error)
+        self.assertEqual(tool._session.calls, 1)
 
     def test_graphql_request(self) -> None:
         server, thread = _start_server()
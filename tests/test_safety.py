@@ -0,0 +1,28 @@
+"""Tests for the goal safety guard."""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT / "src") not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from agi_core.system.safety import SafetyGuard
+
+
+def test_default_keywords_are_rejected_case_insensitively() -> None:
+    guard = SafetyGuard()
+
+    assert guard.approve_goal("Summarize the project README")
+    assert not guard.approve_goal("Run RM -RF on the build directory")
+    assert not guard.approve_goal("shutdown the server")
+
+
+def test_custom_keywords_are_matched_literally() -> None:
+    guard = SafetyGuard(["drop table", "a+b"])
+
+    assert not guard.approve_goal("please DROP TABLE users")
+    assert not guard.approve_goal("compute a+b")
+    assert guard.approve_goal("compute aab")
+    assert guard.approve_goal("shutdown is allowed here")
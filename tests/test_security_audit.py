@@ -0,0 +1,121 @@
+"""Tests for the file-backed audit log store."""
+from __future__ import annotations
+
+import gc
+import json
+import sys
+import weakref
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT / "src") not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from agi_core.security.audit import (
+    AuditEventType,
+    AuditLogger,
+    FileBasedAuditLogStore,
+    InMemoryAuditLogStore,
+)
+
+
+def _log_lines(storage: Path) -> list[dict]:
+    text = (storage / "audit.log").read_text(encoding="utf-8")
+    return [json.loads(line) for line in text.splitlines() if line]
+
+
+def test_events_are_buffered_until_flush_interval(tmp_path: Path) -> None:
+    store = FileBasedAuditLogStore(tmp_path, flush_interval=3)
+    logger = AuditLogger(store)
+
+    logger.log_event(AuditEventType.USER_ACTION, "tester", "first", "resource")
+    logger.log_event(AuditEventType.USER_ACTION, "tester", "second", "resource")
+    assert _log_lines(tmp_path) == []
+
+    logger.log_event(AuditEventType.USER_ACTION, "tester", "third", "resource")
+    assert [entry["action"] for entry in _log_lines(tmp_path)] == ["first", "second", "third"]
+    store.close()
+
+
+def test_close_flushes_pending_events(tmp_path: Path) -> None:
+    store = FileBasedAuditLogStore(tmp_path)
+    AuditLogger(store).log_security_violation("tester", "content_filter", "rm -rf /")
+
+    store.close()
+    store.close()
+
+    entries = _log_lines(tmp_path)
+    assert len(entries) == 1
+    assert entries[0]["event_type"] == AuditEventType.SECURITY_VIOLATION.value
+    assert FileBasedAuditLogStore(tmp_path).get_events(actor="tester")[0].resource == "rm -rf /"
+
+
+def test_closed_store_is_not_kept_alive_by_the_exit_hook(tmp_path: Path) -> None:
+    store = FileBasedAuditLogStore(tmp_path)
+    ref = weakref.ref(store)
+
+    store.close()
+    del store
+    gc.collect()
+
+    assert ref() is None
+
+
+def test_sampling_coalesces_repeated_successful_events() -> None:
+    store = InMemoryAuditLogStore()
+    logger = AuditLogger(store, sampling_window=60.0)
+
+    ids = [logger.log_permission_check("agent", "terminal", "read_write", granted=True) for _ in range(5)]
+    assert len(set(ids)) == 5 and all(ids)
+    logger.log_permission_check("agent", "terminal", "read_write", granted=False)
+    logger.log_permission_check("agent", "terminal", "read_write", granted=False)
+
+    assert len(store.get_events()) == 3
+
+    logger.flush_sampled()
+    events = store.get_events()
+    summaries = [event for event in events if "occurrences" in event.metadata]
+    assert len(events) == 4
+    assert len(summaries) == 1
+    assert summaries[0].metadata["occurrences"] == 4
+    assert summaries[0].success
+
+
+def test_expired_sampling_window_stores_event_again() -> None:
+    store = InMemoryAuditLogStore()
+    logger = AuditLogger(store, sampling_window=0.0)
+
+    logger.log_event(AuditEventType.USER_ACTION, "tester", "ping", "resource")
+    logger.log_event(AuditEventType.USER_ACTION, "tester", "ping", "resource")
+
+    assert len(store.get_events()) == 2
+    assert all("occurrences" not in event.metadata for event in store.get_events())
+
+
+def test_expired_sampling_windows_are_summarised_by_later_events(monkeypatch) -> None:
+    store = InMemoryAuditLogStore()
+    logger = AuditLogger(store, sampling_window=10.0)
+    clock = iter([100.0, 101.0, 102.0, 115.0])
+    monkeypatch.setattr("agi_core.security.audit.time.time", lambda: next(clock))
+
+    logger.log_event(AuditEventType.USER_ACTION, "tester", "ping", "a")
+    logger.log_event(AuditEventType.USER_ACTION, "tester", "ping", "a")
+    logger.log_event(AuditEventType.USER_ACTION, "tester", "ping", "a")
+    logger.log_event(AuditEventType.USER_ACTION, "tester", "other", "b")
+
+    summaries = [event for event in store.get_events() if "occurrences" in event.metadata]
+    assert [summary.metadata["occurrences"] for summary in summaries] == [2]
+    assert list(logger._sampled) == [("tester", AuditEventType.USER_ACTION, "b", "other", True)]
+
+
+def test_sampled_keys_are_capped(monkeypatch) -> None:
+    store = InMemoryAuditLogStore()
+    logger = AuditLogger(store, sampling_window=60.0)
+    monkeypatch.setattr(AuditLogger, "MAX_SAMPLED_KEYS", 2)
+
+    for resource in ("a", "a", "b", "c"):
+        logger.log_event(AuditEventType.USER_ACTION, "tester", "ping", resource)
+
+    assert [key[2] for key in logger._sampled] == ["b", "c"]
+    summaries = [event for event in store.get_events() if "occurrences" in event.metadata]
+    assert [(summary.resource, summary.metadata["occurrences"]) for summary in summaries] == [("a", 1)]
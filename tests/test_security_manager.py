@@ -0,0 +1,141 @@
+"""Tests for the SecurityManager facade."""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT / "src") not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from agi_core.security.config import SecurityConfig
+from agi_core.security.consent import ConsentType
+from agi_core.security.manager import SecurityManager
+from agi_core.security.permissions import SystemFunction
+from agi_core.security.policies import PolicyType
+
+
+@pytest.fixture()
+def security_manager(tmp_path: Path) -> Iterator[SecurityManager]:
+    manager = SecurityManager(SecurityConfig(audit_storage_path=tmp_path / "audit"))
+    yield manager
+    manager.audit_logger._audit_store.close()
+
+
+def test_validate_command_applies_terminal_deny_rules(security_manager: SecurityManager) -> None:
+    assert security_manager.validate_command("ls -la")
+    assert security_manager.validate_command("python script.py")
+    assert not security_manager.validate_command("curl http://example.com")
+    assert not security_manager.validate_command("/usr/bin/wget file")
+    assert security_manager.validate_command("")
+
+
+def test_validate_path_applies_file_io_deny_rules(security_manager: SecurityManager) -> None:
+    assert security_manager.validate_path("/tmp/data.txt")
+    assert security_manager.validate_path("/home/user/notes.md")
+    assert not security_manager.validate_path("/etc/passwd")
+    assert not security_manager.validate_path(".env")
+
+
+def test_validation_disabled_without_policy_enforcement(tmp_path: Path) -> None:
+    config = SecurityConfig(audit_storage_path=tmp_path / "audit", policy_enforcement_enabled=False)
+    manager = SecurityManager(config)
+
+    assert manager.validate_path("/etc/passwd")
+    assert manager.validate_command("curl http://example.com")
+    manager.audit_logger._audit_store.close()
+
+
+def test_evaluate_policy_accepts_enum_and_string(security_manager: SecurityManager) -> None:
+    assert security_manager.evaluate_policy(PolicyType.SYSTEM_MONITOR, {})
+    assert security_manager.evaluate_policy("system_monitor", {})
+    assert not security_manager.evaluate_policy("unknown", {})
+
+
+def test_audit_disabled_skips_event_logging(tmp_path: Path) -> None:
+    config = SecurityConfig(audit_storage_path=tmp_path / "audit", audit_logging_enabled=False)
+    manager = SecurityManager(config)
+
+    manager.check_permission(SystemFunction.TERMINAL)
+    manager.evaluate_policy(PolicyType.TERMINAL, {"command": "ls"})
+    manager.check_content_safety("rm -rf /")
+
+    assert manager.audit_logger.get_events() == []
+    manager.audit_logger._audit_store.close()
+
+
+def test_authorize_combines_all_checks(security_manager: SecurityManager) -> None:
+    result = security_manager.authorize(
+        SystemFunction.SYSTEM_MONITOR, PolicyType.SYSTEM_MONITOR, {}, content="uptime"
+    )
+
+    assert result.allowed
+    assert result.denied_by is None
+    assert result.risk_summary.startswith("Risk level:")
+
+
+def test_authorize_reports_denying_check(security_manager: SecurityManager) -> None:
+    denied_by_policy = security_manager.authorize(
+        SystemFunction.TERMINAL, PolicyType.TERMINAL, {"command": "curl"}
+    )
+    denied_by_guardrails = security_manager.authorize(
+        SystemFunction.SYSTEM_MONITOR, PolicyType.SYSTEM_MONITOR, {}, content="rm -rf /"
+    )
+
+    assert not denied_by_policy.allowed
+    assert denied_by_policy.denied_by == "policy"
+    assert not denied_by_guardrails.allowed
+    assert denied_by_guardrails.denied_by == "guardrails"
+    assert denied_by_guardrails.violations == ["gd_rm_rf"]
+
+
+def test_close_stops_check_workers_and_audit_store(security_manager: SecurityManager) -> None:
+    security_manager.authorize(SystemFunction.SYSTEM_MONITOR, PolicyType.SYSTEM_MONITOR, {})
+
+    security_manager.close()
+    security_manager.close()
+
+    assert all(not thread.is_alive() for thread in security_manager._executor._threads)
+    assert security_manager._audit_store._fh.closed
+    with pytest.raises(RuntimeError):
+        security_manager.authorize(SystemFunction.SYSTEM_MONITOR, PolicyType.SYSTEM_MONITOR, {})
+
+
+def test_assess_risk_orders_levels_by_severity(security_manager: SecurityManager) -> None:
+    allowed, _, _ = security_manager.assess_risk("list", {"command": "ls"})
+    blocked, summary, _ = security_manager.assess_risk("wipe", {"command": "rm -rf /tmp/x"})
+
+    assert allowed
+    assert not blocked
+    assert "critical" in summary
+
+
+def test_disabled_features_short_circuit(tmp_path: Path) -> None:
+    config = SecurityConfig(
+        audit_storage_path=tmp_path / "audit",
+        permission_enabled=False,
+        consent_required=False,
+        guardrails_enabled=False,
+        risk_assessment_enabled=False,
+    )
+    manager = SecurityManager(config)
+
+    assert manager.check_permission(SystemFunction.CREDENTIALS)
+    assert manager.check_content_safety("rm -rf /") == (True, [])
+    assert manager.assess_risk("wipe", {"command": "rm -rf /"}) == (True, "Risk assessment disabled", [])
+    assert manager.check_consent_status(manager.request_consent(ConsentType.FILE_ACCESS, "read"))
+    assert manager.authorize(SystemFunction.CREDENTIALS, PolicyType.SYSTEM_MONITOR, {}, "rm -rf /").allowed
+    manager.audit_logger._audit_store.close()
+
+
+def test_initialize_security_for_agent_is_idempotent(security_manager: SecurityManager) -> None:
+    security_manager.initialize_security_for_agent()
+    security_manager.initialize_security_for_agent()
+
+    security_manager.audit_logger._audit_store.flush()
+    events = security_manager.audit_logger.search_events("Security initialization")
+    assert len(events) == 1
+    assert events[0].metadata["permission_enabled"] is True
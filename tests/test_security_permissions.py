@@ -0,0 +1,105 @@
+"""Tests for the permission manager access checks."""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT / "src") not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from agi_core.security.permissions import (
+    Permission,
+    PermissionLevel,
+    PermissionManager,
+    SystemFunction,
+)
+
+
+@pytest.fixture()
+def manager(tmp_path: Path) -> PermissionManager:
+    manager = PermissionManager()
+    manager.create_profile(
+        "test",
+        {
+            SystemFunction.FILE_SYSTEM: Permission(
+                function=SystemFunction.FILE_SYSTEM,
+                level=PermissionLevel.LIMITED_WRITE,
+                allowed_paths=(tmp_path / "sandbox",),
+            ),
+            SystemFunction.TERMINAL: Permission(
+                function=SystemFunction.TERMINAL,
+                level=PermissionLevel.LIMITED_WRITE,
+                allowed_commands=("ls", "echo"),
+            ),
+        },
+    )
+    assert manager.set_active_profile("test")
+    return manager
+
+
+def test_command_allowed_by_name(manager: PermissionManager) -> None:
+    assert manager.is_command_allowed(SystemFunction.TERMINAL, "ls")
+    assert manager.is_command_allowed(SystemFunction.TERMINAL, "/bin/echo")
+    assert not manager.is_command_allowed(SystemFunction.TERMINAL, "rm")
+    assert not manager.is_command_allowed(SystemFunction.BROWSER, "ls")
+
+
+def test_path_allowed_within_sandbox(manager: PermissionManager, tmp_path: Path) -> None:
+    sandbox = tmp_path / "sandbox"
+
+    assert manager.is_path_allowed(SystemFunction.FILE_SYSTEM, sandbox / "notes.txt")
+    assert manager.is_path_allowed(SystemFunction.FILE_SYSTEM, sandbox / "a" / ".." / "b")
+    assert not manager.is_path_allowed(SystemFunction.FILE_SYSTEM, sandbox / ".." / "escape")
+    assert not manager.is_path_allowed(SystemFunction.TERMINAL, sandbox)
+
+
+def test_path_checks_follow_cwd_and_symlink_changes(
+    manager: PermissionManager, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    sandbox = tmp_path / "sandbox"
+    (sandbox / "sub").mkdir(parents=True)
+    outside = tmp_path / "outside"
+    outside.mkdir()
+
+    monkeypatch.chdir(sandbox)
+    assert manager.is_path_allowed(SystemFunction.FILE_SYSTEM, Path("notes.txt"))
+    monkeypatch.chdir(outside)
+    assert not manager.is_path_allowed(SystemFunction.FILE_SYSTEM, Path("notes.txt"))
+
+    assert manager.is_path_allowed(SystemFunction.FILE_SYSTEM, sandbox / "sub" / "a.txt")
+    (sandbox / "sub").rmdir()
+    (sandbox / "sub").symlink_to(outside, target_is_directory=True)
+    assert not manager.is_path_allowed(SystemFunction.FILE_SYSTEM, sandbox / "sub" / "a.txt")
+
+
+def test_no_active_profile_denies_everything() -> None:
+    manager = PermissionManager()
+
+    assert not manager.is_command_allowed(SystemFunction.TERMINAL, "ls")
+    assert not manager.is_path_allowed(SystemFunction.FILE_SYSTEM, Path("sandbox"))
+
+
+def test_path_prefix_must_end_at_separator(manager: PermissionManager, tmp_path: Path) -> None:
+    assert manager.is_path_allowed(SystemFunction.FILE_SYSTEM, tmp_path / "sandbox")
+    assert not manager.is_path_allowed(SystemFunction.FILE_SYSTEM, tmp_path / "sandbox-other")
+
+
+def test_root_allowed_path_matches_everything() -> None:
+    manager = PermissionManager()
+    manager.create_profile(
+        "root",
+        {
+            SystemFunction.FILE_SYSTEM: Permission(
+                function=SystemFunction.FILE_SYSTEM,
+                level=PermissionLevel.FULL_ACCESS,
+                allowed_paths=(Path("/"),),
+            )
+        },
+    )
+    manager.set_active_profile("root")
+
+    assert manager.is_path_allowed(SystemFunction.FILE_SYSTEM, Path("/"))
+    assert manager.is_path_allowed(SystemFunction.FILE_SYSTEM, Path("/etc/hosts"))
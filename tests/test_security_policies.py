@@ -0,0 +1,49 @@
+"""Tests for tool security policy evaluation."""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT / "src") not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from agi_core.security.policies import PolicyRule, PolicyType, SecurityPolicyManager, ToolPolicy
+
+
+def test_default_terminal_policy() -> None:
+    manager = SecurityPolicyManager()
+
+    assert manager.evaluate_policy(PolicyType.TERMINAL, {"command": "ls"})
+    assert manager.evaluate_policy(PolicyType.TERMINAL, {"path": "/tmp/work"})
+    assert not manager.evaluate_policy(PolicyType.TERMINAL, {"command": "curl"})
+    assert not manager.evaluate_policy(PolicyType.TERMINAL, {"command": "ls", "path": "/etc/passwd"})
+    assert not manager.evaluate_policy(PolicyType.TERMINAL, {})
+
+
+def test_deny_rules_win_over_higher_priority_allow_rules() -> None:
+    policy = ToolPolicy(
+        PolicyType.NETWORK,
+        [
+            PolicyRule("allow_all", "Allow everything", "always", "allow", priority=1),
+            PolicyRule("deny_host", "Deny one host", "host_in('evil.test')", "deny", priority=50),
+            PolicyRule("warn_host", "Warn on host", "host_in('odd.test')", "warn", priority=0),
+        ],
+    )
+
+    assert policy.evaluate({"host": "evil.test"}) == "deny"
+    assert policy.evaluate({"host": "odd.test"}) == "allow"
+    assert policy.evaluate({}) == "allow"
+
+
+def test_unknown_and_failing_conditions_do_not_match() -> None:
+    policy = ToolPolicy(
+        PolicyType.TERMINAL,
+        [
+            PolicyRule("mystery", "Unparseable condition", "sometimes()", "allow"),
+            PolicyRule("cmd", "Allow ls", "command_in('ls')", "allow"),
+        ],
+    )
+
+    assert policy.evaluate({"command": ["ls"]}) == "deny"
+    assert policy.evaluate({"command": "ls"}) == "allow"
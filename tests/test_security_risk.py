@@ -0,0 +1,170 @@
+"""Tests for the rule-based risk assessment engine."""
+from __future__ import annotations
+
+import bisect
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT / "src") not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from agi_core.security.risk import (
+    RiskAssessmentManager,
+    RiskCategory,
+    RiskFactor,
+    RiskLevel,
+    RuleBasedRiskEngine,
+    _LEVELS,
+    _THRESHOLDS,
+)
+
+
+def test_safe_operation_has_no_risk() -> None:
+    assessment = RuleBasedRiskEngine().assess_risk("list", {"command": "ls -la", "path": "sandbox"})
+
+    assert assessment.risk_level is RiskLevel.NONE
+    assert assessment.factors == []
+    assert assessment.execution_allowed
+
+
+def test_critical_factor_short_circuits_evaluation() -> None:
+    context = {"command": "rm -rf /tmp/data", "path": "/etc/hosts", "content": "password"}
+
+    fast = RuleBasedRiskEngine().assess_risk("wipe", context)
+    thorough = RuleBasedRiskEngine(thorough=True).assess_risk("wipe", context)
+
+    assert fast.risk_level is RiskLevel.CRITICAL
+    assert [factor.severity for factor in fast.factors] == [RiskLevel.CRITICAL]
+    assert not fast.execution_allowed
+    assert len(thorough.factors) == 3
+    assert {factor.category for factor in thorough.factors} >= {
+        RiskCategory.SYSTEM_INTEGRITY,
+        RiskCategory.DATA_PRIVACY,
+    }
+    assert not thorough.execution_allowed
+
+
+def test_rules_are_ordered_by_priority_including_custom_rules() -> None:
+    engine = RuleBasedRiskEngine()
+    manager = RiskAssessmentManager(engine)
+    manager.register_custom_risk_rule(
+        lambda ctx: "sudo" in ctx.get("command", ""),
+        RiskFactor(
+            category=RiskCategory.UNAUTHORIZED_ACCESS,
+            severity=RiskLevel.HIGH,
+            weight=0.9,
+            description="Privilege escalation",
+            mitigation="Avoid running commands as root",
+        ),
+    )
+
+    priorities = [rule["priority"] for rule in engine._risk_rules]
+    assert priorities == sorted(priorities, reverse=True)
+    assert engine._risk_rules[0]["factor"].severity is RiskLevel.CRITICAL
+    assert engine._risk_rules[1]["factor"].description == "Privilege escalation"
+    assert manager.assess_operation("elevate", {"command": "sudo ls"}).risk_level is RiskLevel.HIGH
+
+
+def test_rule_conditions_match_context_fields() -> None:
+    engine = RuleBasedRiskEngine(thorough=True)
+
+    def categories(context: dict) -> set:
+        return {factor.category for factor in engine.assess_risk("op", context).factors}
+
+    assert categories({"content": "My PASSWORD is hunter2"}) == {RiskCategory.DATA_PRIVACY}
+    assert categories({"tool": "terminal", "target": "192.168.1.1"}) == {RiskCategory.NETWORK_SECURITY}
+    assert categories({"tool": "file_io", "target": "192.168.1.1"}) == set()
+    assert categories({"code": "while True: pass"}) == {RiskCategory.RESOURCE_UTILIZATION}
+    assert categories({"command": "dd if=/dev/zero of=disk"}) == {RiskCategory.SYSTEM_INTEGRITY}
+
+
+def test_assessments_are_memoized_until_rules_change() -> None:
+    engine = RuleBasedRiskEngine()
+    context = {"command": "sudo ls"}
+
+    first = engine.assess_risk("elevate", context)
+    second = engine.assess_risk("elevate", context)
+    assert second is not first
+    assert second.risk_level is first.risk_level is RiskLevel.NONE
+    assert second.timestamp >= first.timestamp
+
+    engine.add_rule(
+        lambda ctx: "sudo" in ctx.get("command", ""),
+        RiskFactor(RiskCategory.UNAUTHORIZED_ACCESS, RiskLevel.HIGH, 0.9, "Privilege escalation", "Avoid root"),
+    )
+    assert engine.assess_risk("elevate", context).risk_level is RiskLevel.HIGH
+
+
+def test_unhashable_context_bypasses_cache() -> None:
+    engine = RuleBasedRiskEngine()
+
+    assessment = engine.assess_risk("run", {"command": "ls", "args": ["-la"]})
+
+    assert assessment.risk_level is RiskLevel.NONE
+    assert engine._cache == {}
+
+
+def test_risk_levels_are_ordered_with_string_labels() -> None:
+    assert RiskLevel.NONE < RiskLevel.LOW < RiskLevel.MEDIUM < RiskLevel.HIGH < RiskLevel.CRITICAL
+    assert RiskLevel.HIGH.label == "high"
+
+    assessment = RuleBasedRiskEngine().assess_risk("wipe", {"command": "rm -rf /"})
+    assert assessment.recommendations[0].endswith("(Risk: critical)")
+
+
+def test_recommendations_follow_matched_rules() -> None:
+    engine = RuleBasedRiskEngine(thorough=True)
+
+    assessment = engine.assess_risk("read", {"path": "/etc/app/config"})
+
+    assert assessment.recommendations == [
+        "Ensure operation is authorized and necessary (Risk: high)",
+        "Verify access is necessary and authorized (Risk: medium)",
+    ]
+    assert engine.assess_risk("wipe", {"command": "rm -rf /"}).recommendations[1:] == [
+        "Consider running in a more restricted environment",
+        "Obtain additional authorization before proceeding",
+    ]
+
+
+def test_compiled_checker_matches_rules_in_priority_order() -> None:
+    engine = RuleBasedRiskEngine(thorough=True)
+
+    def matched(context: dict) -> list:
+        return [rule["factor"].description for rule in engine._check(context)]
+
+    assert matched({}) == []
+    assert matched({"path": "/etc/app/.env", "content": "API key"}) == [
+        "Access to system directories",
+        "Handling of sensitive data",
+        "Access to configuration files",
+    ]
+    assert matched({"tool": "browser", "target": "nmap 10.0.0.1"}) == ["Network scanning or probing activity"]
+    assert matched({"command": "cat 1TB.img", "code": "while :"}) == [
+        "Potential infinite loop or resource consumption",
+        "Large file operations",
+    ]
+
+
+def test_only_system_directories_count_as_system_paths() -> None:
+    engine = RuleBasedRiskEngine()
+
+    assert engine.assess_risk("read", {"path": "/home/user/notes.txt"}).risk_level is RiskLevel.NONE
+    assert engine.assess_risk("read", {"path": "/usr/bin/python"}).risk_level is RiskLevel.HIGH
+
+
+def test_score_thresholds_map_to_levels() -> None:
+    def level(score: float) -> RiskLevel:
+        return _LEVELS[bisect.bisect_right(_THRESHOLDS, score)]
+
+    assert [level(score) for score in (0.0, 0.1, 0.39, 0.4, 0.6, 0.79, 0.8, 1.0)] == [
+        RiskLevel.NONE,
+        RiskLevel.LOW,
+        RiskLevel.LOW,
+        RiskLevel.MEDIUM,
+        RiskLevel.HIGH,
+        RiskLevel.HIGH,
+        RiskLevel.CRITICAL,
+        RiskLevel.CRITICAL,
+    ]
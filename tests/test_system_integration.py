@@ -0,0 +1,333 @@
+"""Tests for the system integration tools."""
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import threading
+import time
+import types
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT / "src") not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from agi_core.security.config import SecurityConfig
+from agi_core.security.manager import SecurityManager
+from agi_core.tools.base import ToolError
+from agi_core.tools.system_integration import (
+    ApplicationDiscoveryTool,
+    FileSystemIntegrationTool,
+    SystemResourceMonitor,
+    TerminalIntegrationTool,
+    WebIntegrationTool,
+    _list_app_bundles,
+)
+import agi_core.tools.system_integration as integration
+
+
+@pytest.fixture()
+def security_manager(tmp_path: Path) -> Iterator[SecurityManager]:
+    manager = SecurityManager(SecurityConfig(audit_storage_path=tmp_path / "audit"))
+    yield manager
+    manager.audit_logger._audit_store.close()
+
+
+def _permissive_manager() -> types.SimpleNamespace:
+    """Allow-everything stand-in for the policy hooks SecurityManager lacks."""
+    return types.SimpleNamespace(
+        check_permission=lambda *args: True,
+        validate_command=lambda command: True,
+        validate_url=lambda url: True,
+        assess_command_risk=lambda command: "LOW",
+    )
+
+
+@pytest.mark.skipif(os.name == "nt", reason="PATH lookup is the Unix branch")
+def test_check_app_installed_searches_path(
+    security_manager: SecurityManager, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    (bin_dir / "demo-app").write_text("#!/bin/sh\n", encoding="utf-8")
+    (bin_dir / "demo-app").chmod(0o755)
+    monkeypatch.setenv("PATH", str(bin_dir))
+    tool = ApplicationDiscoveryTool(security_manager)
+
+    assert tool._run(action="check_app_installed", app_name="demo-app") == {"installed": True}
+    assert tool._run(action="check_app_installed", app_name="missing-app") == {"installed": False}
+
+
+def test_windows_app_lookup_skips_unreadable_folders(
+    security_manager: SecurityManager, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    locked = tmp_path / "locked"
+    readable = tmp_path / "readable"
+    (locked / "demo").mkdir(parents=True)
+    (readable / "demo" / "bin").mkdir(parents=True)
+    (readable / "demo" / "bin" / "demo.exe").write_text("", encoding="utf-8")
+    monkeypatch.setattr(integration, "_IS_WINDOWS", True)
+    monkeypatch.setenv("ProgramFiles", str(locked))
+    monkeypatch.setenv("ProgramFiles(x86)", str(readable))
+    real_scandir = os.scandir
+
+    def scandir(path):
+        if os.fspath(path) == str(locked / "demo"):
+            raise PermissionError(13, "Access is denied", path)
+        return real_scandir(path)
+
+    monkeypatch.setattr(integration.os, "scandir", scandir)
+    tool = ApplicationDiscoveryTool(security_manager)
+
+    assert tool._check_application_installed("demo")
+
+
+def test_app_bundle_listing_is_rescanned_only_when_the_folder_changes(tmp_path: Path) -> None:
+    (tmp_path / "One.app").mkdir()
+    (tmp_path / "notes.txt").write_text("x", encoding="utf-8")
+    assert _list_app_bundles(str(tmp_path)) == ["One.app"]
+
+    os.utime(tmp_path, ns=(0, 0))
+    cached = _list_app_bundles(str(tmp_path))
+    assert _list_app_bundles(str(tmp_path)) is cached
+
+    (tmp_path / "Two.app").mkdir()
+    assert sorted(_list_app_bundles(str(tmp_path))) == ["One.app", "Two.app"]
+
+
+@pytest.mark.skipif(os.name == "nt", reason="application details are only probed on Unix")
+def test_app_info_is_cached_until_the_executable_changes(
+    security_manager: SecurityManager, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    app = bin_dir / "demo-info"
+    app.write_text("#!/bin/sh\necho \"$1 v1\"\n", encoding="utf-8")
+    app.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}")
+    tool = ApplicationDiscoveryTool(security_manager)
+
+    first = tool._run(action="get_app_info", app_name="demo-info")
+    app.write_text("#!/bin/sh\necho \"$1 v2\"\n", encoding="utf-8")
+    os.utime(app, (0, 0))
+
+    assert first["details"] == {"version": "--version v1", "help": "--help v1\n"}
+    assert tool._run(action="get_app_info", app_name="demo-info")["details"]["version"] == "--version v2"
+
+
+def test_app_info_cache_is_bounded_and_per_instance(
+    security_manager: SecurityManager, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(integration, "_APP_INFO_CACHE_SIZE", 2)
+    monkeypatch.setattr(integration.shutil, "which", lambda name: sys.executable)
+    monkeypatch.setattr(
+        integration.subprocess,
+        "run",
+        lambda args, **kwargs: subprocess.CompletedProcess(args, 0, stdout=f"{args[0]} {args[1]}"),
+    )
+    tool = ApplicationDiscoveryTool(security_manager)
+
+    for name in ("one", "two", "one", "three"):
+        tool._get_application_details(name)
+
+    assert [key[0] for key in tool._app_info_cache] == ["one", "three"]
+    assert ApplicationDiscoveryTool(security_manager)._app_info_cache == {}
+
+
+def test_search_files_matches_names_at_any_depth(security_manager: SecurityManager, tmp_path: Path) -> None:
+    root = tmp_path / "tree"
+    (root / "pkg" / "sub").mkdir(parents=True)
+    (root / "top.py").write_text("a", encoding="utf-8")
+    (root / "pkg" / "sub" / "deep.py").write_text("bb", encoding="utf-8")
+    (root / "pkg" / "notes.txt").write_text("c", encoding="utf-8")
+    (root / "pkg" / "dir.py").mkdir()
+    tool = FileSystemIntegrationTool(security_manager)
+
+    result = tool._run(action="search_files", pattern="*.py", directory=str(root))
+
+    expected = {p.resolve() for p in root.rglob("*.py") if p.is_file()}
+    assert {Path(match["path"]) for match in result["matches"]} == expected
+    assert {match["name"]: match["size"] for match in result["matches"]} == {"top.py": 1, "deep.py": 2}
+
+
+def test_search_files_accepts_several_patterns(security_manager: SecurityManager, tmp_path: Path) -> None:
+    root = tmp_path / "tree"
+    (root / "pkg").mkdir(parents=True)
+    for name in ("a.py", "pkg/b.txt", "pkg/c.md", "pkg/d.json"):
+        (root / name).write_text("x", encoding="utf-8")
+    tool = FileSystemIntegrationTool(security_manager)
+
+    result = tool._run(action="search_files", patterns=["*.py", "*.md", "pkg/*.txt", "a.*"], directory=str(root))
+
+    assert sorted(match["name"] for match in result["matches"]) == ["a.py", "b.txt", "c.md"]
+
+
+def test_page_title_and_text_are_extracted(security_manager: SecurityManager) -> None:
+    tool = WebIntegrationTool(security_manager)
+    html = (
+        "<html><head><TITLE>Demo\npage</TITLE><style>p {}</style></head>"
+        "<body><script>var x = '<p>';</script><p>Hello &amp; welcome</p></body></html>"
+    )
+
+    assert tool._extract_title(html) == "Demo\npage"
+    assert tool._extract_title("<p>" + "x" * 70_000 + "<title>Late</title>") == "Late"
+    assert tool._extract_title("<title>\u0130stanbul</title>") == "\u0130stanbul"
+    assert tool._extract_title("<p>none</p>") == "No title found"
+    assert tool._extract_text_content(html) == "Demo page Hello & welcome"
+
+
+def test_running_processes_can_be_filtered_and_capped(security_manager: SecurityManager) -> None:
+    tool = SystemResourceMonitor(security_manager)
+
+    everything = tool._run(action="get_running_processes")
+    top = tool._run(action="get_running_processes", sort_by="memory_percent", limit=3)
+    mine = tool._run(action="get_running_processes", filter_name="python")
+
+    assert everything["count"] >= 1
+    assert all("cpu_percent" not in info for info in everything["processes"])
+    assert top["count"] == min(3, everything["count"])
+    memory = [info["memory_percent"] or 0 for info in top["processes"]]
+    assert memory == sorted(memory, reverse=True)
+    assert any(info["pid"] == os.getpid() for info in mine["processes"])
+    with pytest.raises(ToolError):
+        tool._run(action="get_running_processes", sort_by="cpu_percent")
+
+
+def test_file_info_previews_the_first_characters(security_manager: SecurityManager, tmp_path: Path) -> None:
+    text_file = tmp_path / "notes.TXT"
+    text_file.write_bytes(("日本語\r\n" * 100).encode("utf-8"))
+    tool = FileSystemIntegrationTool(security_manager)
+
+    info = tool._run(action="file_info", file_path=str(text_file))
+
+    assert info["preview"] == ("日本語\n" * 50)
+
+
+@pytest.mark.skipif(os.name == "nt", reason="direct exec is the POSIX path")
+def test_terminal_runs_simple_commands_without_a_shell(monkeypatch: pytest.MonkeyPatch) -> None:
+    tool = TerminalIntegrationTool(_permissive_manager())
+    calls = []
+    real_run = subprocess.run
+
+    def recording_run(args, **kwargs):
+        calls.append(kwargs.get("shell", False))
+        return real_run(args, **kwargs)
+
+    monkeypatch.setattr(subprocess, "run", recording_run)
+
+    assert tool._run("echo hello world")["stdout"] == "hello world\n"
+    assert tool._run("echo hi | tr h j")["stdout"] == "ji\n"
+    assert tool._run("cd /")["return_code"] == 0
+    assert calls == [False, True, False, True]
+
+
+class _PageHandler(BaseHTTPRequestHandler):
+    hits = 0
+
+    def do_GET(self):  # type: ignore[override]
+        type(self).hits += 1
+        payload = b"<html><head><title>Cached</title></head><body>Hi</body></html>"
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):  # pragma: no cover - silence server logs
+        return
+
+
+def test_page_content_is_served_from_cache_on_repeat() -> None:
+    server = HTTPServer(("127.0.0.1", 0), _PageHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    tool = WebIntegrationTool(_permissive_manager())
+    try:
+        url = "http://127.0.0.1:%d/page" % server.server_address[1]
+        first = tool._run(action="get_page_content", url=url)
+        first["title"] = "mutated"
+        second = tool._run(action="get_page_content", url=url)
+    finally:
+        tool.close()
+        server.shutdown()
+        server.server_close()
+        thread.join(timeout=1)
+
+    assert second["title"] == "Cached"
+    assert second["truncated"] is False
+    assert second["text_content"] == "Cached Hi"
+    assert _PageHandler.hits == 1
+
+
+def test_page_content_download_is_capped(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(integration, "_PAGE_MAX_BYTES", 40)
+    server = HTTPServer(("127.0.0.1", 0), _PageHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    tool = WebIntegrationTool(_permissive_manager())
+    try:
+        page = tool._run(action="get_page_content", url="http://127.0.0.1:%d/big" % server.server_address[1])
+    finally:
+        tool.close()
+        server.shutdown()
+        server.server_close()
+        thread.join(timeout=1)
+
+    assert page["truncated"] is True
+    assert page["content_length"] == 40
+    assert page["declared_length"] == 62
+    assert page["text_content"] == "Cached"
+
+
+class _CookieHandler(BaseHTTPRequestHandler):
+    received = []
+
+    def do_GET(self):  # type: ignore[override]
+        type(self).received.append(self.headers.get("Cookie"))
+        self.send_response(200)
+        self.send_header("Set-Cookie", "session=abc; Path=/")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):  # pragma: no cover - silence server logs
+        return
+
+
+def test_pooled_session_does_not_carry_cookies_between_calls() -> None:
+    server = HTTPServer(("127.0.0.1", 0), _CookieHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    session = integration._pooled_session()
+    try:
+        url = "http://127.0.0.1:%d/" % server.server_address[1]
+        session.get(url)
+        session.get(url)
+    finally:
+        session.close()
+        server.shutdown()
+        server.server_close()
+        thread.join(timeout=1)
+
+    assert _CookieHandler.received == [None, None]
+    assert len(session.cookies) == 0
+
+
+def test_list_directory_reports_each_entry_once(security_manager: SecurityManager, tmp_path: Path) -> None:
+    root = tmp_path / "listing"
+    (root / "sub").mkdir(parents=True)
+    (root / "data.txt").write_text("hello", encoding="utf-8")
+    os.utime(root / "data.txt", (0, 86400.75))
+    tool = FileSystemIntegrationTool(security_manager)
+
+    listing = tool._run(action="list_directory", path=str(root))
+
+    assert [entry["name"] for entry in listing["directories"]] == ["sub"]
+    (data,) = listing["files"]
+    assert data["path"] == str(root.resolve() / "data.txt")
+    assert data["size"] == 5
+    assert data["modified"] == time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(86400))
@@ -0,0 +1,66 @@
+"""Tests for the telemetry collector."""
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT / "src") not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from agi_core.system.telemetry import TelemetryCollector
+
+
+def test_snapshot_reports_process_metrics() -> None:
+    collector = TelemetryCollector()
+
+    first = collector.snapshot()
+    second = collector.snapshot()
+
+    assert set(first) == {"cpu_percent", "memory_mb", "open_files"}
+    assert first["memory_mb"] > 0
+    assert second["open_files"] >= 0
+    assert collector._process is collector._current_process()
+
+
+def test_open_files_count_is_cached_until_refreshed(tmp_path: Path) -> None:
+    collector = TelemetryCollector(open_files_ttl=60.0)
+    baseline = collector.snapshot()["open_files"]
+
+    with open(tmp_path / "held.txt", "w", encoding="utf-8"):
+        assert collector.snapshot()["open_files"] == baseline
+        assert collector.refresh_open_files() == baseline + 1
+        assert collector.snapshot()["open_files"] == baseline + 1
+
+
+def test_zero_ttl_counts_open_files_every_snapshot(tmp_path: Path) -> None:
+    collector = TelemetryCollector(open_files_ttl=0.0)
+    baseline = collector.snapshot()["open_files"]
+
+    with open(tmp_path / "held.txt", "w", encoding="utf-8"):
+        assert collector.snapshot()["open_files"] == baseline + 1
+
+
+def test_background_sampler_feeds_cpu_percent() -> None:
+    collector = TelemetryCollector(cpu_sample_interval=0.01)
+    collector.start()
+    try:
+        deadline = time.monotonic() + 2.0
+        while collector._cpu is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert collector.snapshot()["cpu_percent"] == collector._cpu
+    finally:
+        collector.close()
+
+    assert collector._sampler is None
+    assert collector.snapshot()["cpu_percent"] >= 0.0
+
+
+def test_drain_returns_buffered_snapshots_once() -> None:
+    collector = TelemetryCollector(buffer_size=2)
+
+    snapshots = [collector.snapshot() for _ in range(3)]
+
+    assert collector.drain() == snapshots[1:]
+    assert collector.drain() == []
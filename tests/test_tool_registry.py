@@ -0,0 +1,129 @@
+"""Tests for the tool registry."""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT / "src") not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from agi_core.tools.base import BaseTool, ToolContext, ToolRegistry
+
+
+class _NamedTool(BaseTool):
+    def __init__(self, name: str) -> None:
+        super().__init__(name, f"Tool {name}")
+
+    def _run(self, **kwargs):
+        return self.name
+
+
+def test_register_many_adds_all_tools() -> None:
+    registry = ToolRegistry()
+
+    registry.register_many(_NamedTool(name) for name in ("a", "b", "c"))
+
+    assert list(registry.list_tools()) == ["a", "b", "c"]
+    assert registry.get("b").name == "b"
+
+
+def test_register_many_rejects_duplicates_atomically() -> None:
+    registry = ToolRegistry()
+    registry.register(_NamedTool("a"))
+
+    with pytest.raises(ValueError, match="a"):
+        registry.register_many([_NamedTool("b"), _NamedTool("a")])
+    with pytest.raises(ValueError, match="c"):
+        registry.register_many([_NamedTool("c"), _NamedTool("c")])
+
+    assert list(registry.list_tools()) == ["a"]
+
+
+def test_list_tools_is_a_live_read_only_view() -> None:
+    registry = ToolRegistry()
+    tools = registry.list_tools()
+
+    registry.register(_NamedTool("a"))
+
+    assert "a" in tools
+    with pytest.raises(TypeError):
+        tools["b"] = _NamedTool("b")  # type: ignore[index]
+
+
+def test_get_unknown_tool_raises_key_error() -> None:
+    registry = ToolRegistry()
+    registry.register(_NamedTool("".join(["sys", ".monitor"])))
+
+    assert registry.get("sys.monitor").name is sys.intern("sys.monitor")
+    with pytest.raises(KeyError, match="Unknown tool: missing"):
+        registry.get("missing")
+
+
+class _CountingTool(BaseTool):
+    cacheable = True
+    cache_size = 2
+
+    def __init__(self) -> None:
+        super().__init__("counter", "Count invocations")
+        self.calls = 0
+
+    def _run(self, **kwargs):
+        self.calls += 1
+        if kwargs.get("fail"):
+            raise RuntimeError("failed")
+        return f"{kwargs.get('value')}:{self.calls}"
+
+
+def test_cacheable_tool_results_are_memoized() -> None:
+    registry = ToolRegistry()
+    tool = _CountingTool()
+    registry.register(tool)
+
+    assert tool.run(value="x").output == "x:1"
+    assert tool.run(value="x").output == "x:1"
+    assert tool.run(value="y").output == "y:2"
+    assert not tool.run(value="x", fail=True).success
+    assert not tool.run(value="x", fail=True).success
+    assert tool.calls == 4
+
+    tool.run(value="z")
+    assert tool.run(value="x").output == "x:6"
+
+    registry.unregister("counter")
+    assert tool.run(value="x").output == "x:7"
+
+
+def test_cached_results_are_copies() -> None:
+    registry = ToolRegistry()
+    tool = _CountingTool()
+    registry.register(tool)
+
+    first = tool.run(value="x")
+    first.output = "mutated"
+    second = tool.run(value="x")
+    second.output = "again"
+
+    assert tool.run(value="x").output == "x:1"
+    assert tool.calls == 1
+
+
+def test_uncacheable_arguments_bypass_the_cache() -> None:
+    registry = ToolRegistry()
+    tool = _CountingTool()
+    registry.register(tool)
+
+    tool.run(value=["x"])
+    tool.run(value=["x"])
+
+    assert tool.calls == 2
+
+
+def test_tool_results_use_slots() -> None:
+    result = _NamedTool("slotted").run()
+
+    assert result.output == "slotted"
+    assert not hasattr(result, "__dict__")
+    assert not hasattr(ToolContext(working_directory="."), "__dict__")